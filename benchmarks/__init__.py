@@ -0,0 +1,6 @@
+"""
+Benchmarks
+
+Standalone scripts measuring the performance of the individual stages, e.g. `python -m benchmarks.bench_parse`.
+They are not part of the test suite.
+"""
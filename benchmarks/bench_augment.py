@@ -0,0 +1,46 @@
+"""
+Augmentation Benchmark
+
+Measures time, peak allocation and the number of newly allocated process nodes of :meth:`CcsAugmentor.augment` on a large synthetic model.
+
+Usage: python -m benchmarks.bench_augment [processes]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from ccs2bigraph.ccs import fast_grammar
+from ccs2bigraph.ccs.augmentation import CcsAugmentor
+from ccs2bigraph.traversal import walk
+
+from .models import generate_model
+
+def main() -> None:
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    raw = generate_model(processes, width=6, depth=8)
+
+    ccs = fast_grammar.parse(raw)
+    inputs = [pa.process for pa in ccs.process_assignments]
+    existing = {id(p) for process in inputs for p in walk(process)}
+
+    start = time.perf_counter()
+    results = [CcsAugmentor.augment(process) for process in inputs]
+    elapsed = time.perf_counter() - start
+
+    nodes = [p for result in results for p in walk(result)]
+    allocated = sum(1 for p in nodes if id(p) not in existing)
+
+    # The input is left unchanged, hence it can be augmented again
+    tracemalloc.start()
+    results = [CcsAugmentor.augment(process) for process in inputs]
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f" input nodes: {len(existing)}")
+    print(f"output nodes: {len(nodes)} ({allocated} newly allocated)")
+    print(f"        time: {elapsed * 1000:8.1f} ms")
+    print(f"        peak: {peak / 2**20:8.2f} MiB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Strong Bisimulation Benchmark
+
+Measures the time of minimizing a synthetic transition system, c.f. :class:`Bisimulation`.
+The transition system consists of `copies` copies of a random transition system of `states` states, whose transitions lead to random copies of their targets.
+Hence, it has at most `states` equivalence classes.
+
+Usage: python -m benchmarks.bench_bisimulation [states] [copies]
+"""
+
+import random
+import sys
+import time
+
+from ccs2bigraph.ccs.bisimulation import Bisimulation
+from ccs2bigraph.ccs.lts import Lts
+
+def _generate(states: int, copies: int, degree: int = 4, labels: int = 3) -> Lts:
+    rng = random.Random(0)
+    names = [f"a{i}" for i in range(labels)]
+    base = [
+        {(rng.choice(names), rng.randrange(states)) for _ in range(degree)}
+        for _ in range(states)
+    ]
+    return Lts(
+        list(range(states * copies)),
+        [
+            [(l, target * copies + rng.randrange(copies)) for l, target in base[state]]
+            for state in range(states)
+            for _ in range(copies)
+        ],
+    )
+
+def main() -> None:
+    states = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    copies = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    lts = _generate(states, copies)
+
+    start = time.perf_counter()
+    bisimulation = Bisimulation(lts)
+    elapsed = time.perf_counter() - start
+    print(f"refined {lts.state_count} states and {lts.transition_count} transitions into {bisimulation.block_count} blocks in {elapsed * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
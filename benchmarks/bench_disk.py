@@ -0,0 +1,42 @@
+"""
+Out-of-Core Exploration Benchmark
+
+Measures the throughput of exploring the transition system of dining philosophers in memory, c.f. :meth:`CcsExplorer.explore_compact`,
+and in a working directory, c.f. :class:`DiskExplorer`, with all and with only few recently seen states in memory,
+and checks that all explorations find the same state space.
+
+Usage: python -m benchmarks.bench_disk [philosophers]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ccs2bigraph.ccs import fast_grammar
+from ccs2bigraph.ccs.disk import DiskExplorer
+from ccs2bigraph.ccs.lts import CcsExplorer
+
+from .models import generate_philosophers
+
+MEMORY_STATES = [1 << 18, 1 << 10]
+
+def main() -> None:
+    philosophers = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    ccs = fast_grammar.parse(generate_philosophers(philosophers))
+
+    start = time.perf_counter()
+    lts = CcsExplorer(ccs).explore_compact("Table")
+    elapsed = time.perf_counter() - start
+    print(f"in memory: {lts.state_count} states in {elapsed * 1000:8.1f} ms ({lts.state_count / elapsed:8.0f} states/s)")
+
+    for memory_states in MEMORY_STATES:
+        with tempfile.TemporaryDirectory() as directory:
+            start = time.perf_counter()
+            disk = DiskExplorer(ccs, Path(directory), memory_states=memory_states).explore("Table")
+            elapsed = time.perf_counter() - start
+            assert disk is not None and (disk.state_count, disk.transition_count) == (lts.state_count, lts.transition_count), "State space on disk differs"
+            print(f"on disk, {memory_states} states in memory: {elapsed * 1000:8.1f} ms ({disk.state_count / elapsed:8.0f} states/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Subterm Extraction Benchmark
+
+Measures the output size of a large synthetic model with and without lifting repeated subterms, c.f. :class:`SubtermExtractor`, and the time of the extraction itself.
+
+Usage: python -m benchmarks.bench_extract [processes]
+"""
+
+import sys
+import time
+
+from ccs2bigraph.bigraph.extraction import SubtermExtractor
+from ccs2bigraph.ccs import fast_grammar
+from ccs2bigraph.translation import FiniteCcsTranslator
+
+from .models import generate_model
+
+MIN_SIZES = [2, 4, 8, 16]
+
+def main() -> None:
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    raw = generate_model(processes, width=6, depth=8)
+
+    translated = FiniteCcsTranslator(fast_grammar.parse(raw), "P0").translate()
+    size = sum(len(str(b)) + 1 for b in translated.bigraphs)
+    print(f"     inline: {size / 2**20:8.2f} MiB, {len(translated.bigraphs)} definitions")
+
+    for min_size in MIN_SIZES:
+        start = time.perf_counter()
+        bigraphs = SubtermExtractor(min_size).extract(translated.bigraphs)
+        elapsed = time.perf_counter() - start
+
+        extracted = sum(len(str(b)) + 1 for b in bigraphs)
+        print(f"min size {min_size:2}: {extracted / 2**20:8.2f} MiB ({extracted / size:5.1%}), {len(bigraphs)} definitions, {elapsed * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Idle Names Benchmark
+
+Measures the output size with `config.add_actions` for growing numbers of `0` processes and growing alphabets.
+Since the idle names are defined once (c.f. :attr:`FiniteCcsTranslator.IDLE_NIL_NAME`), the size grows with their sum instead of their product.
+For comparison, the size with the idle names repeated at each `0` is derived from the measured one.
+
+Usage: python -m benchmarks.bench_idle_names
+"""
+
+from ccs2bigraph import config
+from ccs2bigraph.ccs import fast_grammar
+from ccs2bigraph.translation import FiniteCcsTranslator
+
+PROCESSES = [250, 500, 1000, 2000]
+ALPHABETS = [10, 100, 1000]
+
+def generate_model(processes: int, alphabet: int) -> str:
+    """
+    Generates `processes` processes with two `0` each, using an alphabet of `alphabet` actions
+
+    :param int processes: The number of processes
+    :param int alphabet: The number of actions
+    :return str: The CCS input
+    """
+    lines = [f"set H = {{{', '.join(f'x{i}' for i in range(alphabet))}}};"]
+    for p in range(processes):
+        lines.append(f"P{p} = x{p % alphabet}.0 + 'x{(p + 1) % alphabet}.(0 | P{(p + 1) % processes});")
+    return "\n".join(lines) + "\n"
+
+def main() -> None:
+    config.add_actions = True
+    print("processes alphabet   shared [KiB]   repeated [KiB]")
+    for alphabet in ALPHABETS:
+        for processes in PROCESSES:
+            translator = FiniteCcsTranslator(fast_grammar.parse(generate_model(processes, alphabet)), "P0")
+            bigraphs = translator.translate().bigraphs
+            size = sum(len(str(b)) + 1 for b in bigraphs)
+
+            definition = str(bigraphs[0].bigraph)
+            nils = 2 * processes
+            repeated = size - len(str(bigraphs[0])) - 1 + nils * (len(definition) - len(FiniteCcsTranslator.IDLE_NIL_NAME))
+            print(f"{processes:9} {alphabet:8} {size / 1024:14.1f} {repeated / 1024:16.1f}")
+
+if __name__ == "__main__":
+    main()
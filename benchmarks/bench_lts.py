@@ -0,0 +1,37 @@
+"""
+State-Space Exploration Benchmark
+
+Measures the time of exploring the transition system of a buffer of one-place cells, c.f. :class:`CcsExplorer`,
+and the memory retained per state by the explorer and the transition system in compressed sparse row form, with tracemalloc.
+The buffer has 2^cells states.
+
+Usage: python -m benchmarks.bench_lts [cells]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from ccs2bigraph.ccs import fast_grammar
+from ccs2bigraph.ccs.lts import CcsExplorer
+
+from .models import generate_buffer
+
+def main() -> None:
+    cells = int(sys.argv[1]) if len(sys.argv) > 1 else 14
+    ccs = fast_grammar.parse(generate_buffer(cells))
+
+    start = time.perf_counter()
+    lts = CcsExplorer(ccs).explore_compact("Buff")
+    elapsed = time.perf_counter() - start
+    print(f"explored {lts.state_count} states and {lts.transition_count} transitions in {elapsed * 1000:8.1f} ms")
+
+    tracemalloc.start()
+    explorer = CcsExplorer(ccs)
+    lts = explorer.explore_compact("Buff")
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"retained {retained / 2**20:8.2f} MiB ({retained / lts.state_count:6.1f} bytes per state)")
+
+if __name__ == "__main__":
+    main()
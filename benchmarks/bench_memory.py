@@ -0,0 +1,47 @@
+"""
+AST Memory Benchmark
+
+Measures the memory retained by the parsed CCS representation and the translated bigraph representation of a large synthetic model with tracemalloc.
+
+Usage: python -m benchmarks.bench_memory [processes]
+"""
+
+import sys
+import tracemalloc
+
+from ccs2bigraph.ccs import fast_grammar
+from ccs2bigraph.ccs.representation import Action
+from ccs2bigraph.translation import FiniteCcsTranslator
+from ccs2bigraph.traversal import walk
+
+from .models import generate_model
+
+def main() -> None:
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    raw = generate_model(processes, width=6, depth=8)
+
+    tracemalloc.start()
+
+    before = tracemalloc.get_traced_memory()[0]
+    ccs = fast_grammar.parse(raw)
+    parsed = tracemalloc.get_traced_memory()[0] - before
+
+    nodes = [p for pa in ccs.process_assignments for p in walk(pa.process)]
+    actions = [getattr(p, "prefix") for p in nodes if hasattr(p, "prefix")]
+
+    before = tracemalloc.get_traced_memory()[0]
+    translated = FiniteCcsTranslator(ccs, "P0").translate()
+    bigraph = tracemalloc.get_traced_memory()[0] - before
+    bigraph_nodes = sum(1 for b in translated.bigraphs for _ in walk(b.bigraph))
+    # Bigraphs are hash-consed, hence a set of the nodes keeps exactly one instance per distinct subterm
+    distinct_bigraph_nodes = len({node for b in translated.bigraphs for node in walk(b.bigraph)})
+
+    tracemalloc.stop()
+
+    print(f"          input: {len(raw) / 2**20:8.2f} MiB")
+    print(f"            AST: {parsed / 2**20:8.2f} MiB ({parsed / len(nodes):6.1f} bytes per process node, {len(nodes)} nodes)")
+    print(f"        actions: {len(actions)} prefixes, {len({id(a) for a in actions})} distinct Action objects, {len(set[Action](actions))} distinct actions")
+    print(f"bigraph + augm.: {bigraph / 2**20:8.2f} MiB ({bigraph / bigraph_nodes:6.1f} bytes per bigraph node, {bigraph_nodes} nodes, {distinct_bigraph_nodes} distinct)")
+
+if __name__ == "__main__":
+    main()
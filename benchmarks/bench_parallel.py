@@ -0,0 +1,40 @@
+"""
+Parallel Translation Benchmark
+
+Measures the translation time of a large synthetic model with 1, 2, 4 and 8 worker processes, c.f. :meth:`FiniteCcsTranslator.translate`, and checks that all outputs are identical.
+
+Usage: python -m benchmarks.bench_parallel [processes]
+"""
+
+import os
+import sys
+import time
+
+from ccs2bigraph.ccs import fast_grammar
+from ccs2bigraph.translation import FiniteCcsTranslator
+
+from .models import generate_model
+
+WORKERS = [1, 2, 4, 8]
+
+def main() -> None:
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    raw = generate_model(processes, width=6, depth=8)
+    print(f"{processes} processes, {os.cpu_count()} CPUs")
+
+    expected = None
+    baseline = None
+    for workers in WORKERS:
+        ccs = fast_grammar.parse(raw)
+
+        start = time.perf_counter()
+        output = str(FiniteCcsTranslator(ccs, "P0").translate(workers=workers))
+        elapsed = time.perf_counter() - start
+
+        if expected is None:
+            expected, baseline = output, elapsed
+        assert output == expected, f"Output with {workers} workers differs"
+        print(f"{workers} workers: {elapsed * 1000:8.1f} ms (speedup {baseline / elapsed:4.2f})")
+
+if __name__ == "__main__":
+    main()
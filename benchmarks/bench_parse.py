@@ -0,0 +1,37 @@
+"""
+Parser Benchmark
+
+Compares the throughput of the pyparsing grammar and the hand-written fast parser on a synthetic model.
+
+Usage: python -m benchmarks.bench_parse [processes]
+"""
+
+import sys
+import time
+
+import ccs2bigraph.ccs.grammar as ccs_grammar
+
+from .models import generate_model
+
+def _measure(raw: str, engine: ccs_grammar.Engine, repetitions: int = 3) -> float:
+    """Returns the best wall clock time of `repetitions` runs"""
+    best = float("inf")
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        ccs_grammar.parse(raw, engine=engine)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main() -> None:
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    raw = generate_model(processes)
+    assert ccs_grammar.parse(raw, engine="pyparsing") == ccs_grammar.parse(raw, engine="fast")
+
+    size = len(raw) / 1024
+    results = {engine: _measure(raw, engine) for engine in ccs_grammar.ENGINES}
+    for engine, duration in results.items():
+        print(f"{engine:>10}: {duration * 1000:9.1f} ms ({size / duration:9.1f} KiB/s)")
+    print(f"   speedup: {results['pyparsing'] / results['fast']:9.1f}x")
+
+if __name__ == "__main__":
+    main()
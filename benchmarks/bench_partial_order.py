@@ -0,0 +1,35 @@
+"""
+Partial-Order Reduction Benchmark
+
+Compares the number of states and transitions and the time of exploring the full transition system, c.f. :meth:`CcsExplorer.explore_compact`,
+with the exploration reduced by partial orders, for clients of a server, a buffer of one-place cells and dining philosophers.
+
+Usage: python -m benchmarks.bench_partial_order [size]
+"""
+
+import sys
+import time
+
+from ccs2bigraph.ccs import fast_grammar
+from ccs2bigraph.ccs.lts import CcsExplorer
+
+from .models import generate_buffer, generate_clients, generate_philosophers
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    models = [
+        (f"{size} clients", generate_clients(size), "System"),
+        (f"{2 * size} cells", generate_buffer(2 * size), "Buff"),
+        (f"{size} philosophers", generate_philosophers(size), "Table"),
+    ]
+
+    for name, source, initial in models:
+        ccs = fast_grammar.parse(source)
+        for partial_order in (False, True):
+            start = time.perf_counter()
+            lts = CcsExplorer(ccs).explore_compact(initial, partial_order=partial_order)
+            elapsed = time.perf_counter() - start
+            print(f"{name}, {'reduced' if partial_order else 'full':7}: {lts.state_count:8} states {lts.transition_count:9} transitions in {elapsed * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Sharded Exploration Benchmark
+
+Measures the time of exploring the transition system of dining philosophers in a single process, c.f. :class:`CcsExplorer`,
+and with 1, 2, 4 and 8 worker processes, c.f. :class:`ShardedExplorer`, and checks that all explorations find the same state space.
+
+Usage: python -m benchmarks.bench_sharded [philosophers]
+"""
+
+import os
+import sys
+import time
+
+from ccs2bigraph.ccs import fast_grammar
+from ccs2bigraph.ccs.lts import CcsExplorer
+from ccs2bigraph.ccs.sharding import ShardedExplorer
+
+from .models import generate_philosophers
+
+WORKERS = [1, 2, 4, 8]
+
+def main() -> None:
+    philosophers = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    ccs = fast_grammar.parse(generate_philosophers(philosophers))
+    print(f"{philosophers} philosophers, {os.cpu_count()} CPUs")
+
+    start = time.perf_counter()
+    lts = CcsExplorer(ccs).explore("Table")
+    baseline = time.perf_counter() - start
+    print(f"single process: {lts.state_count} states and {lts.transition_count} transitions in {baseline * 1000:8.1f} ms")
+
+    for workers in WORKERS:
+        exploration = ShardedExplorer(ccs, workers).explore("Table", collect=False)
+        assert (exploration.state_count, exploration.transition_count) == (lts.state_count, lts.transition_count), f"State space with {workers} workers differs"
+        rates = ", ".join(f"{w.states_per_second:.0f}" for w in exploration.workers)
+        print(f"{workers} workers: {exploration.seconds * 1000:8.1f} ms (speedup {baseline / exploration.seconds:4.2f}), states per second per worker: {rates}")
+
+if __name__ == "__main__":
+    main()
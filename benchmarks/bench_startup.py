@@ -0,0 +1,64 @@
+"""
+CLI Startup Benchmark
+
+Measures the cold start of `python -m ccs2bigraph` with `python -X importtime` and fails if the import time exceeds a fixed budget.
+
+Usage: python -m benchmarks.bench_startup [budget in ms] [repetitions]
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+
+STARTUP_BUDGET_MS = 50.0
+"""Budget for the imports of `python -m ccs2bigraph --help` beyond the interpreter's own startup (i.e. `site`)"""
+
+def _import_times(stderr: str) -> dict[str, float]:
+    """
+    Extracts the cumulative import times of top level imports from `-X importtime` output
+
+    :param str stderr: The output of the interpreter
+    :return dict[str, float]: Cumulative import time in ms by module name
+    """
+    times: dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "): # Only top level imports, the nested ones are included in their cumulative time
+            times[name.strip()] = int(cumulative) / 1000
+    return times
+
+def _measure(args: list[str], cwd: str) -> tuple[float, dict[str, float]]:
+    """Runs the CLI once, returning its wall clock time and its import times in ms"""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "ccs2bigraph", *args],
+        capture_output=True, text=True, cwd=cwd
+    )
+    duration = (time.perf_counter() - start) * 1000
+    return duration, _import_times(result.stderr)
+
+def main() -> None:
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else STARTUP_BUDGET_MS
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    with tempfile.TemporaryDirectory() as cwd:
+        runs = [_measure(["--help"], cwd) for _ in range(repetitions)]
+
+    wall = min(r[0] for r in runs)
+    imports = min(sum(t for name, t in r[1].items() if name != "site") for r in runs)
+    slowest = sorted(runs[0][1].items(), key=lambda i: -i[1])[:5]
+
+    print(f"wall clock: {wall:7.1f} ms")
+    print(f"   imports: {imports:7.1f} ms (budget {budget:.1f} ms)")
+    for name, t in slowest:
+        print(f"    {t:7.1f} ms {name}")
+
+    if imports > budget:
+        print("Startup budget exceeded!")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
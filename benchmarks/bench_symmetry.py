@@ -0,0 +1,35 @@
+"""
+Symmetry Reduction Benchmark
+
+Compares the number of states and the time of exploring the full transition system of clients of a server, c.f. :meth:`CcsExplorer.explore_compact`,
+with the exploration reduced by symmetry, for 2 up to the given number of clients. The reduction approaches a factor of `clients!`.
+
+Usage: python -m benchmarks.bench_symmetry [clients]
+"""
+
+import math
+import sys
+import time
+
+from ccs2bigraph.ccs import fast_grammar
+from ccs2bigraph.ccs.lts import CcsExplorer
+
+from .models import generate_clients
+
+def main() -> None:
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    for n in range(2, clients + 1):
+        ccs = fast_grammar.parse(generate_clients(n))
+        results = []
+        for symmetry in (False, True):
+            start = time.perf_counter()
+            lts = CcsExplorer(ccs).explore_compact("System", symmetry=symmetry)
+            results.append((lts.state_count, time.perf_counter() - start))
+        (full, full_seconds), (reduced, reduced_seconds) = results
+        print(
+            f"{n} clients: {full:8} states in {full_seconds * 1000:8.1f} ms, reduced {reduced:8} states in {reduced_seconds * 1000:8.1f} ms"
+            f" (factor {full / reduced:6.1f} of at most {math.factorial(n)})"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+Bigraph Validation Benchmark
+
+Measures the time of validating the translation of a large synthetic model, c.f. :class:`BigraphValidator`.
+
+Usage: python -m benchmarks.bench_validate [processes]
+"""
+
+import sys
+import time
+
+from ccs2bigraph.bigraph.validation import BigraphValidator
+from ccs2bigraph.ccs import fast_grammar
+from ccs2bigraph.translation import FiniteCcsTranslator
+from ccs2bigraph.traversal import walk
+
+from .models import generate_model
+
+def main() -> None:
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    translated = FiniteCcsTranslator(fast_grammar.parse(generate_model(processes, width=6, depth=8)), "P0").translate()
+    nodes = sum(1 for b in translated.bigraphs for _ in walk(b.bigraph))
+
+    start = time.perf_counter()
+    valid = BigraphValidator(translated).validate()
+    elapsed = time.perf_counter() - start
+    print(f"validated {nodes} bigraph nodes in {elapsed * 1000:8.1f} ms, {'valid' if valid else 'invalid'}")
+
+if __name__ == "__main__":
+    main()
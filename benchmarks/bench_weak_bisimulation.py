@@ -0,0 +1,43 @@
+"""
+Weak Bisimulation Benchmark
+
+Measures the time of checking the weak bisimilarity of scaled buffer and register models and their specifications, c.f. :class:`WeakBisimulation`.
+The buffer of `cells` cells has 2^cells states, the register of `bits` bits has 2^bits values.
+
+Usage: python -m benchmarks.bench_weak_bisimulation [cells] [bits]
+"""
+
+import sys
+import time
+
+from ccs2bigraph.ccs import fast_grammar
+from ccs2bigraph.ccs.bisimulation import WeakBisimulation, union
+from ccs2bigraph.ccs.lts import CcsExplorer
+
+from .models import generate_buffer, generate_register
+
+def _measure(name: str, source: str, first: str, second: str) -> None:
+    explorer = CcsExplorer(fast_grammar.parse(source))
+    start = time.perf_counter()
+    left = explorer.explore(first)
+    right = explorer.explore(second)
+    lts = union(left, right)
+    explored = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bisimulation = WeakBisimulation(lts)
+    equivalent = bisimulation.equivalent(left.initial, left.state_count + right.initial)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name}: explored {lts.state_count} states and {lts.transition_count} transitions in {explored * 1000:8.1f} ms, "
+        f"checked in {elapsed * 1000:8.1f} ms, {'weakly bisimilar' if equivalent else 'not weakly bisimilar'}"
+    )
+
+def main() -> None:
+    cells = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    bits = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+    _measure(f"buffer of {cells} cells", generate_buffer(cells), "Buff", "Spec")
+    _measure(f"register of {bits} bits", generate_register(bits), "Impl", "Spec")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Output Benchmark
+
+Measures the time and the peak memory of serializing a large synthetic model, once via `str` and once streamed to a file via :meth:`BigraphRepresentation.write_to`.
+
+Usage: python -m benchmarks.bench_write [processes]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import typing as tp
+
+from ccs2bigraph.ccs import fast_grammar
+from ccs2bigraph.translation import FiniteCcsTranslator
+
+from .models import generate_model
+
+def _measure(write: tp.Callable[[], None]) -> tuple[float, int]:
+    """Measures the time of `write` and, in a separate run since tracing slows it down, its peak memory"""
+    start = time.perf_counter()
+    write()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    write()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+def main() -> None:
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    translated = FiniteCcsTranslator(fast_grammar.parse(generate_model(processes, width=6, depth=8)), "P0").translate()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "out.big")
+
+        def _write_str() -> None:
+            with open(path, "w") as f:
+                f.write(str(translated))
+
+        def _write_stream() -> None:
+            with open(path, "w", buffering=1 << 20) as f:
+                translated.write_to(f)
+
+        for name, write in [("str", _write_str), ("stream", _write_stream)]:
+            elapsed, peak = _measure(write)
+            print(f"{name:>6}: {elapsed * 1000:8.1f} ms, peak {peak / 2**20:8.2f} MiB for {os.path.getsize(path) / 2**20:.2f} MiB of output")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Synthetic CCS Models
+
+Generators for scalable CCS inputs used throughout the benchmarks.
+"""
+
+def generate_model(processes: int, width: int = 4, depth: int = 4) -> str:
+    """
+    Generates a CCS input with `processes` process assignments.
+
+    Each process is an alternative of `width` prefix chains of length `depth`, calling the next process.
+    Every tenth process additionally composes its successors in parallel and hides an action set.
+
+    :param int processes: The number of process assignments
+    :param int width: The number of alternatives per process
+    :param int depth: The number of prefixes per alternative
+    :return str: The CCS input
+    """
+    lines = [f"set H = {{{', '.join(f'a{i}' for i in range(depth))}}};"]
+    for p in range(processes):
+        successor = f"P{(p + 1) % processes}"
+        alternatives = [
+            ".".join(("'" if (a + d) % 2 else "") + f"a{d}" for d in range(depth)) + f".{successor}"
+            for a in range(width)
+        ]
+        body = "\n    + ".join(alternatives)
+        if p % 10 == 0:
+            body = f"(({body})\n    | {successor} | P{(p + 2) % processes}) \\ H"
+        lines.append(f"P{p} =\n    {body};")
+    return "\n".join(lines) + "\n"
+
+def generate_buffer(cells: int) -> str:
+    """
+    Generates a CCS input of a buffer of `cells` one-place cells in a row, generalizing `Buff3` of `basic_buffer.ccs`.
+
+    The buffer `Buff` has a finite state space of 2^`cells` states.
+    It is weakly bisimilar to `Spec`, which counts the items in the buffer.
+
+    :param int cells: The number of cells, at least 1
+    :return str: The CCS input
+    """
+    links = [f"l{i}" for i in range(1, cells)]
+    components = []
+    for c in range(cells):
+        renaming = ([f"{links[c - 1]}/a"] if c > 0 else []) + ([f"{links[c]}/b"] if c < cells - 1 else [])
+        components.append(f"Cell[{','.join(renaming)}]" if renaming else "Cell")
+    hiding = f" \\ {{{','.join(links)}}}" if links else ""
+    lines = ["Cell = a.'b.Cell;", f"Buff = ({' | '.join(components)}){hiding};", "Spec = Spec0;"]
+    for items in range(cells + 1):
+        alternatives = ([f"a.Spec{items + 1}"] if items < cells else []) + ([f"'b.Spec{items - 1}"] if items > 0 else [])
+        lines.append(f"Spec{items} = {' + '.join(alternatives)};")
+    return "\n".join(lines) + "\n"
+
+def generate_register(bits: int) -> str:
+    """
+    Generates a CCS input of a register of `bits` single-bit latches, generalizing `Impl` of `res/register.ccs`.
+
+    Writes and reads are serialized by a mutex, and the value is written and read bit by bit.
+    The register `Impl` has 2^`bits` values and is weakly bisimilar to `Spec`, which decides internally between writing and reading.
+
+    :param int bits: The number of bits, at least 1
+    :return str: The CCS input
+    """
+    values = range(2 ** bits)
+    lines: list[str] = []
+    for b in range(bits):
+        lines.append(f"Latch{b}0 = 'b{b}s0.Latch{b}0 + 'b{b}s1.Latch{b}1 + b{b}g0.Latch{b}0;")
+        lines.append(f"Latch{b}1 = 'b{b}s1.Latch{b}1 + 'b{b}s0.Latch{b}0 + b{b}g1.Latch{b}1;")
+    lines.append("Mutex = 'lock.'unlock.Mutex;")
+
+    def _bits(value: int) -> list[int]:
+        return [(value >> b) & 1 for b in reversed(range(bits))]
+
+    writes = [
+        f"'w{v}." + ".".join(f"b{b}s{bit}" for b, bit in zip(reversed(range(bits)), _bits(v))) + ".unlock.Write"
+        for v in values
+    ]
+    lines.append(f"Write = lock.({' + '.join(writes)});")
+
+    def _read(b: int, value: int) -> str:
+        if b < 0:
+            return f"r{value}.unlock.Read"
+        return "(" + " + ".join(f"'b{b}g{bit}.{_read(b - 1, value * 2 + bit)}" for bit in (0, 1)) + ")"
+
+    lines.append(f"Read = lock.{_read(bits - 1, 0)};")
+    internals = ["lock", "unlock"] + [f"b{b}{op}{bit}" for b in range(bits) for op in "sg" for bit in (0, 1)]
+    lines.append(f"set Internals = {{{', '.join(internals)}}};")
+    latches = " | ".join(f"Latch{b}0" for b in range(bits))
+    lines.append(f"Impl = ({latches} | Read | Write | Mutex) \\ Internals;")
+
+    lines.append("Spec = Reg0;")
+    lines.append("RegWrite = " + " + ".join(f"'w{v}.Reg{v}" for v in values) + ";")
+    for v in values:
+        lines.append(f"Reg{v} = tau.RegWrite + tau.r{v}.Reg{v};")
+    return "\n".join(lines) + "\n"
+
+def generate_philosophers(philosophers: int) -> str:
+    """
+    Generates a CCS input of `philosophers` dining philosophers around a table, with a fork between each two neighbours.
+
+    Each philosopher thinks, picks up the left and then the right fork, eats and puts both forks down again.
+    The `Table` is the parallel composition of all philosophers and forks, whose state space grows exponentially with the number of philosophers.
+    It deadlocks once every philosopher holds the left fork.
+
+    :param int philosophers: The number of philosophers, at least 2
+    :return str: The CCS input
+    """
+    lines: list[str] = []
+    for p in range(philosophers):
+        right = (p + 1) % philosophers
+        lines.append(f"Fork{p} = up{p}.down{p}.Fork{p};")
+        lines.append(f"Phil{p} = think{p}.'up{p}.'up{right}.eat{p}.'down{p}.'down{right}.Phil{p};")
+    components = " | ".join(f"Phil{p} | Fork{p}" for p in range(philosophers))
+    forks = ", ".join(f"up{p}, down{p}" for p in range(philosophers))
+    lines.append(f"Table = ({components}) \\ {{{forks}}};")
+    return "\n".join(lines) + "\n"
+
+def generate_clients(clients: int, steps: int = 3) -> str:
+    """
+    Generates a CCS input of `clients` clients of a server.
+
+    Each client prepares a request in `steps` local actions, sends it to the server and waits for the response, repeatedly.
+    Most interleavings of the `System` are of independent local actions, hence it suits partial-order reduction.
+
+    :param int clients: The number of clients
+    :param int steps: The number of local actions per request
+    :return str: The CCS input
+    """
+    lines = ["Server = request.'response.Server;"]
+    for c in range(clients):
+        prefixes = "".join(f"prepare{c}x{s}." for s in range(steps))
+        lines.append(f"Client{c} = {prefixes}'request.response.Client{c};")
+    components = " | ".join(f"Client{c}" for c in range(clients))
+    lines.append(f"System = (Server | {components}) \\ {{request, response}};")
+    return "\n".join(lines) + "\n"
@@ -4,70 +4,297 @@ This tool allows to transform CCS process definitions
 """
 
 import argparse
+import contextlib
+import sys
+import typing as tp
 from pathlib import Path
 import logging
 logger = logging.getLogger(__name__)
 
 import ccs2bigraph.config as config
-import ccs2bigraph.ccs.grammar as ccs_grammar
-from ccs2bigraph.translation import FiniteCcsTranslator
+
+if tp.TYPE_CHECKING:
+    from ccs2bigraph.ccs.representation import CcsRepresentation
+
+_OUTPUT_BUFFER_SIZE = 1 << 20
+_LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
+_EQUIVALENCES = {"strong": "strongly bisimilar", "weak": "weakly bisimilar", "congruence": "observationally congruent"}
+"""The equivalences of :func:`ccs2bigraph.ccs.bisimulation.compare`, with their description"""
+
+# The remaining modules are imported in `main` once the arguments are valid, so that e.g. `--help` starts quickly.
 
 def main():
-    logging.basicConfig(filename='ccs2bigraph.log', level=logging.INFO)
+    argv = sys.argv[1:]
+    if argv and argv[0] in _COMMANDS:
+        create_parser, run = _COMMANDS[argv[0]]
+        argv = argv[1:]
+    else:
+        create_parser, run = _translation_parser, _run
+    parser = create_parser()
+
+    # Parse command line arguments
+    args = parser.parse_args(argv)
+
+    # The log file is only created once a message is logged
+    logging.basicConfig(handlers=[logging.FileHandler(args.log_file, delay=True)], level=args.log_level)
     logger.info("CSS2Bigraph - Welcome")
 
-    # Define command line arguments
+    with contextlib.ExitStack() as stack:
+        if args.trace is not None:
+            import ccs2bigraph.tracing as tracing
+            tracing.enable(stack.enter_context(open(args.trace, "w")))
+            stack.callback(tracing.disable)
+        run(parser, args)
+
+    logger.info("Done. Goodbye.")
+
+def _add_common_arguments(parser: argparse.ArgumentParser) -> None:
+    """Defines the command line arguments shared by all commands"""
+    parser.add_argument("--engine", help="Parser used for the CCS input file, either 'pyparsing' or 'fast'", default="pyparsing")
+    parser.add_argument("--cache-dir", help="Directory for caching parsed CCS input files", type=Path, default=config.cache_dir)
+    parser.add_argument("--log-file", help="File for the log messages", type=Path, default=Path("ccs2bigraph.log"))
+    parser.add_argument("--log-level", help="Minimal level of the logged messages", choices=_LOG_LEVELS, default="WARNING")
+    parser.add_argument("--trace", help="File for the durations and allocations of the pipeline stages, as JSON lines", metavar="TRACE_FILE", type=Path)
+
+def _translation_parser() -> argparse.ArgumentParser:
+    """Defines the command line arguments of the translation"""
     parser = argparse.ArgumentParser(
         prog='ccs2bigraph',
-        description='Translation of CCS Expressions to bigraph counterparts'
+        description='Translation of CCS Expressions to bigraph counterparts',
+        epilog="Use 'ccs2bigraph lts --help' for the exploration of the labelled transition system of a CCS process, "
+            "and 'ccs2bigraph equiv --help' for the comparison of two CCS processes instead."
     )
 
     parser.add_argument("inputfile", help="CSS file for translation", type=Path)
     parser.add_argument("initial", help="Process used as initial state in the resulting bigraphical reactive system")
-    parser.add_argument("control-template", help="Template for the controls in the resulting bigrapher input file", type=Path)
-    parser.add_argument("bigraphs-template", help="Template for the (general) bigraphs in the resulting bigrapher input file", type=Path)
-    parser.add_argument("reactions-template", help="Template for the reactions in the resulting bigrapher input file", type=Path)
-    parser.add_argument("brs-template", help="Template for the brs definions in the resulting bigrapher input file", type=Path)
+    parser.add_argument("control_template", metavar="control-template", help="Template for the controls in the resulting bigrapher input file", type=Path)
+    parser.add_argument("bigraphs_template", metavar="bigraphs-template", help="Template for the (general) bigraphs in the resulting bigrapher input file", type=Path)
+    parser.add_argument("reactions_template", metavar="reactions-template", help="Template for the reactions in the resulting bigrapher input file", type=Path)
+    parser.add_argument("brs_template", metavar="brs-template", help="Template for the brs definions in the resulting bigrapher input file", type=Path)
+    parser.add_argument("--slice", help="Only translate the processes reachable from the initial process", action="store_true", default=config.slice_unreachable)
+    parser.add_argument("--extract-subterms", help="Lift repeated subterms of at least MIN_SIZE nodes into shared bigraph definitions", metavar="MIN_SIZE", type=int, default=config.extract_min_size)
+    parser.add_argument("--workers", help="Number of processes translating the CCS processes in parallel", type=int, default=1)
+    parser.add_argument("--output", help="File for the resulting bigrapher input, instead of stdout", type=Path)
+    _add_common_arguments(parser)
+    return parser
 
-    # Parse command line arguments
-    args = parser.parse_args()
+def _lts_parser() -> argparse.ArgumentParser:
+    """Defines the command line arguments of the exploration"""
+    parser = argparse.ArgumentParser(
+        prog='ccs2bigraph lts',
+        description='Exploration of the labelled transition system of a CCS process, without BigraphER'
+    )
+
+    parser.add_argument("inputfile", help="CSS file containing the process", type=Path)
+    parser.add_argument("initial", help="Process used as initial state")
+    parser.add_argument("--max-states", help="Abort once the transition system exceeds this number of states", type=int)
+    parser.add_argument("--output", help="File for the transition system", type=Path)
+    parser.add_argument("--format", help="Format of the output file: Aldebaran (.aut), or the binary compressed sparse row form, which can be memory-mapped", choices=["aut", "csr"], default="aut")
+    parser.add_argument("--workers", help="Number of processes exploring the transition system in parallel, each owning the states of one hash shard", type=int, default=1)
+    parser.add_argument("--work-dir", help="Directory for the states and transitions of an exploration exceeding the memory. "
+        "The exploration is checkpointed regularly and when interrupted, and resumed when run again with the same directory.", type=Path)
+    parser.add_argument("--partial-order", help="Explore only one interleaving of independent moves of parallel components. "
+        "The reduced transition system has the same deadlocks and labels, but fewer states", action="store_true")
+    parser.add_argument("--symmetry", help="Explore only one representative of states which differ by a permutation of interchangeable parallel components. "
+        "The reduced transition system is bisimilar up to exchanging the names of these components", action="store_true")
+    _add_common_arguments(parser)
+    return parser
+
+def _equiv_parser() -> argparse.ArgumentParser:
+    """Defines the command line arguments of the comparison"""
+    parser = argparse.ArgumentParser(
+        prog='ccs2bigraph equiv',
+        description='Checks whether two CCS processes are equivalent, without BigraphER. '
+            'Exits with 0 if they are, and with 1 and a distinguishing play of the bisimulation game otherwise.'
+    )
+
+    parser.add_argument("inputfile", help="CSS file containing the processes", type=Path)
+    parser.add_argument("first", help="First process")
+    parser.add_argument("second", help="Second process")
+    parser.add_argument("--max-states", help="Abort once the transition system of a process exceeds this number of states", type=int)
+    parser.add_argument("--equivalence", help="Checked equivalence, in which internal (tau) transitions are invisible unless it is 'strong'", choices=list(_EQUIVALENCES), default="strong")
+    _add_common_arguments(parser)
+    return parser
+
+def _read_ccs(parser: argparse.ArgumentParser, args: argparse.Namespace) -> "CcsRepresentation":
+    """Parses the input file, or reads it from the cache"""
+    import ccs2bigraph.ccs.grammar as ccs_grammar
+    from ccs2bigraph.ccs.representation import CcsRepresentation
+    from ccs2bigraph.ccs.cache import AstCache
+    from ccs2bigraph import tracing
+
+    if args.engine not in ccs_grammar.ENGINES:
+        parser.error(f"argument --engine: invalid choice: {args.engine!r} (choose from {', '.join(ccs_grammar.ENGINES)})")
 
-    # Evaluate command line arguments
-    logger.info(f"Using {args.inputfile} as ccs input file")
+    logger.info("Using %s as ccs input file", args.inputfile)
     input_file_name = Path(args.inputfile)
 
-    logger.info(f"Using {args.initial} as init process")
+    cache = None
+    cache_key = None
+    ccs = None
+    if args.cache_dir is not None:
+        logger.info("Using %s as cache directory", args.cache_dir)
+        cache = AstCache(args.cache_dir, config.cache_max_entries)
+        with tracing.span("read_cache") as attributes:
+            with open(input_file_name, "rb") as input_file:
+                cache_key = cache.key(input_file, args.engine)
+            ccs = cache.get(cache_key)
+            attributes["hit"] = ccs is not None
+
+    if ccs is None:
+        logger.info("Opening input file")
+        with open(input_file_name) as input_file, tracing.span("parse", engine=args.engine) as attributes:
+            logger.info("Parsing input file statement by statement to CCS representation")
+            logger.info("Using the %s parser", args.engine)
+            ccs = CcsRepresentation([], [])
+            for statement in ccs_grammar.parse_iter(input_file, engine=args.engine):
+                ccs.add(statement)
+            attributes["statements"] = len(ccs.process_assignments) + len(ccs.action_set_assignments)
+
+        if cache is not None and cache_key is not None:
+            with tracing.span("write_cache"):
+                cache.put(cache_key, ccs)
+
+    return ccs
+
+def _run(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Runs the translation with the parsed command line arguments"""
+    from ccs2bigraph.translation import FiniteCcsTranslator
+    from ccs2bigraph import tracing
+
+    logger.info("Using %s as init process", args.initial)
     init_process = args.initial
 
-    logger.info(f"Using {args.control_template} as template for the control definitions")
+    logger.info("Using %s as template for the control definitions", args.control_template)
     config.control_template = args.control_template
 
-    logger.info(f"Using {args.bigraphs_template} as template for the (general) bigraph definitions")
+    logger.info("Using %s as template for the (general) bigraph definitions", args.bigraphs_template)
     config.bigraphs_template = args.bigraphs_template
 
-    logger.info(f"Using {args.reactions_template} as template for the reaction definitions")
+    logger.info("Using %s as template for the reaction definitions", args.reactions_template)
     config.reactions_template = args.reactions_template
 
-    logger.info(f"Using {args.brs_template} as template for the brs definitions")
+    logger.info("Using %s as template for the brs definitions", args.brs_template)
     config.brs_template = args.brs_template
 
-    logger.info("Opening input file")
-    with open(input_file_name) as input_file:
-        logger.info("Reading input file")
-        ccs_input = input_file.read()
+    config.cache_dir = args.cache_dir
 
-        logger.info("Parsing input file to CCS representation")
-        ccs = ccs_grammar.parse(ccs_input)
+    if args.workers < 1:
+        parser.error("argument --workers: must be at least 1")
 
-        logger.info("Translating to Bigraph representation")
-        translator = FiniteCcsTranslator(ccs, init_process)
-        
-        bigraph = translator.translate()
+    if args.extract_subterms is not None:
+        if args.extract_subterms < 2:
+            parser.error("argument --extract-subterms: MIN_SIZE must be at least 2")
+        logger.info("Lifting repeated subterms of at least %d nodes", args.extract_subterms)
+    config.extract_min_size = args.extract_subterms
 
-        logger.info("Printing Bigraph to stdout")
-        print(bigraph)
+    if args.slice:
+        logger.info("Slicing processes unreachable from the init process")
+    config.slice_unreachable = args.slice
 
-    logger.info("Done. Goodbye.")
+    ccs = _read_ccs(parser, args)
+
+    logger.info("Translating to Bigraph representation")
+    translator = FiniteCcsTranslator(ccs, init_process)
+    
+    if args.workers > 1:
+        logger.info("Translating with %d worker processes", args.workers)
+    bigraph = translator.translate(workers=args.workers)
+
+    with tracing.span("serialize", assignments=len(bigraph.bigraphs)):
+        if args.output is None:
+            logger.info("Writing Bigraph to stdout")
+            bigraph.write_to(sys.stdout)
+        else:
+            logger.info("Writing Bigraph to %s", args.output)
+            with open(args.output, "w", buffering=_OUTPUT_BUFFER_SIZE) as output_file:
+                bigraph.write_to(output_file)
+
+def _run_lts(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Runs the exploration with the parsed command line arguments"""
+    from ccs2bigraph.ccs.disk import DiskExplorer
+    from ccs2bigraph.ccs.lts import CcsExplorer, CompactLts
+    from ccs2bigraph.ccs.sharding import ShardedExplorer, WorkerStatistics
+    from ccs2bigraph import tracing
+
+    if args.max_states is not None and args.max_states < 1:
+        parser.error("argument --max-states: must be at least 1")
+    if args.workers < 1:
+        parser.error("argument --workers: must be at least 1")
+    if args.work_dir is not None and args.workers > 1:
+        parser.error("argument --work-dir: not allowed with --workers")
+    if args.partial_order and (args.workers > 1 or args.work_dir is not None):
+        parser.error("argument --partial-order: not allowed with --workers or --work-dir")
+    if args.symmetry and (args.workers > 1 or args.work_dir is not None or args.partial_order):
+        parser.error("argument --symmetry: not allowed with --workers, --work-dir or --partial-order")
+
+    ccs = _read_ccs(parser, args)
+
+    logger.info("Exploring the transition system of %s", args.initial)
+    workers: list[WorkerStatistics] = []
+    try:
+        if args.workers > 1:
+            logger.info("Exploring with %d worker processes", args.workers)
+            exploration = ShardedExplorer(ccs, args.workers).explore(args.initial, args.max_states, collect=args.output is not None)
+            lts, workers = exploration.lts, exploration.workers
+            states, transitions = exploration.state_count, exploration.transition_count
+        elif args.work_dir is not None:
+            logger.info("Exploring in the working directory %s", args.work_dir)
+            lts = DiskExplorer(ccs, args.work_dir).explore(args.initial, args.max_states)
+            assert lts is not None, "Only paused explorations are incomplete"
+            states, transitions = lts.state_count, lts.transition_count
+        else:
+            lts = CcsExplorer(ccs).explore_compact(args.initial, args.max_states, args.partial_order, args.symmetry)
+            states, transitions = lts.state_count, lts.transition_count
+    except ValueError as e:
+        parser.exit(1, f"{parser.prog}: error: {e}\n")
+    except KeyboardInterrupt:
+        if args.work_dir is None:
+            raise
+        parser.exit(130, f"{parser.prog}: interrupted, run again to resume from the checkpoint in {args.work_dir}\n")
+
+    print(f"{states} states, {transitions} transitions")
+    for i, worker in enumerate(workers):
+        print(f"worker {i}: {worker.states} states, {worker.transitions} transitions, {worker.states_per_second:.0f} states/s")
+    if lts is not None and args.output is not None:
+        with tracing.span("serialize", states=lts.state_count, format=args.format):
+            logger.info("Writing the transition system to %s", args.output)
+            if args.format == "csr":
+                with open(args.output, "wb") as binary_file:
+                    (lts if isinstance(lts, CompactLts) else lts.compact()).save(binary_file)
+            else:
+                with open(args.output, "w", buffering=_OUTPUT_BUFFER_SIZE) as output_file:
+                    lts.write_aut(output_file)
+
+def _run_equiv(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Runs the comparison with the parsed command line arguments"""
+    from ccs2bigraph.ccs.bisimulation import compare
+    from ccs2bigraph.ccs.lts import CcsExplorer
+
+    if args.max_states is not None and args.max_states < 1:
+        parser.error("argument --max-states: must be at least 1")
+
+    ccs = _read_ccs(parser, args)
+
+    logger.info("Comparing %s and %s by %s equivalence", args.first, args.second, args.equivalence)
+    try:
+        distinction = compare(CcsExplorer(ccs), args.first, args.second, args.max_states, args.equivalence)
+    except ValueError as e:
+        parser.exit(2, f"{parser.prog}: error: {e}\n")
+
+    description = _EQUIVALENCES[args.equivalence]
+    if distinction is None:
+        print(f"{args.first} and {args.second} are {description}")
+        return
+    print(f"{args.first} and {args.second} are not {description}:")
+    print(distinction.describe(args.first, args.second))
+    sys.exit(1)
+
+_COMMANDS: dict[str, tuple[tp.Callable[[], argparse.ArgumentParser], tp.Callable[[argparse.ArgumentParser, argparse.Namespace], None]]] = {
+    "lts": (_lts_parser, _run_lts),
+    "equiv": (_equiv_parser, _run_equiv),
+}
+"""The commands besides the translation, by their name"""
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,175 @@
+"""
+Extraction of Common Subterms
+
+Translated processes often contain identical subterms, for example the same alternatives in several processes.
+:class:`SubtermExtractor` numbers all distinct (hash-consed) subterms of a list of :class:`BigraphAssignment` and lifts repeated subterms into shared definitions, which are referred to by :class:`BigraphByName`.
+"""
+
+import logging
+logger = logging.getLogger(__name__)
+
+import typing as tp
+from collections import Counter
+
+from .representation import *
+from ..traversal import transform, walk
+
+class SubtermExtractor(object):
+    """
+    Lifts repeated subterms of at least `min_size` nodes into their own bigraph assignments
+
+    Each shared assignment immediately precedes the first assignment referring to it.
+    Hence, if each of the given assignments only refers to previously defined ones, so does each assignment of the result.
+
+    :param int min_size: The minimal number of nodes of a lifted subterm, at least 2
+    :param str prefix: The prefix of the names of the shared assignments
+
+    Example:
+    >>> alt = NestingBigraph(ControlBigraph(ControlByName("Alt"), []), ControlBigraph(ControlByName("Nil"), []))
+    >>> result = SubtermExtractor(2).extract([
+    ...     BigraphAssignment("a", MergedBigraphs([alt, IdBigraph()])),
+    ...     BigraphAssignment("b", MergedBigraphs([OneBigraph(), alt])),
+    ... ])
+    >>> print("\\n".join(map(str, result)))
+    big shared_0 = (Alt.Nil);
+    big a = (shared_0 | id);
+    big b = (1 | shared_0);
+    """
+
+    def __init__(self, min_size: int, prefix: str = "shared") -> None:
+        if min_size < 2:
+            raise ValueError("Only subterms of at least two nodes may be lifted")
+        self._min_size = min_size
+        self._prefix = prefix
+        self._clear()
+
+    def _clear(self) -> None:
+        # Each distinct subterm gets a number, in post-order of its first occurrence
+        # Bigraphs are hash-consed, hence structurally equal subterms are the same key
+        self._numbers: dict[Bigraph, int] = {}
+        self._sizes: list[int] = []
+        self._children: list[list[int]] = []
+        self._representatives: list[Bigraph] = []
+        # The number of occurrences of each subterm
+        self._counts: Counter[int] = Counter()
+
+    def _number(self, bigraph: Bigraph, children: list[int]) -> int:
+        """Numbers a subterm, given the numbers of its children"""
+        number = self._numbers.get(bigraph)
+        if number is None:
+            number = self._numbers[bigraph] = len(self._sizes)
+            self._sizes.append(1 + sum(self._sizes[c] for c in children))
+            self._children.append(children)
+            self._representatives.append(bigraph)
+        self._counts[number] += 1
+        return number
+
+    def _occurrences(self, number: int) -> Counter[int]:
+        """Counts the occurrences of all proper subterms of a subterm"""
+        occurrences: Counter[int] = Counter()
+        stack = list(self._children[number])
+        while stack:
+            child = stack.pop()
+            occurrences[child] += 1
+            stack.extend(self._children[child])
+        return occurrences
+
+    def _select(self, counts: Counter[int]) -> list[int]:
+        """
+        Selects the subterms to lift, larger ones first
+
+        Lifting a subterm which occurs n times removes n - 1 copies of each of its own subterms, which may then no longer repeat.
+
+        :param Counter[int] counts: The occurrences of all subterms, updated in place
+        :return list[int]: The selected subterms, ordered such that subterms precede the terms containing them
+        """
+        candidates = [n for n, count in counts.items() if count > 1 and self._sizes[n] >= self._min_size]
+        candidates.sort(key=lambda n: -self._sizes[n])
+
+        selected: list[int] = []
+        for number in candidates:
+            if counts[number] < 2:
+                continue
+            selected.append(number)
+            for sub, occurrences in self._occurrences(number).items():
+                counts[sub] -= (counts[number] - 1) * occurrences
+
+        # Subterms are numbered before the terms containing them
+        return sorted(selected)
+
+    def _rebuild(self, bigraph: Bigraph, children: list[Bigraph]) -> Bigraph:
+        """Rebuilds a subterm with new children"""
+        match bigraph:
+            case NestingBigraph(): return NestingBigraph(tp.cast(ControlBigraph | IdBigraph, children[0]), children[1])
+            case MergedBigraphs(): return MergedBigraphs(children)
+            case ParallelBigraphs(): return ParallelBigraphs(children)
+            case ClosedBigraph(link=link): return ClosedBigraph(link, children[0])
+            case RenamingBigraph(renaming=renaming): return RenamingBigraph(renaming, children[0])
+            case _: raise ValueError(f"{bigraph} may not have children.")
+
+    def _bodies(self, names: dict[int, str]) -> list[Bigraph]:
+        """
+        Computes each distinct subterm with all lifted proper subterms replaced by references
+
+        Since subterms are numbered after their children, every distinct subterm is rebuilt at most once, and only if it contains a lifted subterm.
+
+        :param dict[int, str] names: The names of the lifted subterms
+        :return list[Bigraph]: The rewritten subterm of each number
+        """
+        bodies = list(self._representatives)
+        changed = [False] * len(bodies)
+        for number, children in enumerate(self._children):
+            if not any(c in names or changed[c] for c in children):
+                continue
+            changed[number] = True
+            bodies[number] = self._rebuild(bodies[number], [
+                BigraphByName(names[c]) if c in names else bodies[c]
+                for c in children
+            ])
+        return bodies
+
+    def extract(self, assignments: list[BigraphAssignment]) -> list[BigraphAssignment]:
+        """
+        Lifts the repeated subterms of `assignments`
+
+        The assigned bigraphs themselves are never replaced, only their proper subterms.
+
+        :param list[BigraphAssignment] assignments: The assignments, which are not modified
+        :return list[BigraphAssignment]: The rewritten `assignments`, each preceded by the shared assignments it refers to first
+        """
+        self._clear()
+        roots = [transform(assignment.bigraph, self._number) for assignment in assignments]
+        # Only proper subterms may be replaced
+        counts = self._counts
+        counts.subtract(roots)
+
+        selected = self._select(counts)
+
+        used = {assignment.name for assignment in assignments}
+        names: dict[int, str] = {}
+        index = 0
+        for number in selected:
+            while f"{self._prefix}_{index}" in used:
+                index += 1
+            names[number] = f"{self._prefix}_{index}"
+            index += 1
+
+        logger.info("Lifting %d of %d distinct subterms", len(selected), len(self._sizes))
+
+        bodies = self._bodies(names)
+        # The shared assignments which are not defined yet
+        pending = {names[n]: bodies[n] for n in selected}
+        result: list[BigraphAssignment] = []
+
+        def _define(bigraph: Bigraph) -> None:
+            """Defines the pending shared assignments referred to by a bigraph, before it and in order of their first reference"""
+            for subterm in walk(bigraph):
+                if isinstance(subterm, BigraphByName) and subterm.name in pending:
+                    body = pending.pop(subterm.name)
+                    _define(body)
+                    result.append(BigraphAssignment(subterm.name, body))
+
+        for assignment, root in zip(assignments, roots):
+            _define(bodies[root])
+            result.append(BigraphAssignment(assignment.name, bodies[root]))
+        return result
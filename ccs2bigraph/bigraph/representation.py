@@ -19,10 +19,14 @@ logger = logging.getLogger(__name__)
 
 from abc import ABC
 from dataclasses import dataclass
+from typing import Any, Sequence, TextIO
 
+from ..interning import HashConsing, Interned
+
+from io import StringIO
 from textwrap import dedent, indent
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Control(object):
     """
     Representation of the control of Bigraph nodes
@@ -34,7 +38,7 @@ class Control(object):
     name: str
     arity: int
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AtomicControl(Control):
     """
     Representation of an atomic control of Bigraph nodes
@@ -43,11 +47,13 @@ class AtomicControl(Control):
     :param int arity: The number of ports of the control
     """
     
-@dataclass(frozen=True)
-class ControlByName(object):
+@dataclass(frozen=True, slots=True, init=False)
+class ControlByName(Interned):
     """
     Refers to an `Control` by its name.
 
+    References are interned, i.e. there is only one instance per name.
+
     :param str name: Name of the referenced `Control`
     
     Example:
@@ -60,7 +66,7 @@ class ControlByName(object):
     def __str__(self) -> str:
         return self.name
     
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ControlDefinition(object):
     """
     Refers to a definition of a control
@@ -83,11 +89,13 @@ class ControlDefinition(object):
             return f"ctrl {self.control.name} = {self.control.arity};"
 
     
-@dataclass(frozen=True)
-class Link(object):
+@dataclass(frozen=True, slots=True, init=False)
+class Link(Interned):
     """
     Representation of a single link in the bigraph
 
+    Links are interned, i.e. there is only one instance per name.
+
     :param str name: The name of the link
 
     Example:
@@ -100,28 +108,56 @@ class Link(object):
     def __str__(self) -> str:
         return f"{self.name}"
     
-@dataclass(frozen=True)
-class Renaming(object):
+@dataclass(frozen=True, slots=True, eq=False, weakref_slot=True)
+class Renaming(object, metaclass=HashConsing):
     """
     Representation of a single link renaming to form new Bigraphs
 
     This is used in :class:`RenamingBigraph` to capsule the renaming of links.
     It can also express merging of links (i.e. when two names are combined to a new outer name)
 
+    Renamings are hash-consed like :class:`Bigraph`, a list of old link names is stored as a tuple.
+
     :param Link new: New Link name
-    :param list[Link] olds: Old link names
+    :param Sequence[Link] olds: Old link names
     """
 
     new: Link
-    olds: list[Link]
+    olds: Sequence[Link]
 
-class Bigraph(ABC):
+    def __reduce__(self) -> tuple[type, tuple[Link, Sequence[Link]]]:
+        return (type(self), (self.new, self.olds))
+
+class Bigraph(ABC, metaclass=HashConsing):
     """
     Abstract Base Class for Bigraph definitions
+
+    Bigraphs are immutable and hash-consed (c.f. :class:`HashConsing`), i.e. structurally equal bigraphs are the same instance.
+    Hence, they are compared and hashed by identity in constant time, and can be used as keys for memoization and deduplication.
+    Lists of subbigraphs or links are stored as tuples.
+
+    Example:
+    >>> MergedBigraphs([OneBigraph(), ControlBigraph(ControlByName("A"), [Link("a")])]) is MergedBigraphs([OneBigraph(), ControlBigraph(ControlByName("A"), [Link("a")])])
+    True
+    >>> len({OneBigraph(), OneBigraph(), IdBigraph()})
+    2
     """
-    pass
 
-@dataclass(frozen=True)
+    __slots__ = ("__weakref__",)
+
+    def children(self) -> Sequence["Bigraph"]:
+        """
+        The direct subbigraphs, c.f. :mod:`ccs2bigraph.traversal`
+
+        :return Sequence[Bigraph]: The subbigraphs from left to right
+        """
+        return ()
+
+    def __reduce__(self) -> tuple[type, tuple[Any, ...]]:
+        # Pickle via the constructor, which is considerably cheaper to unpickle than the generic state of frozen, slotted dataclasses
+        return (type(self), tuple(map(self.__getattribute__, self.__match_args__))) # pyright: ignore[reportAttributeAccessIssue]
+
+@dataclass(frozen=True, slots=True, eq=False)
 class OneBigraph(Bigraph):
     """
     The Place(graph) 1
@@ -133,7 +169,7 @@ class OneBigraph(Bigraph):
     def __str__(self) -> str:
         return "1"
     
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class IdBigraph(Bigraph):
     """
     The Place(graph) id
@@ -145,7 +181,7 @@ class IdBigraph(Bigraph):
     def __str__(self) -> str:
         return "id"
     
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class IdleNameBigraph(Bigraph):
     """
     A bigraph representing an idle (i.e. unconnected) outer name
@@ -160,20 +196,20 @@ class IdleNameBigraph(Bigraph):
         return f"{{{self.name}}}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class ControlBigraph(Bigraph):
     """
     A Bigraph consisting of a single node of a certain control
 
     :param Control control: The control of the node
-    :param list[str] links: The links associated to the individual ports
+    :param Sequence[Link] links: The links associated to the individual ports
 
     Example:
     >>> str(ControlBigraph("A", [Link('a'), Link('b'), Link('c')]))
     'A{a,b,c}'
     """
     control: ControlByName
-    links: list[Link]
+    links: Sequence[Link]
 
     def __str__(self) -> str:
         l = ""
@@ -182,7 +218,7 @@ class ControlBigraph(Bigraph):
         return f"{self.control}{l}"
 
     
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class ClosedBigraph(Bigraph):
     """
     A Bigraph resulting from the closing of a link (/x B)
@@ -196,8 +232,11 @@ class ClosedBigraph(Bigraph):
 
     def __str__(self) -> str:
         return f"(/{self.link} {self.bigraph})"
+
+    def children(self) -> Sequence[Bigraph]:
+        return (self.bigraph,)
     
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class NestingBigraph(Bigraph):
     """
     A Bigraph resulting from the nesting operation
@@ -215,8 +254,11 @@ class NestingBigraph(Bigraph):
 
     def __str__(self) -> str:
         return f"({self.control}.{self.inner})"
+
+    def children(self) -> Sequence[Bigraph]:
+        return (self.control, self.inner)
     
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class RenamingBigraph(Bigraph):
     """
     A Bigraph resulting from a renaming operation
@@ -238,32 +280,41 @@ class RenamingBigraph(Bigraph):
     def __str__(self) -> str:
         return f"({self.renaming.new}/{{{",".join(map(str, self.renaming.olds))}}} {self.inner})"
 
+    def children(self) -> Sequence[Bigraph]:
+        return (self.inner,)
+
     
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class MergedBigraphs(Bigraph):
     """
     A Bigraph resulting from the application of the merging operator (A | B)
 
-    :param list[Bigraph] merging: The merged Bigraphs
+    :param Sequence[Bigraph] merging: The merged Bigraphs
     """
-    merging: list[Bigraph]
+    merging: Sequence[Bigraph]
 
     def __str__(self) -> str:
         return "(" + " | ".join(map(str, self.merging)) + ")"
+
+    def children(self) -> Sequence[Bigraph]:
+        return self.merging
     
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class ParallelBigraphs(Bigraph):
     """
     A Bigraph resulting from the application of the parallel product operator (A || B)
 
-    :param list[Bigraph] parallel: The parallel Bigraphs
+    :param Sequence[Bigraph] parallel: The parallel Bigraphs
     """
-    parallel: list[Bigraph]
+    parallel: Sequence[Bigraph]
 
     def __str__(self) -> str:
         return "(" + " || ".join(map(str, self.parallel)) + ")"
 
-@dataclass(frozen=True)
+    def children(self) -> Sequence[Bigraph]:
+        return self.parallel
+
+@dataclass(frozen=True, slots=True)
 class BigraphAssignment(object):
     """
     Assignment of a :class:`Bigraph` to a name.
@@ -278,7 +329,20 @@ class BigraphAssignment(object):
     def __str__(self) -> str:
         return f"big {self.name} = {self.bigraph};"
 
-@dataclass(frozen=True)
+    def __reduce__(self) -> tuple[type, tuple[str, Bigraph]]:
+        return (type(self), (self.name, self.bigraph))
+
+    def write_to(self, fp: TextIO) -> None:
+        """
+        Writes the textual representation to a file, c.f. :func:`write_bigraph`
+
+        :param TextIO fp: The file to write to
+        """
+        fp.write(f"big {self.name} = ")
+        write_bigraph(fp, self.bigraph)
+        fp.write(";")
+
+@dataclass(frozen=True, slots=True, eq=False)
 class BigraphByName(Bigraph):
     """
     Refers to an :class:`BigraphAssignment` by its name.
@@ -294,7 +358,7 @@ class BigraphByName(Bigraph):
     def __str__(self):
         return self.name
     
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BigraphReaction(object):
     """
     Defines the reaction rules
@@ -307,7 +371,7 @@ class BigraphReaction(object):
     def __str__(self):
         return f"react {self.name} =\n" + indent(self.rule, '    ')
     
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BigraphRepresentation(object):
     """
     Refers to a complete representation of a Bigraphical System.
@@ -324,15 +388,105 @@ class BigraphRepresentation(object):
     init_bigraph: BigraphByName = BigraphByName("start")
 
     def __str__(self):
-        controls_str = "\n".join(map(str, self.controls)) + "\n"
-        bigraphs_str = "\n".join(map(str, self.bigraphs)) + "\n"
-        reactions_str = "\n".join(map(str, self.reactions)) + "\n"
+        buffer = StringIO()
+        self.write_to(buffer)
+        return buffer.getvalue()
+
+    def write_to(self, fp: TextIO) -> None:
+        """
+        Writes the textual representation, i.e. the controls, the bigraph assignments, the reactions and the `begin brs` block, to a file without building it in memory
+
+        :param TextIO fp: The file to write to
+
+        Example:
+        >>> import sys
+        >>> BigraphRepresentation([ControlDefinition(AtomicControl("A", 1))], [BigraphAssignment("a", ControlBigraph(ControlByName("A"), [Link("x")]))], []).write_to(sys.stdout)
+        atomic ctrl A = 1;
+        <BLANKLINE>
+        big a = A{x};
+        <BLANKLINE>
+        <BLANKLINE>
+        <BLANKLINE>
+        begin brs
+            init start;
+            rules = [{}];
+        end
+        """
+        fp.write("\n".join(map(str, self.controls)) + "\n\n")
+        for i, bigraph in enumerate(self.bigraphs):
+            if i:
+                fp.write("\n")
+            bigraph.write_to(fp)
+        fp.write("\n\n")
+        fp.write("\n".join(map(str, self.reactions)) + "\n\n")
+
         reactions_names_str = ", ".join([r.name for r in self.reactions])
-        brs_str = dedent(f"""\
+        fp.write(dedent(f"""\
             begin brs
                 init {self.init_bigraph};
                 rules = [{{{reactions_names_str}}}];
             end
-        """)
+        """))
+
+_WRITE_BATCH = 1 << 12
+"""The number of fragments joined before each write"""
+
+def write_bigraph(fp: TextIO, bigraph: Bigraph) -> None:
+    """
+    Writes the textual representation of a bigraph to a file, with an explicit stack instead of recursion
+
+    In contrast to `str(bigraph)`, no intermediate strings of subbigraphs are built and the depth of `bigraph` is only limited by memory.
+    The fragments of the text are joined in batches, to avoid both a write per fragment and building the whole text.
+
+    :param TextIO fp: The file to write to
+    :param Bigraph bigraph: The bigraph
+
+    Example:
+    >>> import sys
+    >>> write_bigraph(sys.stdout, NestingBigraph(ControlBigraph(ControlByName("A"), [Link("a")]), MergedBigraphs([OneBigraph(), ClosedBigraph(Link("a"), IdBigraph())])))
+    (A{a}.(1 | (/a id)))
+    """
+    batch: list[str] = []
+    append = batch.append
+    # Pending fragments and bigraphs, in reverse order
+    stack: list[str | Bigraph] = [bigraph]
+    pop = stack.pop
+    push = stack.append
+
+    while stack:
+        current = pop()
+        cls = type(current)
+        if cls is str:
+            append(current) # pyright: ignore[reportArgumentType]
+        elif cls is NestingBigraph:
+            # The outer node is always a leaf
+            append(f"({current.control}.") # pyright: ignore[reportAttributeAccessIssue]
+            push(")")
+            push(current.inner) # pyright: ignore[reportAttributeAccessIssue]
+        elif cls is MergedBigraphs or cls is ParallelBigraphs:
+            children = current.children() # pyright: ignore[reportAttributeAccessIssue]
+            separator = " | " if cls is MergedBigraphs else " || "
+            append("(")
+            push(")")
+            for i in range(len(children) - 1, 0, -1):
+                push(children[i])
+                push(separator)
+            if children:
+                push(children[0])
+        elif cls is ClosedBigraph:
+            append(f"(/{current.link} ") # pyright: ignore[reportAttributeAccessIssue]
+            push(")")
+            push(current.bigraph) # pyright: ignore[reportAttributeAccessIssue]
+        elif cls is RenamingBigraph:
+            renaming = current.renaming # pyright: ignore[reportAttributeAccessIssue]
+            append(f"({renaming.new}/{{{",".join(map(str, renaming.olds))}}} ")
+            push(")")
+            push(current.inner) # pyright: ignore[reportAttributeAccessIssue]
+        else:
+            append(str(current))
+
+        if len(batch) >= _WRITE_BATCH:
+            fp.write("".join(batch))
+            batch.clear()
 
-        return "\n".join([controls_str, bigraphs_str, reactions_str, brs_str])
\ No newline at end of file
+    fp.write("".join(batch))
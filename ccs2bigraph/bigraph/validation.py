@@ -1,14 +1,44 @@
 """
 Validation of bigraphs in the provided representation
 
-
+All bigraph assignments are checked in a single traversal against an index of the defined controls.
+Since bigraphs are hash-consed, subterms which occur several times are only checked once, unless they contain violations.
 """
 
+import typing as tp
 from dataclasses import dataclass
 import logging
 logger = logging.getLogger(__name__)
 
 from .representation import *
+from .. import tracing
+
+_BIGRAPH_TYPES = frozenset({
+    OneBigraph, IdBigraph, IdleNameBigraph, ControlBigraph, BigraphByName,
+    ClosedBigraph, NestingBigraph, RenamingBigraph, MergedBigraphs, ParallelBigraphs,
+})
+"""The concrete bigraph classes"""
+
+@dataclass(frozen=True, slots=True)
+class BigraphViolation(object):
+    """
+    A violation found by :class:`BigraphValidator`
+
+    :param str assignment: The name of the bigraph assignment containing the violation
+    :param tuple[int, ...] path: The position of the violating subbigraph, as indices of `children()` starting at the assigned bigraph
+    :param str message: The description of the violation
+
+    Example:
+    >>> str(BigraphViolation("a", (1, 0), "Control A is undefined"))
+    'a[1][0]: Control A is undefined'
+    """
+
+    assignment: str
+    path: tuple[int, ...]
+    message: str
+
+    def __str__(self) -> str:
+        return self.assignment + "".join(f"[{i}]" for i in self.path) + f": {self.message}"
 
 @dataclass(frozen=True)
 class BigraphValidator:
@@ -33,64 +63,128 @@ class BigraphValidator:
     content: BigraphRepresentation
 
     def validate(self) -> bool:
-        logger.info(f"Validating {self.content}.")
-        res = all([
-            self._validate_existing_controls(),
-            self._validate_connected_ports(),
-        ])
-        if res: logger.info(f"Validation of {self.content} successful")
-        else: logger.warning(f"Validation of {self.content} failed!")
-        return res
-    
-    def _validate_existing_controls(self) -> bool:
-        def _validate_existing_controls_helper(current: Bigraph, controls: list[Control]) -> bool:
-            match current:
-                case OneBigraph():
-                    return True
-                case IdBigraph():
-                    return True
-                case ControlBigraph(control=control, links=_):
-                    if control.name in [c.name for c in controls]: return True
-                    else: return False
-                case ClosedBigraph(link=_, bigraph=bigraph):
-                    return _validate_existing_controls_helper(bigraph, controls)
-                case NestingBigraph(control=control, inner=inner):
-                    if isinstance(control, ControlBigraph) and not _validate_existing_controls_helper(control, controls): return False
-                    else: return _validate_existing_controls_helper(inner, controls)
-                case MergedBigraphs(merging=merging):
-                    return all([_validate_existing_controls_helper(m, controls) for m in merging])
-                case ParallelBigraphs(parallel=parallel):
-                    return all([_validate_existing_controls_helper(p, controls) for p in parallel])
-                case _:
-                    raise ValueError(f"{current} is not a Bigraph.")
-            return False
-
-        controls = [c.control for c in self.content.controls]
-        return all([_validate_existing_controls_helper(b.bigraph, controls) for b in self.content.bigraphs])
-    
-    def _validate_connected_ports(self) -> bool:
-        def _validate_connected_ports_helper(current: Bigraph, controls: list[Control]) -> bool:
-            match current:
-                case OneBigraph():
-                    return True #TODO: is this correct?
-                case IdBigraph():
-                    return True #TODO: is this correct?
-                case ControlBigraph(control=control, links=links):
-                    matching_controls = list(filter(lambda c: c.name == control.name, controls))
-                    if len(matching_controls) != 1: return False
-                    if len(links) == matching_controls[0].arity: return True
-                case ClosedBigraph(link=_, bigraph=bigraph):
-                    return _validate_connected_ports_helper(bigraph, controls)
-                case NestingBigraph(control=control, inner=inner):
-                    if isinstance(control, ControlBigraph) and not _validate_connected_ports_helper(control, controls): return False
-                    else: return _validate_connected_ports_helper(inner, controls)
-                case MergedBigraphs(merging=merging):
-                    return all([_validate_connected_ports_helper(m, controls) for m in merging])
-                case ParallelBigraphs(parallel=parallel):
-                    return all([_validate_connected_ports_helper(p, controls) for p in parallel])
-                case _:
+        """
+        Checks that all used controls are defined exactly once and used with their arity
+
+        :raises ValueError: If a subbigraph is not a concrete bigraph
+        :return bool: Whether there are no violations, which are logged otherwise
+        """
+        logger.info("Validating %d bigraph assignments.", len(self.content.bigraphs))
+        with tracing.span("validate_bigraph", assignments=len(self.content.bigraphs)) as attributes:
+            violations = self.violations()
+            attributes["violations"] = len(violations)
+        if not violations:
+            logger.info("Validation of %d bigraph assignments successful", len(self.content.bigraphs))
+            return True
+
+        logger.warning("Validation of %d bigraph assignments failed with %d violations!", len(self.content.bigraphs), len(violations))
+        for violation in violations:
+            logger.warning("%s", violation)
+        return False
+
+    def _index_controls(self) -> tuple[dict[str, Control], set[str]]:
+        """
+        Indexes the defined controls by their name
+
+        :return tuple[dict[str, Control], set[str]]: The first definition of each control, and the names of controls defined multiple times
+        """
+        controls: dict[str, Control] = {}
+        duplicates: set[str] = set()
+        for definition in self.content.controls:
+            name = definition.control.name
+            if name in controls:
+                duplicates.add(name)
+            else:
+                controls[name] = definition.control
+        return controls, duplicates
+
+    def violations(self) -> list[BigraphViolation]:
+        """
+        Collects all violations, i.e. uses of undefined or multiply defined controls and uses with the wrong number of links
+
+        Each occurrence of a violation is reported, in the order of the assignments and of the subbigraphs from left to right.
+
+        :raises ValueError: If a subbigraph is not a concrete bigraph
+        :return list[BigraphViolation]: The violations
+
+        Example:
+        >>> for violation in BigraphValidator(BigraphRepresentation(
+        ...     [ControlDefinition(Control("A", 1))],
+        ...     [BigraphAssignment("a", MergedBigraphs([ControlBigraph(ControlByName("A"), []), NestingBigraph(ControlBigraph(ControlByName("B"), []), IdBigraph())]))],
+        ...     [],
+        ... )).violations():
+        ...     print(violation)
+        a[0]: Control A has arity 1, but is used with 0 links
+        a[1][0]: Control B is undefined
+        """
+        controls, duplicates = self._index_controls()
+        # Each distinct control bigraph is checked once, None if it is valid
+        messages: dict[Bigraph, str | None] = {}
+        # Distinct subbigraphs without violations, which need not be traversed again
+        valid: set[Bigraph] = set()
+        violations: list[BigraphViolation] = []
+
+        for assignment in self.content.bigraphs:
+            path: list[int] = []
+            # Entries are a subbigraph, its depth and its index in its parent.
+            # The end of a subbigraph is marked by a negative depth and the number of violations at its start instead.
+            stack: list[tuple[Bigraph, int, int]] = [(assignment.bigraph, 0, 0)]
+            pop = stack.pop
+            push = stack.append
+
+            while stack:
+                current, depth, index = pop()
+                if depth < 0:
+                    if len(violations) == index:
+                        valid.add(current)
+                    continue
+
+                cls = type(current)
+                if cls not in _BIGRAPH_TYPES:
                     raise ValueError(f"{current} is not a Bigraph.")
-            return False
+                if current in valid:
+                    continue
+
+                del path[depth:]
+                path.append(index)
+
+                if cls is ControlBigraph:
+                    if current in messages:
+                        message = messages[current]
+                    else:
+                        message = messages[current] = self._check_control(tp.cast(ControlBigraph, current), controls, duplicates)
+                    if message is None:
+                        valid.add(current)
+                    else:
+                        violations.append(BigraphViolation(assignment.name, tuple(path[1:]), message))
+                    continue
+
+                children = current.children()
+                if not children:
+                    valid.add(current)
+                    continue
+                push((current, -1, len(violations)))
+                for i in range(len(children) - 1, -1, -1):
+                    push((children[i], depth + 1, i))
+
+        return violations
+
+    @staticmethod
+    def _check_control(current: ControlBigraph, controls: dict[str, Control], duplicates: set[str]) -> str | None:
+        """
+        Static method to check a single control bigraph
 
-        controls = [c.control for c in self.content.controls]
-        return all([_validate_connected_ports_helper(b.bigraph, controls) for b in self.content.bigraphs])
\ No newline at end of file
+        :param ControlBigraph current: The control bigraph
+        :param dict[str, Control] controls: The defined controls by their name
+        :param set[str] duplicates: The names of the controls defined multiple times
+        :return str | None: The description of the violation, if any
+        """
+        name = current.control.name
+        control = controls.get(name)
+        if control is None:
+            return f"Control {name} is undefined"
+        if name in duplicates:
+            return f"Control {name} is defined multiple times"
+        if len(current.links) != control.arity:
+            return f"Control {name} has arity {control.arity}, but is used with {len(current.links)} links"
+        return None
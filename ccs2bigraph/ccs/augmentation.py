@@ -4,11 +4,13 @@ Augmentation of CCS Processes
 It serves two main purposes:
 - It "fixes" the parent relation of the :class:`Process`.
 - It introduces instances of :class:`SumProcess` as parents of :class:`PrefixedProcess` where necessary
+
+The input is never modified. An already augmented process is returned as is, any other process is rebuilt in a single pass.
+Since every node refers to its parent, the result shares no nodes with such an input.
 """
 
 from .representation import *
-
-import copy
+from ..traversal import transform, walk
 
 class CcsAugmentor(object):
     """
@@ -18,72 +20,81 @@ class CcsAugmentor(object):
     @staticmethod
     def _augment_parents(process: Process) -> Process:
         """
-        Static method to add the parent relation for each childprocess
+        Static method to add the parent relation for each childprocess, in place
 
         :param Process process: The process to augment
         """
-        def _traverse_helper(current: Process):
-            match current:
-                case NilProcess() | ProcessByName(): return # Nil has no children, TODO: Is this correct for ProcessByName?
-                case SumProcesses(sums=children) | ParallelProcesses(parallels=children):
-                    for child in children:
-                        child.parent = current
-                        _traverse_helper(child)
-                case PrefixedProcess(prefix=_, remaining=child) \
-                   | HidingProcess(process=child, hiding=_) \
-                   | RenamingProcess(process=child, renaming=_):
-                    child.parent = current
-                    _traverse_helper(child)
-                case Process(): raise ValueError("Process may never be instantiated directly")
-        
-        c = copy.deepcopy(process)
-        _traverse_helper(c)
-        return c
-        
+        process.parent = None
+        for current in walk(process):
+            for child in current.children():
+                child.parent = current
+        return process
+
+    @staticmethod
+    def _guard(prefixed: Process) -> SumProcesses:
+        """
+        Static method to wrap a newly built :class:`PrefixedProcess` in a single alternative
+
+        :param Process prefixed: The process to wrap
+        """
+        wrapper = SumProcesses([prefixed])
+        prefixed.parent = wrapper # pyright: ignore[reportAttributeAccessIssue]
+        return wrapper
+
+    @staticmethod
+    def _is_augmented(process: Process) -> bool:
+        """
+        Static method to check whether a process already has the parent relation and no unguarded :class:`PrefixedProcess`
+
+        :param Process process: The process to check
+        """
+        if process.parent is not None or isinstance(process, PrefixedProcess):
+            return False
+        for current in walk(process):
+            guarded = isinstance(current, SumProcesses)
+            for child in current.children():
+                if child.parent is not current or (not guarded and isinstance(child, PrefixedProcess)):
+                    return False
+        return True
 
     @staticmethod
     def _augment_prefixes(process: Process) -> Process:
         """
-        Static method to add missing :class:`SumProcess` instances as parents of :class:`PrefixProcesses`
+        Static method to add missing :class:`SumProcess` instances as parents of :class:`PrefixProcesses` and to add the parent relation in a single pass
 
         :param Process process: The process to augment
         """
-        def _traverse_helper(current: Process) -> Process:
+        if CcsAugmentor._is_augmented(process):
+            return process
+
+        def _augment_helper(current: Process, children: list[Process]) -> Process:
+            # Prefixes are guarded by their parent, unless it already is an alternative
+            if children and not isinstance(current, SumProcesses):
+                children = [
+                    CcsAugmentor._guard(child) if isinstance(child, PrefixedProcess) else child
+                    for child in children
+                ]
+
             match current:
-                case NilProcess() | ProcessByName(): 
-                    return current # Nil has no children, TODO: Is this correct for ProcessByName?
-                case SumProcesses(parent=parent, sums=children):
-                    replacement = SumProcesses(list(map(_traverse_helper, children)))
-                    replacement.parent = parent
-                    return replacement
-                case ParallelProcesses(parent=parent, parallels=children):
-                    replacement = ParallelProcesses(list(map(_traverse_helper, children)))
-                    replacement.parent = parent
-                    return replacement
-                case HidingProcess(parent=parent, process=child, hiding=hiding):
-                    replacement = HidingProcess(_traverse_helper(child), hiding)
-                    replacement.parent = parent
-                    return replacement
-                case RenamingProcess(parent=parent, process=child, renaming=renaming):
-                    replacement = RenamingProcess(_traverse_helper(child), renaming)
-                    replacement.parent = parent
-                    return replacement
-                case PrefixedProcess(parent=parent, prefix=prefix, remaining=child):
-                    replacement = PrefixedProcess(prefix, _traverse_helper(child))
-
-                    if not isinstance(parent, SumProcesses):
-                        wrapper = SumProcesses([replacement])
-                        replacement.parent = wrapper # pyright: ignore[reportAttributeAccessIssue]
-                        wrapper.parent = parent # pyright: ignore[reportAttributeAccessIssue]
-                        return wrapper 
-                    else:
-                        replacement.parent = parent
-                        return replacement
-                    
-                case Process(): raise ValueError("Process may never be instantiated directly")
-
-        return _traverse_helper(process)
-    
+                case NilProcess(): replacement = NilProcess()
+                case ProcessByName(name=name): replacement = ProcessByName(name)
+                case PrefixedProcess(prefix=prefix): replacement = PrefixedProcess(prefix, children[0])
+                case SumProcesses(): replacement = SumProcesses(children)
+                case ParallelProcesses(): replacement = ParallelProcesses(children)
+                case HidingProcess(hiding=hiding): replacement = HidingProcess(children[0], hiding)
+                case RenamingProcess(renaming=renaming): replacement = RenamingProcess(children[0], renaming)
+                case _ if type(current) is Process: raise ValueError("Process may never be instantiated directly")
+                case _: raise TypeError(f"{current} may not be rebuilt.")
+
+            for child in children:
+                child.parent = replacement # pyright: ignore[reportAttributeAccessIssue]
+            return replacement
+
+        result = transform(process, _augment_helper)
+        if isinstance(result, PrefixedProcess):
+            result = CcsAugmentor._guard(result)
+        return result
+
     @staticmethod
     def augment(process: Process) -> Process:
-        return CcsAugmentor._augment_prefixes(CcsAugmentor._augment_parents(process))
\ No newline at end of file
+        return CcsAugmentor._augment_prefixes(process)
@@ -0,0 +1,764 @@
+"""
+Bisimulation of Labelled Transition Systems
+
+:class:`Bisimulation` computes the coarsest strong bisimulation of an :class:`Lts` by partition refinement in O(m log n) for m transitions and n states, following Paige and Tarjan.
+The transitions are kept in compact integer arrays, indexed by their target.
+
+If two states are not bisimilar, :meth:`Bisimulation.distinguish` returns a winning play of the attacker in the bisimulation game.
+It is derived from the order in which the refinement separated the states: every split separates two states by a move whose answers only lead to states separated before.
+
+:class:`WeakBisimulation` computes weak bisimilarity and observational congruence, for which internal (:data:`TAU`) transitions may be answered by any number of internal transitions.
+It refines the transition system saturated with the :class:`TauClosure` of each state.
+"""
+
+import logging
+logger = logging.getLogger(__name__)
+
+import typing as tp
+from array import array
+from dataclasses import dataclass
+
+from .lts import CcsExplorer, Lts, TAU
+from .. import tracing
+
+_NEVER = 1 << 62
+"""The separation time of bisimilar states"""
+
+Equivalence = tp.Literal["strong", "weak", "congruence"]
+"""Available equivalences: strong bisimilarity, weak bisimilarity and observational congruence, c.f. :func:`compare`"""
+
+EQUIVALENCES: tuple[Equivalence, ...] = tp.get_args(Equivalence)
+
+def _zeros(length: int) -> array:
+    return array("i", [0]) * length
+
+@dataclass(frozen=True, slots=True)
+class Round(object):
+    """
+    A round of the bisimulation game
+
+    :param int side: The state moved by the attacker, 0 for the first and 1 for the second state
+    :param str label: The label of the move
+    :param int attacker: The target of the attacker's move
+    :param int | None defender: The target of the defender's answer, None if the defender cannot answer
+    :param bool weak: Whether the attacker's move may include internal transitions
+    """
+
+    side: int
+    label: str
+    attacker: int
+    defender: int | None
+    weak: bool = False
+
+@dataclass(frozen=True, slots=True)
+class Distinction(object):
+    """
+    A play of the bisimulation game won by the attacker, which shows that two states are not bisimilar
+
+    In each round, the attacker moves one of the current states and the defender answers with an equally labelled move of the other one, until the defender cannot answer.
+    The defender may have further answers, but the attacker wins against each of them.
+
+    :param list[Round] rounds: The rounds, the last one is not answered
+    :param bool weak: Whether the defender's answers may include internal transitions
+
+    Example:
+    >>> print(Distinction([Round(1, "a", 3, 1), Round(0, "b", 2, None)]).describe("P", "Q"))
+    Q --a-->, P --a-->
+    P --b-->, Q cannot answer
+    >>> print(Distinction([Round(0, "tau", 3, 1), Round(0, "b", 2, None, weak=True)], weak=True).describe("P", "Q"))
+    P --tau-->, Q ==tau==>
+    P ==b==>, Q cannot answer
+    """
+
+    rounds: list[Round]
+    weak: bool = False
+
+    @property
+    def trace(self) -> list[str]:
+        """The labels of the rounds"""
+        return [r.label for r in self.rounds]
+
+    def describe(self, first: str, second: str) -> str:
+        """
+        Renders the rounds, one per line
+
+        :param str first: The name of the first state
+        :param str second: The name of the second state
+        :return str: The rounds
+        """
+        lines: list[str] = []
+        for r in self.rounds:
+            attacker, defender = (first, second) if r.side == 0 else (second, first)
+            move = f"=={r.label}==>" if r.weak else f"--{r.label}-->"
+            answer = f"=={r.label}==>" if self.weak else f"--{r.label}-->"
+            answer = f"{defender} {answer}" if r.defender is not None else f"{defender} cannot answer"
+            lines.append(f"{attacker} {move}, {answer}")
+        return "\n".join(lines)
+
+class Bisimulation(object):
+    """
+    The coarsest strong bisimulation of a labelled transition system
+
+    The partition of the states is refined against compound blocks, i.e. unions of blocks the partition is stable against.
+    Each step removes the smaller of two blocks from a compound block and splits the partition against both parts, using per state counts of the transitions into the compound blocks.
+    Since a state is in the smaller part at most log n times, each transition is processed O(log n) times.
+
+    :param Lts lts: The transition system
+
+    Example:
+    >>> lts = Lts([0, 1, 2, 3, 4, 5], [
+    ...     [("a", 1), ("a", 2)], [("b", 4)], [("c", 4)], # a.b.0 + a.c.0
+    ...     [("a", 5)], [], [("b", 4), ("c", 4)],         # a.(b.0 + c.0)
+    ... ])
+    >>> bisimulation = Bisimulation(lts)
+    >>> bisimulation.equivalent(0, 3), bisimulation.equivalent(4, 4)
+    (False, True)
+    >>> print(bisimulation.distinguish(0, 3).describe("P", "Q"))
+    P --a-->, Q --a-->
+    Q --c-->, P cannot answer
+    """
+
+    def __init__(self, lts: Lts) -> None:
+        self._lts = lts
+        n = lts.state_count
+        with tracing.span("bisimulation", states=n, transitions=lts.transition_count) as attributes:
+            self._index(lts)
+            self._init_partition(n)
+            self._refine()
+            attributes["blocks"] = self.block_count
+        logger.info("Refined %d states into %d blocks", n, self.block_count)
+
+    def _index(self, lts: Lts) -> None:
+        """Stores the transitions by target, with integer labels and a count record each"""
+        n = lts.state_count
+        labels: dict[str, int] = {}
+        starts = _zeros(n + 1)
+        for outgoing in lts.transitions:
+            for _, target in outgoing:
+                starts[target + 1] += 1
+        for s in range(n):
+            starts[s + 1] += starts[s]
+        m = starts[n]
+
+        fill = array("i", starts)
+        sources = _zeros(m)
+        label_ids = _zeros(m)
+        # Initially, each record counts the transitions of a source and label into the compound block of all states
+        records = _zeros(m)
+        counts = array("i")
+        for source, outgoing in enumerate(lts.transitions):
+            own: dict[int, int] = {}
+            for l, target in outgoing:
+                a = labels.setdefault(l, len(labels))
+                record = own.get(a)
+                if record is None:
+                    record = own[a] = len(counts)
+                    counts.append(0)
+                counts[record] += 1
+                position = fill[target]
+                fill[target] += 1
+                sources[position] = source
+                label_ids[position] = a
+                records[position] = record
+
+        self._labels = labels
+        self._starts = starts
+        self._sources = sources
+        self._label_ids = label_ids
+        self._records = records
+        self._counts = counts
+
+    def _init_partition(self, n: int) -> None:
+        """Creates the partition with a single block, in a single compound block"""
+        # The states ordered by block, and the position of each state
+        self._elements = array("i", range(n))
+        self._positions = array("i", range(n))
+        self._blocks = _zeros(n)
+        # Blocks are ranges of `_elements`, whose marked states come first
+        self._block_starts: list[int] = [0]
+        self._block_ends: list[int] = [n]
+        self._marked: list[int] = [0]
+        self._touched: list[int] = []
+        # Each split creates a block for the marked states, which records the block it was split from.
+        # Since blocks are numbered in the order of the splits, the number of a block is the time of its split.
+        self._parents: list[int] = [-1]
+        self._compounds: list[int] = [0]
+        self._compound_blocks: list[list[int]] = [[0]]
+        # Compound blocks of at least two blocks
+        self._unstable: list[int] = []
+
+    @property
+    def block_count(self) -> int:
+        """The number of equivalence classes"""
+        return len(self._block_starts)
+
+    def block(self, state: int) -> int:
+        """
+        The equivalence class of a state
+
+        :param int state: The state
+        :return int: The number of its class
+        """
+        return self._blocks[state]
+
+    def equivalent(self, first: int, second: int) -> bool:
+        """Whether two states are bisimilar"""
+        return self._blocks[first] == self._blocks[second]
+
+    def _mark(self, state: int) -> None:
+        block = self._blocks[state]
+        position = self._positions[state]
+        first = self._block_starts[block] + self._marked[block]
+        if position < first:
+            return
+        if first == self._block_starts[block]:
+            self._touched.append(block)
+        elements, positions = self._elements, self._positions
+        other = elements[first]
+        elements[first], elements[position] = state, other
+        positions[state], positions[other] = first, position
+        self._marked[block] += 1
+
+    def _split(self) -> None:
+        """Splits the marked states of each touched block into a new block"""
+        starts, ends, marked = self._block_starts, self._block_ends, self._marked
+        for block in self._touched:
+            count = marked[block]
+            marked[block] = 0
+            start = starts[block]
+            if start + count == ends[block]:
+                continue
+
+            new = len(starts)
+            starts.append(start)
+            ends.append(start + count)
+            marked.append(0)
+            starts[block] = start + count
+            self._parents.append(block)
+            compound = self._compounds[block]
+            self._compounds.append(compound)
+            blocks = self._compound_blocks[compound]
+            blocks.append(new)
+            if len(blocks) == 2:
+                self._unstable.append(compound)
+            for i in range(start, start + count):
+                self._blocks[self._elements[i]] = new
+        self._touched.clear()
+
+    def _refine(self) -> None:
+        # Initially, the partition is split by the enabled labels
+        sources_by_label: dict[int, list[int]] = {}
+        for position, a in enumerate(self._label_ids):
+            sources_by_label.setdefault(a, []).append(self._sources[position])
+        for sources in sources_by_label.values():
+            for s in sources:
+                self._mark(s)
+            self._split()
+        del sources_by_label
+
+        starts, ends = self._block_starts, self._block_ends
+        while self._unstable:
+            compound = self._unstable.pop()
+            blocks = self._compound_blocks[compound]
+            # One of two blocks has at most half the size of the compound block
+            first, second = blocks[-1], blocks[-2]
+            if ends[first] - starts[first] > ends[second] - starts[second]:
+                first, second = second, first
+                blocks[-2] = second
+            blocks.pop()
+            if len(blocks) >= 2:
+                self._unstable.append(compound)
+            self._compounds[first] = len(self._compound_blocks)
+            self._compound_blocks.append([first])
+
+            self._split_by(first)
+
+    def _split_by(self, splitter: int) -> None:
+        """Splits the partition against a block removed from its compound block, and against the rest of the compound block"""
+        starts, sources, label_ids, records, counts = self._starts, self._sources, self._label_ids, self._records, self._counts
+
+        # The transitions into the splitter by label
+        incoming: dict[int, list[int]] = {}
+        for i in range(self._block_starts[splitter], self._block_ends[splitter]):
+            state = self._elements[i]
+            for position in range(starts[state], starts[state + 1]):
+                incoming.setdefault(label_ids[position], []).append(position)
+
+        for positions in incoming.values():
+            # New records count the transitions into the splitter, the previous ones then count those into the rest of the compound block
+            new: dict[int, int] = {}
+            previous: dict[int, int] = {}
+            for position in positions:
+                source = sources[position]
+                record = new.get(source)
+                if record is None:
+                    record = new[source] = len(counts)
+                    counts.append(0)
+                    previous[source] = records[position]
+                counts[record] += 1
+                counts[records[position]] -= 1
+                records[position] = record
+
+            for source in new:
+                self._mark(source)
+            self._split()
+            for source, record in previous.items():
+                if not counts[record]:
+                    self._mark(source)
+            self._split()
+
+    def _separation(self, first: int, second: int) -> int:
+        """The time of the split separating two states, :data:`_NEVER` if they are bisimilar"""
+        parents = self._parents
+        # The ancestors of the block of `first`, with the time of the split of their child on the path
+        ancestors: dict[int, int] = {}
+        block, time = self._blocks[first], _NEVER
+        while block >= 0:
+            ancestors[block] = time
+            time = block
+            block = parents[block]
+
+        block, time = self._blocks[second], _NEVER
+        while block not in ancestors:
+            time = block
+            block = parents[block]
+        return min(time, ancestors[block])
+
+    def _attack(self, first: int, second: int) -> tuple[int, str, int, list[int]]:
+        """
+        Finds a move of one of two states which are not bisimilar, whose answers all lead to states separated before
+
+        :return tuple[int, str, int, list[int]]: The side of the attacker, the label and target of the move, and the targets of the answers
+        """
+        time = self._separation(first, second)
+        transitions = self._lts.transitions
+        for side, (attacker, defender) in enumerate(((first, second), (second, first))):
+            for l, target in transitions[attacker]:
+                answers = [t for a, t in transitions[defender] if a == l]
+                if all(self._separation(target, t) < time for t in answers):
+                    return side, l, target, answers
+        raise ValueError(f"States {first} and {second} are not separated by a move")
+
+    def distinguish(self, first: int, second: int) -> Distinction | None:
+        """
+        Computes a winning play of the attacker in the bisimulation game
+
+        :param int first: The first state
+        :param int second: The second state
+        :return Distinction | None: The play, None if the states are bisimilar
+        """
+        rounds: list[Round] = []
+        while not self.equivalent(first, second):
+            side, l, target, answers = self._attack(first, second)
+            if not answers:
+                rounds.append(Round(side, l, target, None))
+                break
+            rounds.append(Round(side, l, target, answers[0]))
+            first, second = (target, answers[0]) if side == 0 else (answers[0], target)
+        return Distinction(rounds) if rounds else None
+
+class TauClosure(object):
+    """
+    The states reachable by internal transitions, i.e. the tau*-closure of each state
+
+    States which reach each other by internal transitions are collapsed into a component first.
+    The closure of a component is computed on first use from the closures of its successors, and kept for later uses.
+
+    :param Lts lts: The transition system
+
+    Example:
+    >>> closure = TauClosure(Lts([0, 1, 2, 3], [[(TAU, 1)], [(TAU, 0), (TAU, 2)], [("a", 3)], []]))
+    >>> closure.components[0] == closure.components[1], closure.component_count
+    (True, 3)
+    >>> [sorted(closure.representatives[c] for c in closure.closure(closure.components[s])) for s in range(4)]
+    [[0, 2], [0, 2], [2], [3]]
+    """
+
+    def __init__(self, lts: Lts) -> None:
+        n = lts.state_count
+        internal = [[t for l, t in outgoing if l == TAU] for outgoing in lts.transitions]
+
+        # Tarjan's algorithm, which numbers the components in reverse topological order
+        components = array("i", [-1]) * n
+        indices = array("i", [-1]) * n
+        lows = _zeros(n)
+        representatives: list[int] = []
+        successors: list[tuple[int, ...]] = []
+        stack: list[int] = []
+        counter = 0
+        for root in range(n):
+            if indices[root] >= 0:
+                continue
+            indices[root] = lows[root] = counter
+            counter += 1
+            stack.append(root)
+            work = [(root, 0)]
+            while work:
+                state, i = work[-1]
+                targets = internal[state]
+                if i < len(targets):
+                    work[-1] = (state, i + 1)
+                    target = targets[i]
+                    if indices[target] < 0:
+                        indices[target] = lows[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        work.append((target, 0))
+                    elif components[target] < 0 and indices[target] < lows[state]:
+                        # The target is on the stack
+                        lows[state] = indices[target]
+                    continue
+
+                work.pop()
+                if work and lows[state] < lows[work[-1][0]]:
+                    lows[work[-1][0]] = lows[state]
+                if lows[state] != indices[state]:
+                    continue
+
+                component = len(representatives)
+                representatives.append(state)
+                members: list[int] = []
+                while True:
+                    member = stack.pop()
+                    components[member] = component
+                    members.append(member)
+                    if member == state:
+                        break
+                # The successors are numbered before
+                successors.append(tuple({
+                    components[target]
+                    for member in members for target in internal[member]
+                    if components[target] != component
+                }))
+
+        self.components = components
+        """The component of each state"""
+        self.representatives = representatives
+        """A state of each component"""
+        self._successors = successors
+        self._closures: list[tuple[int, ...] | None] = [None] * len(representatives)
+
+    @property
+    def component_count(self) -> int:
+        return len(self.representatives)
+
+    def successors(self, component: int) -> tuple[int, ...]:
+        """
+        The components reached from a component by a single internal transition, except itself
+
+        :param int component: The component
+        :return tuple[int, ...]: The successors, which are numbered before `component`
+        """
+        return self._successors[component]
+
+    def closure(self, component: int) -> tuple[int, ...]:
+        """
+        The components reachable from a component by internal transitions, including itself
+
+        :param int component: The component
+        :return tuple[int, ...]: The reachable components in ascending order
+        """
+        closures = self._closures
+        result = closures[component]
+        if result is not None:
+            return result
+
+        # Computes the missing closures of the reachable components, successors first
+        stack = [component]
+        while stack:
+            current = stack[-1]
+            missing = [s for s in self._successors[current] if closures[s] is None]
+            if missing:
+                stack.extend(missing)
+                continue
+            stack.pop()
+            if closures[current] is not None:
+                continue
+            reachable = {current}
+            for successor in self._successors[current]:
+                reachable.update(closures[successor]) # pyright: ignore[reportArgumentType]
+            closures[current] = tuple(sorted(reachable))
+        return closures[component] # pyright: ignore[reportReturnType]
+
+class WeakBisimulation(object):
+    """
+    Weak bisimilarity and observational congruence of the states of a transition system
+
+    The weak bisimulation is the strong :class:`Bisimulation` of the saturated transition system, whose transitions are the weak moves:
+    an internal transition to each state in the :class:`TauClosure`, and for each visible label `a` a transition to each state reachable by internal transitions, `a` and internal transitions.
+
+    Since the saturated transition system may have quadratically many transitions, the transition system is reduced first:
+    the components of the closure are refined to branching bisimilarity, which is finer than weak bisimilarity, and the classes are saturated instead of the states.
+    This removes all inert internal transitions, e.g. those of internal synchronizations which do not resolve any choice.
+
+    :param Lts lts: The transition system
+
+    Example:
+    >>> lts = Lts([0, 1, 2, 3, 4, 5], [
+    ...     [(TAU, 1)], [("a", 2)], [],   # tau.a.0
+    ...     [("a", 4)], [],               # a.0
+    ...     [("a", 4), (TAU, 4)],         # a.0 + tau.0
+    ... ])
+    >>> bisimulation = WeakBisimulation(lts)
+    >>> bisimulation.equivalent(0, 3), bisimulation.congruent(0, 3), bisimulation.equivalent(3, 5)
+    (True, False, False)
+    >>> print(bisimulation.distinguish(0, 3, congruence=True).describe("P", "Q"))
+    P --tau-->, Q cannot answer
+    >>> print(bisimulation.distinguish(3, 5).describe("P", "Q"))
+    Q ==tau==>, P ==tau==>
+    P ==a==>, Q cannot answer
+    """
+
+    def __init__(self, lts: Lts) -> None:
+        self._lts = lts
+        with tracing.span("weak_bisimulation", states=lts.state_count, transitions=lts.transition_count) as attributes:
+            closure = TauClosure(lts)
+            classes, quotient = self._branching_quotient(lts, closure)
+            self._classes = array("i", (classes[c] for c in closure.components))
+            self._closure = TauClosure(quotient)
+            self._saturated = self._saturate(quotient, self._closure)
+            self._strong = Bisimulation(self._saturated)
+            attributes["components"] = closure.component_count
+            attributes["branching_classes"] = quotient.state_count
+            attributes["saturated_transitions"] = self._saturated.transition_count
+            attributes["blocks"] = self.block_count
+        logger.info("Refined %d states into %d weakly bisimilar blocks", lts.state_count, self.block_count)
+
+    @staticmethod
+    def _branching_quotient(lts: Lts, closure: TauClosure) -> tuple[list[int], Lts]:
+        """
+        Static method to compute the branching bisimilarity classes of the components of a closure by signature refinement
+
+        The signature of a component are the labels and classes of its transitions, where internal transitions within its class are inert and contribute the signature of their target instead.
+        Since the components are numbered in reverse topological order of the internal transitions, the targets of inert transitions are computed first.
+
+        :return tuple[list[int], Lts]: The class of each component, and the transition system of the classes without inert transitions
+        """
+        components = closure.components
+        moves: list[set[tuple[str, int]]] = [set() for _ in range(closure.component_count)]
+        for state, outgoing in enumerate(lts.transitions):
+            component = components[state]
+            for l, target in outgoing:
+                if l != TAU or components[target] != component:
+                    moves[component].add((l, components[target]))
+
+        classes = [0] * closure.component_count
+        count = 1
+        while True:
+            signatures: list[frozenset[tuple[str, int]]] = []
+            for component, outgoing in enumerate(moves):
+                current = classes[component]
+                signature: set[tuple[str, int]] = set()
+                for l, target in outgoing:
+                    if l == TAU and classes[target] == current:
+                        signature.update(signatures[target])
+                    else:
+                        signature.add((l, classes[target]))
+                signatures.append(frozenset(signature))
+
+            ids: dict[tuple[int, frozenset[tuple[str, int]]], int] = {}
+            refined = [ids.setdefault((c, signature), len(ids)) for c, signature in zip(classes, signatures)]
+            if len(ids) == count:
+                break
+            classes, count = refined, len(ids)
+
+        terms = [0] * count
+        transitions: list[set[tuple[str, int]]] = [set() for _ in range(count)]
+        for component, outgoing in enumerate(moves):
+            current = classes[component]
+            terms[current] = lts.terms[closure.representatives[component]]
+            transitions[current].update((l, classes[target]) for l, target in outgoing if l != TAU or classes[target] != current)
+        return classes, Lts(terms, [sorted(outgoing) for outgoing in transitions])
+
+    @staticmethod
+    def _saturate(lts: Lts, closure: TauClosure) -> Lts:
+        """Static method to compute the transition system of the weak moves of the components of a closure"""
+        components = closure.components
+        members: list[list[int]] = [[] for _ in range(closure.component_count)]
+        for state, component in enumerate(components):
+            members[component].append(state)
+
+        # The components reached by each visible transition of a component, followed by internal transitions
+        after: list[dict[str, set[int]]] = []
+        for states in members:
+            targets: dict[str, set[int]] = {}
+            for state in states:
+                for l, target in lts.transitions[state]:
+                    if l != TAU:
+                        targets.setdefault(l, set()).update(closure.closure(components[target]))
+            after.append(targets)
+
+        transitions: list[list[tuple[str, int]]] = []
+        for component in range(closure.component_count):
+            reachable = closure.closure(component)
+            moves: dict[str, set[int]] = {}
+            for c in reachable:
+                for l, targets in after[c].items():
+                    moves.setdefault(l, set()).update(targets)
+            transitions.append(
+                [(TAU, c) for c in reachable]
+                + [(l, target) for l, targets in moves.items() for target in sorted(targets)]
+            )
+
+        return Lts([lts.terms[s] for s in closure.representatives], transitions)
+
+    def _node(self, state: int) -> int:
+        """The state of the saturated transition system representing a state"""
+        return self._closure.components[self._classes[state]]
+
+    @property
+    def block_count(self) -> int:
+        """The number of equivalence classes"""
+        return self._strong.block_count
+
+    def block(self, state: int) -> int:
+        """
+        The equivalence class of a state
+
+        :param int state: The state
+        :return int: The number of its class
+        """
+        return self._strong.block(self._node(state))
+
+    def equivalent(self, first: int, second: int) -> bool:
+        """Whether two states are weakly bisimilar"""
+        return self.block(first) == self.block(second)
+
+    def _answers(self, state: int, label: str) -> list[int]:
+        """The states of the saturated transition system reachable by a weak move of at least one transition"""
+        if label != TAU:
+            return [t for l, t in self._saturated.transitions[self._node(state)] if l == label]
+        answers: set[int] = set()
+        for l, target in self._lts.transitions[state]:
+            if l == TAU:
+                answers.update(self._closure.closure(self._node(target)))
+        return sorted(answers)
+
+    def _unmatched(self, first: int, second: int) -> tuple[int, str, int, list[int]] | None:
+        """
+        Finds a transition of one state which the other state cannot answer with a weak move of at least one transition to an equivalent state
+
+        :return tuple[int, str, int, list[int]] | None: The side, label and target of the transition and the answering states of the saturated transition system
+        """
+        for side, (attacker, defender) in enumerate(((first, second), (second, first))):
+            for l, target in self._lts.transitions[attacker]:
+                answers = self._answers(defender, l)
+                block = self.block(target)
+                if not any(self._strong.block(answer) == block for answer in answers):
+                    return side, l, target, answers
+        return None
+
+    def congruent(self, first: int, second: int) -> bool:
+        """Whether two states are observationally congruent, i.e. weakly bisimilar and every initial internal transition is answered by at least one internal transition"""
+        return self.equivalent(first, second) and self._unmatched(first, second) is None
+
+    def _weak_successors(self, state: int, label: str, proper: bool = False) -> list[int]:
+        """
+        The states reachable by internal transitions, a transition labelled `label` unless it is :data:`TAU`, and internal transitions
+
+        :param int state: The state
+        :param str label: The label
+        :param bool proper: Whether at least one transition is required
+        :return list[int]: The reachable states, in breadth-first order
+        """
+        transitions = self._lts.transitions
+
+        def _internal(starts: list[int]) -> list[int]:
+            reached = dict.fromkeys(starts)
+            queue = list(reached)
+            for current in queue:
+                for l, target in transitions[current]:
+                    if l == TAU and target not in reached:
+                        reached[target] = None
+                        queue.append(target)
+            return queue
+
+        if label == TAU:
+            if not proper:
+                return _internal([state])
+            return _internal([t for l, t in transitions[state] if l == TAU])
+        return _internal([t for s in _internal([state]) for l, t in transitions[s] if l == label])
+
+    def distinguish(self, first: int, second: int, congruence: bool = False) -> Distinction | None:
+        """
+        Computes a winning play of the attacker in the weak bisimulation game
+
+        Each round is played on the saturated transition system and lifted to weak moves of the states.
+
+        :param int first: The first state
+        :param int second: The second state
+        :param bool congruence: Whether the game for observational congruence is played, whose first move is a single transition that has to be answered by at least one transition
+        :return Distinction | None: The play, None if the states are equivalent
+        """
+        rounds: list[Round] = []
+        if congruence and self.equivalent(first, second):
+            unmatched = self._unmatched(first, second)
+            if unmatched is None:
+                return None
+            side, l, target, answers = unmatched
+            defender = second if side == 0 else first
+            if not answers:
+                return Distinction([Round(side, l, target, None)], weak=True)
+            answer = self._weak_successors(defender, l, proper=True)[0]
+            rounds.append(Round(side, l, target, answer))
+            first, second = (target, answer) if side == 0 else (answer, target)
+
+        while not self.equivalent(first, second):
+            side, l, node, _ = self._strong._attack(self._node(first), self._node(second)) # pyright: ignore[reportPrivateUsage]
+            attacker, defender = (first, second) if side == 0 else (second, first)
+            target = next(t for t in self._weak_successors(attacker, l) if self._node(t) == node)
+            answers = self._weak_successors(defender, l)
+            if not answers:
+                rounds.append(Round(side, l, target, None, weak=True))
+                break
+            rounds.append(Round(side, l, target, answers[0], weak=True))
+            first, second = (target, answers[0]) if side == 0 else (answers[0], target)
+        return Distinction(rounds, weak=True) if rounds else None
+
+def union(first: Lts, second: Lts) -> Lts:
+    """
+    Combines two transition systems into one, whose states are those of `first` followed by those of `second`
+
+    :param Lts first: The first transition system, whose initial state remains the initial state
+    :param Lts second: The second transition system, whose states are shifted by the number of states of `first`
+    :return Lts: The combined transition system
+    """
+    offset = first.state_count
+    return Lts(
+        first.terms + second.terms,
+        first.transitions + [[(l, target + offset) for l, target in outgoing] for outgoing in second.transitions],
+        first.initial,
+    )
+
+def compare(explorer: CcsExplorer, first: str, second: str, max_states: int | None = None, equivalence: Equivalence = "strong") -> Distinction | None:
+    """
+    Checks whether two processes are equivalent
+
+    :param CcsExplorer explorer: The explorer of the representation defining the processes
+    :param str first: The name of the first process
+    :param str second: The name of the second process
+    :param int | None max_states: The maximal number of states of each process, unbounded if None
+    :param Equivalence equivalence: The checked equivalence, one of :data:`EQUIVALENCES`
+    :return Distinction | None: A play showing that the processes are not equivalent, None if they are
+    :raises ValueError: If the equivalence is unknown, or a state space exceeds `max_states`
+
+    Example:
+    >>> from .fast_grammar import parse
+    >>> explorer = CcsExplorer(parse("A = a.(b.0 + c.0); B = a.b.0 + a.c.0; C = a.(c.0 + b.0);"))
+    >>> compare(explorer, "A", "C") is None
+    True
+    >>> compare(explorer, "A", "B").trace
+    ['a', 'c']
+    >>> explorer = CcsExplorer(parse("A = a.'b.0 | b.c.0; B = (A) \\\\ {b}; C = a.c.0;"))
+    >>> compare(explorer, "B", "C") is None, compare(explorer, "B", "C", equivalence="weak") is None
+    (False, True)
+    """
+    if equivalence not in EQUIVALENCES:
+        raise ValueError(f"Unknown equivalence {equivalence!r}")
+
+    left = explorer.explore(first, max_states)
+    right = explorer.explore(second, max_states)
+    lts = union(left, right)
+    if equivalence == "strong":
+        return Bisimulation(lts).distinguish(left.initial, left.state_count + right.initial)
+    return WeakBisimulation(lts).distinguish(left.initial, left.state_count + right.initial, congruence=equivalence == "congruence")
@@ -0,0 +1,145 @@
+"""
+Persistent Cache of parsed CCS Representations
+
+Parsed :class:`CcsRepresentation` instances are stored as compressed pickles in a cache directory.
+Entries are keyed by a hash of the source text, the parser engine and :data:`PARSER_VERSION`.
+
+The cache is safe to use from several processes at once:
+- entries are written to a temporary file first and atomically moved into place,
+- reading an entry which was evicted (or is incomplete or corrupt) in the meantime is treated as a miss.
+
+Least recently used entries are evicted based on their modification time, which is refreshed on every hit.
+
+Note, that entries are unpickled when read, so the cache directory must only be writable by trusted users.
+"""
+
+import logging
+logger = logging.getLogger(__name__)
+
+import hashlib
+import os
+import pickle
+import tempfile
+import typing as tp
+import zlib
+from pathlib import Path
+
+from .representation import CcsRepresentation
+
+PARSER_VERSION = 4
+"""Version of the parsed representation, bump whenever the grammar or the representation classes change"""
+
+_SUFFIX = ".ccs.z"
+_READ_SIZE = 1 << 16
+
+class AstCache(object):
+    """
+    On-disk cache of parsed :class:`CcsRepresentation` instances
+
+    :param Path directory: The cache directory, created if it does not exist
+    :param int max_entries: The maximal number of entries kept in the cache
+    """
+
+    def __init__(self, directory: Path, max_entries: int = 256) -> None:
+        self._directory = Path(directory)
+        self._max_entries = max_entries
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(source: bytes | tp.BinaryIO, engine: str) -> str:
+        """
+        Computes the cache key of a CCS source
+
+        :param bytes | BinaryIO source: The source text, either as bytes or as a binary stream which is read in chunks
+        :param str engine: The parser engine used to parse the source
+        :return str: The hex digest identifying the cache entry
+        """
+        digest = hashlib.sha256(f"{PARSER_VERSION}\0{engine}\0".encode())
+        if isinstance(source, bytes):
+            digest.update(source)
+        else:
+            while chunk := source.read(_READ_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> CcsRepresentation | None:
+        """
+        Looks up a cache entry and marks it as recently used
+
+        :param str key: The cache key, c.f. :meth:`key`
+        :return CcsRepresentation | None: The cached representation, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            ccs = pickle.loads(zlib.decompress(data))
+        except FileNotFoundError:
+            logger.info("Cache miss for %s", key)
+            return None
+        except Exception as e:
+            logger.warning("Discarding unreadable cache entry %s: %s", key, e)
+            path.unlink(missing_ok=True)
+            return None
+
+        if not isinstance(ccs, CcsRepresentation):
+            logger.warning("Discarding invalid cache entry %s", key)
+            path.unlink(missing_ok=True)
+            return None
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass # Evicted concurrently, the loaded representation is still valid
+
+        logger.info("Cache hit for %s", key)
+        return ccs
+
+    def put(self, key: str, ccs: CcsRepresentation) -> None:
+        """
+        Stores a representation in the cache and evicts the least recently used entries if necessary
+
+        :param str key: The cache key, c.f. :meth:`key`
+        :param CcsRepresentation ccs: The representation to store
+        """
+        try:
+            data = zlib.compress(pickle.dumps(ccs, pickle.HIGHEST_PROTOCOL))
+        except RecursionError:
+            logger.warning("Not caching %s, the representation is nested too deeply", key)
+            return
+
+        fd, tmp = tempfile.mkstemp(dir=self._directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        logger.info("Cached %s (%d bytes)", key, len(data))
+        self._evict()
+
+    def _evict(self) -> None:
+        """Removes the least recently used entries exceeding `max_entries`"""
+        entries: list[tuple[float, Path]] = []
+        for path in self._directory.glob(f"*{_SUFFIX}"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                pass # Evicted concurrently
+
+        if len(entries) <= self._max_entries:
+            return
+
+        entries.sort()
+        for _, path in entries[:len(entries) - self._max_entries]:
+            logger.info("Evicting cache entry %s", path.name)
+            path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Removes all entries from the cache"""
+        for path in self._directory.glob(f"*{_SUFFIX}"):
+            path.unlink(missing_ok=True)
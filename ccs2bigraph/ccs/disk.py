@@ -0,0 +1,334 @@
+"""
+Out-of-Core Exploration of Labelled Transition Systems
+
+:class:`DiskExplorer` explores the states reachable from a process breadth-first like :meth:`CcsExplorer.explore_compact`,
+but keeps the states and transitions in memory-mapped files of a working directory. Hence, the state space may exceed the available memory.
+
+States are stored by their structural keys, c.f. :meth:`CcsExplorer.encode`, in the order of their discovery, which is breadth-first.
+Thus, the frontier of states which are not yet expanded is a suffix of the stored states, and needs no separate queue.
+Visited states are found by a two-level hash scheme: a bounded dictionary of recently seen keys in memory,
+backed by an open-addressing hash table on disk of 64-bit fingerprints and state numbers. Keys are only read from disk on a fingerprint match.
+The transitions are written in compressed sparse row form, c.f. :class:`CompactLts`. The outgoing transitions of each state are ordered by label and key of the target,
+hence the numbering of the states is the same whether or not the exploration was resumed, but may differ from :meth:`CcsExplorer.explore_compact`.
+
+The exploration writes a checkpoint regularly, when it is paused and when it is interrupted by `KeyboardInterrupt`.
+Exploring the same process in the same working directory again resumes from the last checkpoint.
+"""
+
+import logging
+logger = logging.getLogger(__name__)
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+
+from .lts import CcsExplorer, CompactLts
+from .representation import *
+from .. import tracing
+
+_CHECKPOINT = "checkpoint.json"
+_CHECKPOINT_VERSION = 1
+
+_INITIAL_CAPACITY = 1 << 12
+"""The initial number of items of the files, which double whenever they are full"""
+
+_INITIAL_SLOTS = 1 << 10
+"""The initial number of slots of the hash table, which doubles whenever it is half full"""
+
+_MAX_TERMS = 1 << 20
+"""The number of hash-consed terms after which the in-memory explorer is replaced by a fresh one, bounding its memory"""
+
+def _fingerprint(key: bytes) -> int:
+    """A 64-bit hash of a key, which is the same in all processes, unlike the builtin `hash`"""
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+class _MappedArray(object):
+    """
+    An append-only array of a single typecode in a memory-mapped file, whose capacity doubles whenever it is full
+
+    :param Path path: The file, which is created if it does not exist
+    :param str typecode: The typecode of the items, c.f. :mod:`array`
+    :param int length: The number of valid items at the start of the file
+    """
+
+    def __init__(self, path: Path, typecode: str, length: int = 0) -> None:
+        self.path = path
+        self._typecode = typecode
+        self._itemsize = struct.calcsize(typecode)
+        path.touch()
+        self.length = length
+        self._map(max(path.stat().st_size // self._itemsize, length, _INITIAL_CAPACITY))
+
+    def _map(self, capacity: int) -> None:
+        size = capacity * self._itemsize
+        with open(self.path, "r+b") as fp:
+            if os.fstat(fp.fileno()).st_size < size:
+                fp.truncate(size)
+            self._mmap = mmap.mmap(fp.fileno(), size)
+        self.view = memoryview(self._mmap).cast(self._typecode)
+        """The items, including the unused capacity"""
+
+    def _reserve(self, length: int) -> None:
+        capacity = len(self.view)
+        if length > capacity:
+            while capacity < length:
+                capacity *= 2
+            self.close()
+            self._map(capacity)
+
+    def append(self, item: int) -> None:
+        if self.length == len(self.view):
+            self._reserve(self.length + 1)
+        self.view[self.length] = item
+        self.length += 1
+
+    def extend(self, data: bytes) -> None:
+        """Appends bytes to an array of typecode `B`"""
+        end = self.length + len(data)
+        self._reserve(end)
+        self.view[self.length:end] = data
+        self.length = end
+
+    def flush(self) -> None:
+        self._mmap.flush()
+
+    def close(self) -> None:
+        self.view.release()
+        self._mmap.close()
+
+class DiskExplorer(object):
+    """
+    Explores the transition systems of the processes of a :class:`CcsRepresentation` out of core, in a working directory
+
+    :param CcsRepresentation ccs: The representation, whose names have to be valid, c.f. :meth:`FinitePureCcsValidatior.validate_names`
+    :param Path directory: The working directory, which is created if it does not exist
+    :param int memory_states: The maximal number of recently seen states kept in memory
+    :param int checkpoint_interval: The number of expanded states between two checkpoints
+
+    Example:
+    >>> import tempfile
+    >>> from .fast_grammar import parse
+    >>> ccs = parse("A = a.'b.A; B = b.c.B; S = (A | B) \\\\ {b};")
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     explorer = DiskExplorer(ccs, Path(directory))
+    ...     print(explorer.explore("S", pause_after=2))
+    ...     lts = DiskExplorer(ccs, Path(directory)).explore("S")
+    ...     lts.state_count, lts.transition_count, lts.outgoing(0)
+    None
+    (4, 5, [('a', 1)])
+    """
+
+    def __init__(self, ccs: CcsRepresentation, directory: Path, memory_states: int = 1 << 18, checkpoint_interval: int = 1 << 16) -> None:
+        self._ccs = ccs
+        self._directory = Path(directory)
+        self._memory_states = memory_states
+        self._checkpoint_interval = checkpoint_interval
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._table: _MappedArray | None = None
+
+    def explore(self, init: str | Process, max_states: int | None = None, pause_after: int | None = None) -> CompactLts | None:
+        """
+        Explores the states reachable from a process breadth-first, resuming from the checkpoint of the working directory if there is one
+
+        :param str | Process init: The name of the initial process, or the initial process itself
+        :param int | None max_states: The maximal number of states, unbounded if None
+        :param int | None pause_after: The number of states to expand before pausing, unbounded if None
+        :return CompactLts | None: The transition system, whose buffers are views of the files of the working directory, or None if the exploration was paused
+        :raises ValueError: If the state space exceeds `max_states`, or the working directory contains the exploration of another process
+        """
+        explorer = CcsExplorer(self._ccs)
+        initial = explorer.encode(explorer.initial(init))
+
+        with tracing.span("explore_disk") as attributes:
+            resumed = self._open(initial)
+            attributes["resumed_states"] = resumed
+            if not self._done:
+                try:
+                    self._done = self._expand(explorer, max_states, pause_after)
+                except KeyboardInterrupt:
+                    self._checkpoint()
+                    logger.info("Interrupted after %d of %d states", self._starts.length - 1, self._offsets.length - 1)
+                    raise
+                self._checkpoint()
+
+            states, transitions = self._offsets.length - 1, self._targets.length
+            attributes["states"] = states
+            attributes["transitions"] = transitions
+
+        if not self._done:
+            logger.info("Paused after %d of %d states", self._starts.length - 1, states)
+            return None
+        logger.info("Explored %d states and %d transitions", states, transitions)
+        return CompactLts(
+            list(self._labels),
+            self._starts.view[:states + 1],
+            self._label_ids.view[:transitions],
+            self._targets.view[:transitions],
+            None,
+        )
+
+    def key(self, state: int) -> str:
+        """
+        Reads the key of a state of the last exploration, e.g. to describe it with :meth:`CcsExplorer.decode`
+
+        :param int state: The state
+        :return str: The key
+        """
+        return bytes(self._keys.view[self._offsets.view[state]:self._offsets.view[state + 1]]).decode()
+
+    def _open(self, initial: str) -> int:
+        """
+        Opens the files of the working directory, truncated to the last checkpoint, or starts a new exploration
+
+        :param str initial: The key of the initial state
+        :return int: The number of states restored from the checkpoint
+        :raises ValueError: If the checkpoint belongs to the exploration of another process
+        """
+        checkpoint_path = self._directory / _CHECKPOINT
+        checkpoint = json.loads(checkpoint_path.read_text()) if checkpoint_path.exists() else None
+        if checkpoint is not None and checkpoint["version"] != _CHECKPOINT_VERSION:
+            raise ValueError(f"The checkpoint in {self._directory} has an unsupported version")
+        if checkpoint is not None and checkpoint["initial"] != initial:
+            raise ValueError(f"{self._directory} contains the exploration of another process")
+
+        states = checkpoint["states"] if checkpoint else 0
+        expanded = checkpoint["expanded"] if checkpoint else 0
+        transitions = checkpoint["transitions"] if checkpoint else 0
+        self._done: bool = checkpoint["done"] if checkpoint else False
+        self._labels: dict[str, int] = {l: i for i, l in enumerate(checkpoint["labels"])} if checkpoint else {}
+        self._recent: dict[str, int] = {}
+
+        self._offsets = _MappedArray(self._directory / "offsets", "q", states + 1)
+        self._keys = _MappedArray(self._directory / "keys", "B", self._offsets.view[states])
+        self._starts = _MappedArray(self._directory / "starts", "q", expanded + 1)
+        self._label_ids = _MappedArray(self._directory / "labels", "i", transitions)
+        self._targets = _MappedArray(self._directory / "targets", "i", transitions)
+        self._offsets.view[0] = self._starts.view[0] = 0
+
+        if not self._done:
+            slots = _INITIAL_SLOTS
+            while slots < 4 * states:
+                slots *= 2
+            self._rehash(slots)
+        if checkpoint is None:
+            self._visit(initial, None)
+        return states
+
+    def _rehash(self, slots: int) -> None:
+        """
+        Rebuilds the hash table of the visited states with `slots` slots
+
+        The table consists of pairs of a fingerprint and the state plus 1, which is 0 for empty slots.
+        """
+        path = self._directory / "visited.new"
+        # A new file is filled with zeros, i.e. empty slots
+        path.unlink(missing_ok=True)
+        table = _MappedArray(path, "Q", 2 * slots)
+        view = table.view
+        mask = slots - 1
+        for state in range(self._offsets.length - 1):
+            fingerprint = _fingerprint(self._keys.view[self._offsets.view[state]:self._offsets.view[state + 1]])
+            i = fingerprint & mask
+            while view[2 * i + 1]:
+                i = (i + 1) & mask
+            view[2 * i] = fingerprint
+            view[2 * i + 1] = state + 1
+        os.replace(table.path, self._directory / "visited")
+        table.path = self._directory / "visited"
+        if self._table is not None:
+            self._table.close()
+        self._table = table
+        self._slots = slots
+
+    def _visit(self, key: str, max_states: int | None) -> int:
+        """
+        Looks up a state by its key, first in memory and then on disk, and stores it if it is new
+
+        :param str key: The key
+        :param int | None max_states: The maximal number of states, unbounded if None
+        :return int: The state
+        :raises ValueError: If the state is new and the state space exceeds `max_states`
+        """
+        state = self._recent.get(key)
+        if state is not None:
+            return state
+
+        data = key.encode()
+        fingerprint = _fingerprint(data)
+        table, keys, offsets = self._table.view, self._keys.view, self._offsets.view
+        mask = self._slots - 1
+        i = fingerprint & mask
+        while stored := table[2 * i + 1]:
+            if table[2 * i] == fingerprint and keys[offsets[stored - 1]:offsets[stored]] == data:
+                state = stored - 1
+                break
+            i = (i + 1) & mask
+        else:
+            state = self._offsets.length - 1
+            if max_states is not None and state >= max_states:
+                raise ValueError(f"The state space exceeds {max_states} states")
+            self._keys.extend(data)
+            # The offset is appended last, such that an interrupted store is ignored
+            self._offsets.append(self._keys.length)
+            table[2 * i] = fingerprint
+            table[2 * i + 1] = state + 1
+            if 2 * (state + 1) > self._slots:
+                self._rehash(2 * self._slots)
+
+        if len(self._recent) >= self._memory_states:
+            self._recent.clear()
+        self._recent[key] = state
+        return state
+
+    def _expand(self, explorer: CcsExplorer, max_states: int | None, pause_after: int | None) -> bool:
+        """
+        Expands the states of the frontier breadth-first
+
+        :return bool: Whether all states are expanded, otherwise the exploration was paused
+        """
+        expanded = 0
+        while self._starts.length < self._offsets.length:
+            if pause_after is not None and expanded >= pause_after:
+                return False
+            state = self._starts.length - 1
+            term = explorer.decode(self.key(state))
+            # The ids of terms differ between explorers, hence the order of the transitions is fixed by the keys of the targets
+            for l, target in sorted((l, explorer.encode(target)) for l, target in explorer.transitions(term)):
+                label_id = self._labels.get(l)
+                if label_id is None:
+                    label_id = self._labels[l] = len(self._labels)
+                target_state = self._visit(target, max_states)
+                self._label_ids.append(label_id)
+                self._targets.append(target_state)
+            # The start is appended last, such that an interrupted expansion is repeated
+            self._starts.append(self._targets.length)
+            expanded += 1
+
+            if explorer.term_count > _MAX_TERMS:
+                explorer = CcsExplorer(self._ccs)
+            if expanded % self._checkpoint_interval == 0:
+                self._checkpoint()
+        return True
+
+    def _checkpoint(self) -> None:
+        """Flushes the files and atomically replaces the checkpoint by the state of the last completely expanded state"""
+        for array in (self._offsets, self._keys, self._starts, self._label_ids, self._targets):
+            array.flush()
+        expanded = self._starts.length - 1
+        checkpoint = {
+            "version": _CHECKPOINT_VERSION,
+            "initial": self.key(0),
+            "states": self._offsets.length - 1,
+            "expanded": expanded,
+            "transitions": self._starts.view[expanded],
+            "labels": list(self._labels),
+            "done": self._done,
+        }
+        fd, temporary = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as fp:
+            json.dump(checkpoint, fp)
+        os.replace(temporary, self._directory / _CHECKPOINT)
@@ -0,0 +1,314 @@
+"""
+Fast CCS Parser
+
+This file contains a hand-written tokenizer and precedence climbing parser for the CCS grammar used by CAAL (https://caal.cs.aau.dk).
+It accepts the same language as :mod:`ccs2bigraph.ccs.grammar` and builds the same :class:`CcsRepresentation`, but avoids the overhead of pyparsing's packrat-enabled `infix_notation`.
+
+Operator precedence (from strongest to weakest binding):
+- renaming, e.g. "A[b/a]" (postfix, consecutive renamings are combined into one :class:`RenamingProcess`)
+- hiding, e.g. "A \\ {a, b}" or "A \\ H" (postfix)
+- prefixing by actions, e.g. "a.0" (prefix, right associative)
+- parallel composition, e.g. "a.0 | B | 0" (infix, n-ary)
+- alternative composition, e.g. "a.0 + B + 0" (infix, n-ary)
+
+Note, that consecutive hidings like "A \\ H \\ K" are nested, whereas the pyparsing grammar silently drops all but the first one.
+"""
+
+import logging
+logger = logging.getLogger(__name__)
+
+import re
+import typing as tp
+
+from .representation import Action, ActionIndex, ActionSet, ActionSetAssignment, Renaming, SumProcesses, CcsRepresentation, DualAction, HidingProcess, ActionSetByName, ProcessByName, NilProcess, ParallelProcesses, PrefixedProcess, ProcessAssignment, RenamingProcess, Process
+
+# Token kinds
+_NAME = "name"      # Process and action set names, starting with an uppercase character
+_ACTION = "action"  # Action names, starting with a lowercase character
+_SYMBOL = "symbol"  # Operators, parentheses and the nil process
+_END = "end"        # End of input
+
+_TOKEN_RE = re.compile(r"""
+      (?P<skip>\s+|\*[^\n]*)
+    | (?P<name>[A-Z][A-Za-z0-9!\#'\-?^_]*)
+    | (?P<action>[a-z][A-Za-z0-9]*)
+    | (?P<symbol>[0.|+\\\[\]/,{}=;'()])
+""", re.VERBOSE)
+
+_Token = tuple[str, str, int]
+"""A token, consisting of its kind, its text and its offset in the input"""
+
+# Binding power and constructor of the n-ary infix operators
+_INFIX_OPERATORS: dict[str, tuple[int, tp.Callable[[list[Process]], Process]]] = {
+    "+": (1, SumProcesses),
+    "|": (2, ParallelProcesses),
+}
+
+def tokenize(raw: str) -> list[_Token]:
+    """
+    Splits a CCS input into tokens, skipping whitespace and comments.
+
+    :param str raw: The CCS input
+    :return list[_Token]: The tokens, terminated by an end token
+
+    Example:
+    >>> [t[1] for t in tokenize("A = 'a.B; * comment")]
+    ['A', '=', "'", 'a', '.', 'B', ';', '']
+    """
+    tokens: list[_Token] = []
+    append = tokens.append
+    pos = 0
+    end = len(raw)
+    match = _TOKEN_RE.match
+
+    while pos < end:
+        m = match(raw, pos)
+        if m is None:
+            raise ValueError(f"Unexpected character {raw[pos]!r} at {_location(raw, pos)}")
+        kind = tp.cast(str, m.lastgroup)
+        if kind != "skip":
+            append((kind, m.group(), pos))
+        pos = m.end()
+
+    append((_END, "", end))
+    return tokens
+
+def _location(raw: str, pos: int) -> str:
+    """
+    Formats an offset in the input as human readable line and column
+
+    :param str raw: The CCS input
+    :param int pos: The offset in the input
+    :return str: The location, e.g. "line 1, column 3"
+    """
+    line = raw.count("\n", 0, pos) + 1
+    column = pos - (raw.rfind("\n", 0, pos) + 1) + 1
+    return f"line {line}, column {column}"
+
+class _Parser(object):
+    """
+    Precedence climbing parser over the tokens of a CCS input
+
+    :param str raw: The CCS input
+    """
+
+    def __init__(self, raw: str) -> None:
+        self._raw = raw
+        self._tokens = tokenize(raw)
+        self._pos = 0
+        # The (non-dual) actions used by the current statement, c.f. ActionIndex
+        self._actions: dict[Action, None] = {}
+
+    def _peek(self) -> _Token:
+        return self._tokens[self._pos]
+
+    def _next(self) -> _Token:
+        token = self._tokens[self._pos]
+        self._pos += 1
+        return token
+
+    def _error(self, expected: str) -> ValueError:
+        _, text, offset = self._peek()
+        found = repr(text) if text else "end of input"
+        return ValueError(f"Expected {expected}, found {found} at {_location(self._raw, offset)}")
+
+    def _expect(self, symbol: str) -> None:
+        kind, text, _ = self._peek()
+        if kind != _SYMBOL or text != symbol:
+            raise self._error(repr(symbol))
+        self._pos += 1
+
+    def _expect_kind(self, kind: str, expected: str) -> str:
+        token_kind, text, _ = self._peek()
+        if token_kind != kind:
+            raise self._error(expected)
+        self._pos += 1
+        return text
+
+    def _action(self) -> Action:
+        """action ::= name | "'" name"""
+        kind, text, _ = self._peek()
+        if kind == _SYMBOL and text == "'":
+            self._pos += 1
+            return DualAction(self._expect_kind(_ACTION, "action"))
+        return Action(self._expect_kind(_ACTION, "action"))
+
+    def _action_set(self) -> ActionSet:
+        """action_set ::= "{" name ("," name)* "}" """
+        self._expect("{")
+        actions = [Action(self._expect_kind(_ACTION, "action"))]
+        while self._peek()[1] == ",":
+            self._pos += 1
+            actions.append(Action(self._expect_kind(_ACTION, "action")))
+        self._expect("}")
+        return ActionSet(actions)
+
+    def _atom(self) -> Process:
+        """atom ::= "0" | Name | "(" expression ")" """
+        kind, text, _ = self._next()
+        if kind == _NAME:
+            return ProcessByName(text)
+        if kind == _SYMBOL and text == "0":
+            return NilProcess()
+        if kind == _SYMBOL and text == "(":
+            inner = self._expression(0)
+            self._expect(")")
+            return inner
+        self._pos -= 1
+        raise self._error("process")
+
+    def _postfixed(self) -> Process:
+        """postfixed ::= atom ("[" renaming ("," renaming)* "]")* ("\\" (action_set | Name))*"""
+        process = self._atom()
+
+        renamings: list[Renaming] = []
+        while self._peek()[1] == "[":
+            self._pos += 1
+            while True:
+                new = self._action()
+                self._expect("/")
+                renamings.append(Renaming(new, self._action()))
+                self._actions[Action(new.name)] = None
+                if self._peek()[1] != ",":
+                    break
+                self._pos += 1
+            self._expect("]")
+        if renamings:
+            process = RenamingProcess(process, renamings)
+
+        while self._peek()[1] == "\\":
+            self._pos += 1
+            kind, text, _ = self._peek()
+            if kind == _NAME:
+                self._pos += 1
+                process = HidingProcess(process, ActionSetByName(text))
+            else:
+                action_set = self._action_set()
+                self._actions.update(dict.fromkeys(action_set.actions))
+                process = HidingProcess(process, action_set)
+
+        return process
+
+    def _prefixed(self) -> Process:
+        """prefixed ::= (action ".")* postfixed"""
+        # Collect the prefixes iteratively, so that long chains do not exhaust the stack
+        prefixes: list[Action] = []
+        tokens = self._tokens
+        while True:
+            kind, text, _ = tokens[self._pos]
+            if kind == _ACTION and tokens[self._pos + 1][1] == ".":
+                prefixes.append(Action(text))
+                self._actions[prefixes[-1]] = None
+                self._pos += 2
+            elif kind == _SYMBOL and text == "'" and tokens[self._pos + 1][0] == _ACTION and tokens[self._pos + 2][1] == ".":
+                prefixes.append(DualAction(tokens[self._pos + 1][1]))
+                self._actions[Action(prefixes[-1].name)] = None
+                self._pos += 3
+            else:
+                break
+
+        process = self._postfixed()
+        for prefix in reversed(prefixes):
+            process = PrefixedProcess(prefix, process)
+        return process
+
+    def _expression(self, min_power: int) -> Process:
+        """
+        expression ::= prefixed (("+" | "|") prefixed)*, respecting the binding powers of `_INFIX_OPERATORS`
+
+        Chains of the same operator are collected into a single n-ary process.
+
+        :param int min_power: The minimal binding power of operators to consume
+        """
+        left = self._prefixed()
+        while True:
+            _, operator, _ = self._peek()
+            if operator not in _INFIX_OPERATORS:
+                return left
+            power, constructor = _INFIX_OPERATORS[operator]
+            if power < min_power:
+                return left
+
+            operands = [left]
+            while self._peek()[1] == operator:
+                self._pos += 1
+                operands.append(self._expression(power + 1))
+            left = constructor(operands)
+
+    def statement(self) -> ProcessAssignment | ActionSetAssignment:
+        """statement ::= Name "=" expression ";" | "set" Name "=" action_set ";" """
+        self._actions = {}
+        kind, text, _ = self._peek()
+        if kind == _ACTION and text == "set":
+            self._pos += 1
+            name = self._expect_kind(_NAME, "action set name")
+            self._expect("=")
+            action_set = self._action_set()
+            self._expect(";")
+            return ActionSetAssignment(name, action_set)
+
+        name = self._expect_kind(_NAME, "process name")
+        self._expect("=")
+        process = self._expression(0)
+        self._expect(";")
+        return ProcessAssignment(name, process)
+
+    def expect_end(self) -> None:
+        if self._peek()[0] != _END:
+            raise self._error("end of input")
+
+    def ccs(self) -> CcsRepresentation:
+        """ccs ::= statement*"""
+        process_assignments: list[ProcessAssignment] = []
+        action_set_assignments: list[ActionSetAssignment] = []
+        # Record the actions while parsing, instead of walking the finished representation again
+        process_actions: list[dict[Action, None]] = []
+
+        while self._peek()[0] != _END:
+            statement = self.statement()
+            if isinstance(statement, ProcessAssignment):
+                process_assignments.append(statement)
+                process_actions.append(self._actions)
+            else:
+                action_set_assignments.append(statement)
+
+        # Same order as an index built by CcsRepresentation, i.e. action sets first
+        alphabet = ActionIndex()
+        for asa in action_set_assignments:
+            alphabet.add_action_set(asa.name, asa.actionSet.actions)
+        for pa, actions in zip(process_assignments, process_actions):
+            alphabet.add_process(pa.name, actions)
+
+        return CcsRepresentation(process_assignments, action_set_assignments, alphabet)
+
+def parse_statement(raw: str) -> ProcessAssignment | ActionSetAssignment:
+    """
+    Parsing of a single `;`-terminated process or action set assignment
+
+    :param str raw: The CCS input, consisting of exactly one statement
+    :return ProcessAssignment | ActionSetAssignment: The parsed statement
+    :raises ValueError: If the input is not a valid CCS statement
+
+    Example:
+    >>> str(parse_statement("set H = {a, b};"))
+    'set H = {a, b};'
+    """
+    parser = _Parser(raw)
+    statement = parser.statement()
+    parser.expect_end()
+    return statement
+
+def parse(raw: str) -> CcsRepresentation:
+    """
+    CCS Process file (c.f. CAAL input) parsing
+
+    :param str raw: The CCS input
+    :return CcsRepresentation: The parsed CCS input
+    :raises ValueError: If the input is not valid CCS
+
+    Example:
+    >>> str(parse("A = a.0 + 'b.A;").process_assignments[0])
+    "A = ((a.0) + ('b.A));"
+    """
+    logger.info("Parsing with the fast parser")
+    return _Parser(raw).ccs()
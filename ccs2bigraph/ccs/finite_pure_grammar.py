@@ -19,98 +19,124 @@ Note, that expressions like "0 + 0" or even "P + 0" for any P are not valid in t
 We implement this as a multi-layer infix grammar
 """
 
+from __future__ import annotations
+
 import logging
 logger = logging.getLogger(__name__)
 
-import pyparsing as pp
+import functools
 import typing as tp
 
+if tp.TYPE_CHECKING:
+    import pyparsing as pp
+
 from .representation import Action, ActionSet, SumProcesses, DualAction, HidingProcess, NilProcess, ParallelProcesses, PrefixedProcess, Process
 
-# Performance
-pp.ParserElement.enable_packrat()
+_GRAMMAR_ELEMENTS = ("_action", "_process")
+"""Grammar elements which are accessible as module attributes, c.f. :func:`__getattr__`"""
 
-# Comments
-_comment = pp.Literal("*") + pp.restOfLine
+@functools.cache
+def _build_grammar() -> dict[str, pp.ParserElement]:
+    """
+    Constructs the pyparsing grammar on first use, c.f. :func:`ccs2bigraph.ccs.grammar._build_grammar`.
 
-# atomic elements: Actions
-_raw_action = pp.Word(pp.alphas.lower(), pp.alphanums)
-_dual_action = pp.Suppress("'") + _raw_action.copy()
+    :return dict[str, pp.ParserElement]: The elements listed in `_GRAMMAR_ELEMENTS` by name
+    """
+    import pyparsing as pp
 
-def _raw_action_parse_action(pr: pp.ParseResults) -> Action:
-    return Action(tp.cast(str, pr[0]))
+    # Performance
+    pp.ParserElement.enable_packrat()
 
-_raw_action.setParseAction(_raw_action_parse_action)
+    # Comments
+    _comment = pp.Literal("*") + pp.restOfLine
 
-def _dual_action_parse_action(pr: pp.ParseResults) -> DualAction:
-    return DualAction(tp.cast(str, pr[0]))
+    # atomic elements: Actions
+    _raw_action = pp.Word(pp.alphas.lower(), pp.alphanums)
+    _dual_action = pp.Suppress("'") + _raw_action.copy()
 
-_dual_action.setParseAction(_dual_action_parse_action)
+    def _raw_action_parse_action(pr: pp.ParseResults) -> Action:
+        return Action(tp.cast(str, pr[0]))
 
-_action = _raw_action | _dual_action
+    _raw_action.setParseAction(_raw_action_parse_action)
 
-# process defintion and operations
-# 0 process
-_nil_process = pp.Suppress('0')
-_nil_process.setParseAction(NilProcess)
+    def _dual_action_parse_action(pr: pp.ParseResults) -> DualAction:
+        return DualAction(tp.cast(str, pr[0]))
 
-# hiding
-def _hiding_parse_action(pr: pp.ParseResults) -> HidingProcess:
-    return HidingProcess(
-        tp.cast(Process, pr[0][1]), 
-        ActionSet([tp.cast(Action, pr[0][0])])
-    )
+    _dual_action.setParseAction(_dual_action_parse_action)
+
+    _action = _raw_action | _dual_action
+
+    # process defintion and operations
+    # 0 process
+    _nil_process = pp.Suppress('0')
+    _nil_process.setParseAction(NilProcess)
 
-_hiding_operator = pp.Suppress('/')
-_hiding = _hiding_operator + _raw_action
+    # hiding
+    def _hiding_parse_action(pr: pp.ParseResults) -> HidingProcess:
+        return HidingProcess(
+            tp.cast(Process, pr[0][1]), 
+            ActionSet([tp.cast(Action, pr[0][0])])
+        )
 
-# parallel
-_parallel_operator = pp.Suppress('|')
+    _hiding_operator = pp.Suppress('/')
+    _hiding = _hiding_operator + _raw_action
 
-def _parallel_parse_action(pr: pp.ParseResults) -> ParallelProcesses:
-    return ParallelProcesses(tp.cast(list[Process], pr.as_list()[0])) # pyright: ignore[reportUnknownMemberType]
+    # parallel
+    _parallel_operator = pp.Suppress('|')
 
-# process will be defined as an infix grammar
-_process = pp.Forward()
+    def _parallel_parse_action(pr: pp.ParseResults) -> ParallelProcesses:
+        return ParallelProcesses(tp.cast(list[Process], pr.as_list()[0])) # pyright: ignore[reportUnknownMemberType]
 
-# alternative operations
+    # process will be defined as an infix grammar
+    _process = pp.Forward()
 
-# prefix
-def _prefix_parse_action(pr: pp.ParseResults) -> PrefixedProcess:
-    return PrefixedProcess(
-        tp.cast(Action, pr[0]),  
-        tp.cast(Process, pr[1])
+    # alternative operations
+
+    # prefix
+    def _prefix_parse_action(pr: pp.ParseResults) -> PrefixedProcess:
+        return PrefixedProcess(
+            tp.cast(Action, pr[0]),  
+            tp.cast(Process, pr[1])
+        )
+    _prefix_operator = pp.Suppress('.')
+    _prefix = _action + _prefix_operator + _process
+    _prefix.setParseAction(_prefix_parse_action)
+
+    # sums
+    def _sum_parse_action(pr: pp.ParseResults) -> SumProcesses:
+        return SumProcesses(tp.cast(list[Process], pr.as_list()[0])) # pyright: ignore[reportUnknownMemberType]
+    _sum_operator = pp.Suppress('+')
+
+    _alternative_atom = _prefix
+    _alternative = pp.infix_notation(
+        _alternative_atom,
+        [
+            (_sum_operator, 2, pp.opAssoc.LEFT, _sum_parse_action)
+        ]
     )
-_prefix_operator = pp.Suppress('.')
-_prefix = _action + _prefix_operator + _process
-_prefix.setParseAction(_prefix_parse_action)
-
-# sums
-def _sum_parse_action(pr: pp.ParseResults) -> SumProcesses:
-    return SumProcesses(tp.cast(list[Process], pr.as_list()[0])) # pyright: ignore[reportUnknownMemberType]
-_sum_operator = pp.Suppress('+')
-
-_alternative_atom = _prefix
-_alternative = pp.infix_notation(
-    _alternative_atom,
-    [
-        (_sum_operator, 2, pp.opAssoc.LEFT, _sum_parse_action)
-    ]
-)
-
-# finish process defintion
-_process_atom = _nil_process
-_process <<= pp.infix_notation(
-    _process_atom,
-    [
-        (_parallel_operator, 2, pp.opAssoc.LEFT, _parallel_parse_action),
-        (_hiding, 1, pp.opAssoc.RIGHT, _hiding_parse_action),
-    ]
-) | _alternative
+
+    # finish process defintion
+    _process_atom = _nil_process
+    _process <<= pp.infix_notation(
+        _process_atom,
+        [
+            (_parallel_operator, 2, pp.opAssoc.LEFT, _parallel_parse_action),
+            (_hiding, 1, pp.opAssoc.RIGHT, _hiding_parse_action),
+        ]
+    ) | _alternative
+
+    elements = locals()
+    return {name: elements[name] for name in _GRAMMAR_ELEMENTS}
+
+def __getattr__(name: str) -> tp.Any:
+    """Lazily provides the grammar elements, e.g. `_action`, as module attributes"""
+    if name in _GRAMMAR_ELEMENTS:
+        return _build_grammar()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def parse(raw: str) -> Process:
     """pure finite CCS parsing"""
-    logger.info(f"Trying to parse {raw}")
-    res = tp.cast(Process, _process.parse_string(raw, True)[0])
-    logger.info(f"Done parsing {raw}")
+    logger.info("Trying to parse %d characters", len(raw))
+    res = tp.cast(Process, _build_grammar()["_process"].parse_string(raw, True)[0])
+    logger.info("Done parsing %d characters", len(raw))
     return res
\ No newline at end of file
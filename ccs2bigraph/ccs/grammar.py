@@ -21,165 +21,284 @@ We implement these rules as an infix grammar.
 Furthermore, Actions and Action-Sets as well as corresponding assignments are implemented.
 """
 
+from __future__ import annotations
+
 import logging
 logger = logging.getLogger(__name__)
 
-import pyparsing as pp
+import functools
+import re
 import typing as tp
 
+if tp.TYPE_CHECKING:
+    import pyparsing as pp
+
 from .representation import Action, ActionSet, ActionSetAssignment, Renaming, SumProcesses, CcsRepresentation, DualAction, HidingProcess, ActionSetByName, ProcessByName, NilProcess, ParallelProcesses, PrefixedProcess, ProcessAssignment, RenamingProcess, Process
+from . import fast_grammar
+from .. import tracing
+
+Engine = tp.Literal["pyparsing", "fast"]
+"""Available parser engines: the pyparsing grammar below, or the hand-written parser in :mod:`fast_grammar`"""
+
+ENGINES: tuple[Engine, ...] = tp.get_args(Engine)
+
+_GRAMMAR_ELEMENTS = ("_action", "_actionset", "_actionset_assignment", "_process", "_process_assignment", "_ccs", "_statement")
+"""Grammar elements which are accessible as module attributes, c.f. :func:`__getattr__`"""
+
+@functools.cache
+def _build_grammar() -> dict[str, pp.ParserElement]:
+    """
+    Constructs the pyparsing grammar on first use.
+
+    Importing pyparsing, building the grammar and enabling packrat parsing is costly, hence it is deferred until the pyparsing engine is actually used.
+
+    :return dict[str, pp.ParserElement]: The elements listed in `_GRAMMAR_ELEMENTS` by name
+    """
+    import pyparsing as pp
 
-# Performance
-pp.ParserElement.enable_packrat()
+    # Performance
+    pp.ParserElement.enable_packrat()
 
-# Comments
-_comment = pp.Literal("*") + pp.restOfLine
+    # Comments
+    _comment = pp.Literal("*") + pp.restOfLine
 
-# atomic elements: Actions
-_raw_action = pp.Word(pp.alphas.lower(), pp.alphanums)
-_dual_action = pp.Suppress("'") + _raw_action.copy()
+    # atomic elements: Actions
+    _raw_action = pp.Word(pp.alphas.lower(), pp.alphanums)
+    _dual_action = pp.Suppress("'") + _raw_action.copy()
 
-def _raw_action_parse_action(pr: pp.ParseResults) -> Action:
-    return Action(tp.cast(str, pr[0]))
+    def _raw_action_parse_action(pr: pp.ParseResults) -> Action:
+        return Action(tp.cast(str, pr[0]))
 
-_raw_action.setParseAction(_raw_action_parse_action)
+    _raw_action.setParseAction(_raw_action_parse_action)
 
-def _dual_action_parse_action(pr: pp.ParseResults) -> DualAction:
-    return DualAction(tp.cast(str, pr[0]))
+    def _dual_action_parse_action(pr: pp.ParseResults) -> DualAction:
+        return DualAction(tp.cast(str, pr[0]))
 
-_dual_action.setParseAction(_dual_action_parse_action)
+    _dual_action.setParseAction(_dual_action_parse_action)
 
-_action = _raw_action | _dual_action
+    _action = _raw_action | _dual_action
 
-# sets of actions:
-_l_actionset_parenthesis, _r_actionset_parenthesis = map(pp.Suppress, ['{', '}'])
-_actionset_separator = pp.Suppress(',')
-_actionset = _l_actionset_parenthesis + pp.ZeroOrMore(_raw_action + _actionset_separator) + _raw_action + _r_actionset_parenthesis
+    # sets of actions:
+    _l_actionset_parenthesis, _r_actionset_parenthesis = map(pp.Suppress, ['{', '}'])
+    _actionset_separator = pp.Suppress(',')
+    _actionset = _l_actionset_parenthesis + pp.ZeroOrMore(_raw_action + _actionset_separator) + _raw_action + _r_actionset_parenthesis
 
-def _actionset_parse_action(pr: pp.ParseResults) -> ActionSet:
-    return ActionSet(tp.cast(list[Action], pr.as_list())) # pyright: ignore[reportUnknownMemberType]
+    def _actionset_parse_action(pr: pp.ParseResults) -> ActionSet:
+        return ActionSet(tp.cast(list[Action], pr.as_list())) # pyright: ignore[reportUnknownMemberType]
 
-_actionset.setParseAction(_actionset_parse_action)
+    _actionset.setParseAction(_actionset_parse_action)
 
-_actionset_name = pp.Word(pp.alphas.upper(), pp.alphanums + "!#'-?^_")
+    _actionset_name = pp.Word(pp.alphas.upper(), pp.alphanums + "!#'-?^_")
 
-def _actionset_name_parse_action(pr: pp.ParseResults) -> ActionSetByName:
-    return ActionSetByName(tp.cast(str, pr[0]))
+    def _actionset_name_parse_action(pr: pp.ParseResults) -> ActionSetByName:
+        return ActionSetByName(tp.cast(str, pr[0]))
 
-_actionset_name.set_parse_action(_actionset_name_parse_action)
+    _actionset_name.set_parse_action(_actionset_name_parse_action)
 
-_actionset_assignment_keyword = pp.Suppress("set")
-_actionset_assignment_name = pp.Word(pp.alphas.upper(), pp.alphanums + "!#'-?^_")
-_actionset_assignment_operator = pp.Suppress("=")
-_actionset_assignment_finalizer = pp.Suppress(";")
-_actionset_assignment = _actionset_assignment_keyword + _actionset_assignment_name + _actionset_assignment_operator + _actionset + _actionset_assignment_finalizer
+    _actionset_assignment_keyword = pp.Suppress("set")
+    _actionset_assignment_name = pp.Word(pp.alphas.upper(), pp.alphanums + "!#'-?^_")
+    _actionset_assignment_operator = pp.Suppress("=")
+    _actionset_assignment_finalizer = pp.Suppress(";")
+    _actionset_assignment = _actionset_assignment_keyword + _actionset_assignment_name + _actionset_assignment_operator + _actionset + _actionset_assignment_finalizer
 
-def _actionset_assignment_parse_action(pr: pp.ParseResults) -> ActionSetAssignment:
-    return ActionSetAssignment(tp.cast(str, pr[0]), tp.cast(ActionSet, pr[1]))
+    def _actionset_assignment_parse_action(pr: pp.ParseResults) -> ActionSetAssignment:
+        return ActionSetAssignment(tp.cast(str, pr[0]), tp.cast(ActionSet, pr[1]))
 
-_actionset_assignment.setParseAction(_actionset_assignment_parse_action)
+    _actionset_assignment.setParseAction(_actionset_assignment_parse_action)
 
-# processes
-# we do need a notion of processes already at this point, however they aren't (fully) defined yet.
-_process_name = pp.Word(pp.alphas.upper(), pp.alphanums + "!#'-?^_")
+    # processes
+    # we do need a notion of processes already at this point, however they aren't (fully) defined yet.
+    _process_name = pp.Word(pp.alphas.upper(), pp.alphanums + "!#'-?^_")
 
-def _process_name_parse_action(pr: pp.ParseResults) -> ProcessByName:
-    return ProcessByName(tp.cast(str, pr[0]))
+    def _process_name_parse_action(pr: pp.ParseResults) -> ProcessByName:
+        return ProcessByName(tp.cast(str, pr[0]))
 
-_process_name.setParseAction(_process_name_parse_action)
+    _process_name.setParseAction(_process_name_parse_action)
 
-# empty process as starting point
-_nil_process = pp.Suppress('0')
-_nil_process.setParseAction(NilProcess)
+    # empty process as starting point
+    _nil_process = pp.Suppress('0')
+    _nil_process.setParseAction(NilProcess)
 
-_process_atom = _process_name | _nil_process
+    _process_atom = _process_name | _nil_process
 
-# define the infix grammar rules
-_prefix_operator = pp.Suppress('.')
-_parallel_operator = pp.Suppress('|')
-_alternative_operator = pp.Suppress('+')
+    # define the infix grammar rules
+    _prefix_operator = pp.Suppress('.')
+    _parallel_operator = pp.Suppress('|')
+    _alternative_operator = pp.Suppress('+')
 
-_hiding_operator = pp.Suppress('\\')
-_hiding_rule = _hiding_operator + (_actionset | _actionset_name)
+    _hiding_operator = pp.Suppress('\\')
+    _hiding_rule = _hiding_operator + (_actionset | _actionset_name)
 
-_l_renaming_operator, _r_renaming_operator = map(pp.Suppress, ['[', ']'])
-_inner_renaming_operator = pp.Suppress("/")
-_inner_renaming = pp.Group(_action + _inner_renaming_operator + _action)
-_inner_renaming_seperator = pp.Suppress(",")
-_renaming_rule = _l_renaming_operator + pp.ZeroOrMore(_inner_renaming + _inner_renaming_seperator) + _inner_renaming + _r_renaming_operator
+    _l_renaming_operator, _r_renaming_operator = map(pp.Suppress, ['[', ']'])
+    _inner_renaming_operator = pp.Suppress("/")
+    _inner_renaming = pp.Group(_action + _inner_renaming_operator + _action)
+    _inner_renaming_seperator = pp.Suppress(",")
+    _renaming_rule = _l_renaming_operator + pp.ZeroOrMore(_inner_renaming + _inner_renaming_seperator) + _inner_renaming + _r_renaming_operator
 
-# define parse actions for individual operators
-def _renaming_parse_action(pr: pp.ParseResults) -> RenamingProcess:
-    return RenamingProcess(
-        tp.cast(Process, pr[0][0]), 
-        list(
-            Renaming(r[0], r[1]) 
-            for r 
-            in tp.cast(list[tuple[Action, Action]], pr[0][1:])
+    # define parse actions for individual operators
+    def _renaming_parse_action(pr: pp.ParseResults) -> RenamingProcess:
+        return RenamingProcess(
+            tp.cast(Process, pr[0][0]), 
+            list(
+                Renaming(r[0], r[1]) 
+                for r 
+                in tp.cast(list[tuple[Action, Action]], pr[0][1:])
+            )
         )
-    )
 
-def _hiding_parse_action(pr: pp.ParseResults) -> HidingProcess:
-    return HidingProcess(
-        tp.cast(Process, pr[0][0]), 
-        tp.cast(ActionSet | ActionSetByName, pr[0][1])
-    )
+    def _hiding_parse_action(pr: pp.ParseResults) -> HidingProcess:
+        return HidingProcess(
+            tp.cast(Process, pr[0][0]), 
+            tp.cast(ActionSet | ActionSetByName, pr[0][1])
+        )
 
-def _prefixed_parse_action(pr: pp.ParseResults) -> PrefixedProcess:
-    return PrefixedProcess(
-        tp.cast(Action, pr[0][0]), 
-        tp.cast(Process, pr[0][1])
-    )
+    def _prefixed_parse_action(pr: pp.ParseResults) -> PrefixedProcess:
+        return PrefixedProcess(
+            tp.cast(Action, pr[0][0]), 
+            tp.cast(Process, pr[0][1])
+        )
 
-def _parallel_parse_action(pr: pp.ParseResults) -> ParallelProcesses:
-    return ParallelProcesses(tp.cast(list[Process], pr.as_list()[0])) # pyright: ignore[reportUnknownMemberType]
-
-def _alternative_parse_action(pr: pp.ParseResults) -> SumProcesses:
-    return SumProcesses(tp.cast(list[Process], pr.as_list()[0])) # pyright: ignore[reportUnknownMemberType]
-
-# overall process definition including operators
-_process = pp.infix_notation(
-    _process_atom,
-    [
-        # (_renaming_rule, 1, pp.opAssoc.LEFT, lambda t: RenamingProcess(t[0][0], list((tt[0], tt[1]) for tt in t[0][1:]))),
-        (_renaming_rule, 1, pp.opAssoc.LEFT, _renaming_parse_action),
-        (_hiding_rule, 1, pp.opAssoc.LEFT, _hiding_parse_action),
-        (_action + _prefix_operator, 1, pp.opAssoc.RIGHT, _prefixed_parse_action),
-        (_parallel_operator, 2, pp.opAssoc.LEFT, _parallel_parse_action),
-        (_alternative_operator, 2, pp.opAssoc.LEFT, _alternative_parse_action)
-    ]
-)
-
-# process assignment
-_process_assignment_name = pp.Word(pp.alphas.upper(), pp.alphanums + "!#'-?^_")
-_process_assignment_operator = pp.Suppress('=')
-_process_assignment_finalizer = pp.Suppress(';')
-_process_assignment = _process_assignment_name + _process_assignment_operator + _process + _process_assignment_finalizer
-
-def _process_assignment_parse_action(pr: pp.ParseResults) -> ProcessAssignment:
-    return ProcessAssignment(
-        tp.cast(str, pr[0]),
-        tp.cast(Process, pr[1])
+    def _parallel_parse_action(pr: pp.ParseResults) -> ParallelProcesses:
+        return ParallelProcesses(tp.cast(list[Process], pr.as_list()[0])) # pyright: ignore[reportUnknownMemberType]
+
+    def _alternative_parse_action(pr: pp.ParseResults) -> SumProcesses:
+        return SumProcesses(tp.cast(list[Process], pr.as_list()[0])) # pyright: ignore[reportUnknownMemberType]
+
+    # overall process definition including operators
+    _process = pp.infix_notation(
+        _process_atom,
+        [
+            # (_renaming_rule, 1, pp.opAssoc.LEFT, lambda t: RenamingProcess(t[0][0], list((tt[0], tt[1]) for tt in t[0][1:]))),
+            (_renaming_rule, 1, pp.opAssoc.LEFT, _renaming_parse_action),
+            (_hiding_rule, 1, pp.opAssoc.LEFT, _hiding_parse_action),
+            (_action + _prefix_operator, 1, pp.opAssoc.RIGHT, _prefixed_parse_action),
+            (_parallel_operator, 2, pp.opAssoc.LEFT, _parallel_parse_action),
+            (_alternative_operator, 2, pp.opAssoc.LEFT, _alternative_parse_action)
+        ]
     )
 
-_process_assignment.setParseAction(_process_assignment_parse_action)
+    # process assignment
+    _process_assignment_name = pp.Word(pp.alphas.upper(), pp.alphanums + "!#'-?^_")
+    _process_assignment_operator = pp.Suppress('=')
+    _process_assignment_finalizer = pp.Suppress(';')
+    _process_assignment = _process_assignment_name + _process_assignment_operator + _process + _process_assignment_finalizer
 
-# overall grammar for multiple process or action set assignments, corresponds to input files.
-_ccs = pp.ZeroOrMore(_process_assignment | _actionset_assignment)
-_ccs.ignore(_comment)
+    def _process_assignment_parse_action(pr: pp.ParseResults) -> ProcessAssignment:
+        return ProcessAssignment(
+            tp.cast(str, pr[0]),
+            tp.cast(Process, pr[1])
+        )
 
-def _ccs_parse_action(pr: pp.ParseResults) -> CcsRepresentation:
-    res = CcsRepresentation(
-        list(filter(lambda r: isinstance(r, ProcessAssignment), pr)), # pyright: ignore[reportUnnecessaryIsInstance]
-        list(filter(lambda r: isinstance(r, ActionSetAssignment), pr)) # pyright: ignore[reportUnnecessaryIsInstance]
-    )
+    _process_assignment.setParseAction(_process_assignment_parse_action)
 
-    return res
+    # overall grammar for multiple process or action set assignments, corresponds to input files.
+    _ccs = pp.ZeroOrMore(_process_assignment | _actionset_assignment)
+    _ccs.ignore(_comment)
 
-_ccs.set_parse_action(_ccs_parse_action)
+    def _ccs_parse_action(pr: pp.ParseResults) -> CcsRepresentation:
+        res = CcsRepresentation(
+            list(filter(lambda r: isinstance(r, ProcessAssignment), pr)), # pyright: ignore[reportUnnecessaryIsInstance]
+            list(filter(lambda r: isinstance(r, ActionSetAssignment), pr)) # pyright: ignore[reportUnnecessaryIsInstance]
+        )
 
-def parse(raw: str) -> CcsRepresentation:
-    """CCS Process file (c.f. CAAL input) parsing"""
-    logger.info(f"Parsing {raw}")
-    res = tp.cast(CcsRepresentation, _ccs.parse_string(raw, True)[0])
-    return res
+        return res
+
+    _ccs.set_parse_action(_ccs_parse_action)
+
+    # single statement, used when parsing streams statement by statement
+    _statement = _process_assignment | _actionset_assignment
+    _statement.ignore(_comment)
+
+    elements = locals()
+    return {name: elements[name] for name in _GRAMMAR_ELEMENTS}
+
+def __getattr__(name: str) -> tp.Any:
+    """Lazily provides the grammar elements, e.g. `_action`, as module attributes"""
+    if name in _GRAMMAR_ELEMENTS:
+        return _build_grammar()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def parse(raw: str, engine: Engine = "pyparsing") -> CcsRepresentation:
+    """
+    CCS Process file (c.f. CAAL input) parsing
+
+    :param str raw: The CCS input
+    :param Engine engine: The parser to use, either the pyparsing grammar or the hand-written "fast" parser
+    """
+    with tracing.span("parse", engine=engine, characters=len(raw)):
+        match engine:
+            case "pyparsing":
+                logger.info("Parsing %d characters", len(raw))
+                res = tp.cast(CcsRepresentation, _build_grammar()["_ccs"].parse_string(raw, True)[0])
+                return res
+            case "fast":
+                return fast_grammar.parse(raw)
+            case _: # pyright: ignore[reportUnnecessaryComparison]
+                raise ValueError(f"Unknown parser engine {engine!r}")
+
+
+_STATEMENT_DELIMITERS = re.compile(r"[;*]")
+
+def _split_statements(stream: tp.TextIO, chunk_size: int) -> tp.Iterator[str]:
+    """
+    Splits a text stream into `;`-terminated statements, reading it in chunks.
+
+    Comments are removed from the statements, so that a `;` inside a comment never terminates a statement.
+    Only the statement currently being assembled is kept in memory.
+
+    :param TextIO stream: The stream to split
+    :param int chunk_size: The number of characters read at once
+    :raises ValueError: If the stream ends with an unterminated statement
+    """
+    pending: list[str] = []
+    in_comment = False
+
+    while chunk := stream.read(chunk_size):
+        pos = 0
+        while pos < len(chunk):
+            if in_comment:
+                # Skip the comment up to (but excluding) the end of the line
+                end = chunk.find("\n", pos)
+                if end == -1: break
+                in_comment = False
+                pos = end
+                continue
+
+            m = _STATEMENT_DELIMITERS.search(chunk, pos)
+            if m is None:
+                pending.append(chunk[pos:])
+                break
+
+            if m.group() == "*":
+                pending.append(chunk[pos:m.start()])
+                in_comment = True
+                pos = m.end()
+            else:
+                pending.append(chunk[pos:m.end()])
+                yield "".join(pending)
+                pending.clear()
+                pos = m.end()
+
+    rest = "".join(pending)
+    if rest.strip():
+        raise ValueError(f"Unterminated statement {rest.strip()!r}")
+
+def parse_iter(stream: tp.TextIO, engine: Engine = "pyparsing", chunk_size: int = 1 << 16) -> tp.Iterator[ProcessAssignment | ActionSetAssignment]:
+    """
+    Streaming CCS Process file (c.f. CAAL input) parsing
+
+    Reads the stream in chunks and yields each :class:`ProcessAssignment` and :class:`ActionSetAssignment` as soon as it is parsed.
+    Hence, peak memory depends on the largest statement instead of the whole input.
+
+    :param TextIO stream: The CCS input stream, e.g. an opened file
+    :param Engine engine: The parser to use, either the pyparsing grammar or the hand-written "fast" parser
+    :param int chunk_size: The number of characters read from the stream at once
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown parser engine {engine!r}")
+
+    for raw in _split_statements(stream, chunk_size):
+        if engine == "fast":
+            yield fast_grammar.parse_statement(raw)
+        else:
+            yield tp.cast(ProcessAssignment | ActionSetAssignment, _build_grammar()["_statement"].parse_string(raw, True)[0])
@@ -0,0 +1,1138 @@
+"""
+Labelled Transition Systems of CCS Processes
+
+:class:`CcsExplorer` implements the structural operational semantics (SOS) of CCS for prefixes, sums, parallel composition, hiding (i.e. restriction), renaming and process calls.
+It explores the states reachable from a process breadth-first into an :class:`Lts`, without BigraphER.
+
+States are terms, which are hash-consed into integer ids. Terms are kept in a canonical form:
+- parallel components are flattened, `0` components are dropped and the components are sorted,
+- alternatives are flattened, `0` alternatives are dropped and the alternatives are sorted,
+- duplicate alternatives are merged, i.e. `P + P` is `P`,
+- nested hidings are merged, and hiding or renaming `0` is `0`,
+- process calls are unfolded into the bodies of the processes, except below prefixes, until the prefix is performed.
+Hence, structurally congruent states are explored only once. Merging duplicate alternatives is not a law of structural congruence,
+but `P + P` and `P` are strongly bisimilar. Hence, the explored transition system equals the one of the SOS only up to strong bisimilarity.
+
+Transition labels are action names, prefixed by `'` for dual actions, or :data:`TAU` for internal actions.
+As in the Concurrency Workbench, the action `tau` is the internal action, e.g. `tau.P` moves to `P` internally.
+
+Optionally, the exploration is reduced by partial orders: a component of a parallel composition whose current moves can never synchronize with the others
+moves independently until it moves, hence only the moves of one such component are explored in a state (an ample set), instead of all interleavings.
+The reduced transition system keeps all deadlocks and all labels which can occur, but is in general neither bisimilar nor trace equivalent.
+
+Optionally, the exploration is reduced by symmetry: parallel components which are equal up to a bijection of their action and process names,
+such that exchanging their names maps the whole system to itself, are interchangeable. Each state is replaced by a representative,
+in which the interchangeable components are sorted by their local states. The reduced transition system is bisimilar to the full one
+up to exchanging the names of interchangeable components, hence up to `N!` times smaller for `N` components.
+"""
+
+import logging
+logger = logging.getLogger(__name__)
+
+import mmap
+import os
+import struct
+import sys
+import typing as tp
+from array import array
+from dataclasses import dataclass, field
+
+from .representation import *
+from .. import tracing
+from ..traversal import transform, walk
+
+TAU = "tau"
+"""The label of internal transitions, i.e. synchronizations and `tau` prefixes"""
+
+_NIL = ("nil",)
+
+_MAGIC = b"CCSLTS" + (b"le" if sys.byteorder == "little" else b"be")
+"""The start of the files of :class:`CompactLts`, whose buffers are stored in the native byte order"""
+
+_HEADER = struct.Struct("<8s4q")
+"""The header of the files of :class:`CompactLts`: magic, number of states, number of transitions, initial state and size of the labels"""
+
+def label(action: Action) -> str:
+    """
+    Computes the transition label of an action
+
+    :param Action action: The action
+    :return str: The label
+
+    Example:
+    >>> label(Action("a")), label(DualAction("a")), label(DualAction(TAU))
+    ('a', "'a", 'tau')
+    """
+    if action.name == TAU or not isinstance(action, DualAction):
+        return action.name
+    return f"'{action.name}"
+
+def dual(label: str) -> str:
+    """
+    Computes the label of the complementary action
+
+    :param str label: A label other than :data:`TAU`
+    :return str: The complementary label
+
+    Example:
+    >>> dual("a"), dual("'a")
+    ("'a", 'a')
+    """
+    return label[1:] if label.startswith("'") else f"'{label}"
+
+@dataclass(slots=True)
+class Lts(object):
+    """
+    A labelled transition system, whose states are numbered in breadth-first order
+
+    :param list[int] terms: The term of each state, c.f. :meth:`CcsExplorer.describe`
+    :param list[list[tuple[str, int]]] transitions: The outgoing transitions of each state, as label and target state
+    :param int initial: The initial state
+    """
+
+    terms: list[int]
+    transitions: list[list[tuple[str, int]]]
+    initial: int = 0
+
+    @property
+    def state_count(self) -> int:
+        return len(self.transitions)
+
+    @property
+    def transition_count(self) -> int:
+        return sum(map(len, self.transitions))
+
+    def labels(self) -> set[str]:
+        """The labels of all transitions"""
+        return {l for outgoing in self.transitions for l, _ in outgoing}
+
+    def write_aut(self, fp: tp.TextIO) -> None:
+        """
+        Writes the transition system in the Aldebaran (`.aut`) format
+
+        :param TextIO fp: The file to write to
+
+        Example:
+        >>> import sys
+        >>> Lts([0, 1], [[("a", 1)], [(TAU, 0)]]).write_aut(sys.stdout)
+        des (0, 2, 2)
+        (0, "a", 1)
+        (1, "tau", 0)
+        """
+        fp.write(f"des ({self.initial}, {self.transition_count}, {self.state_count})\n")
+        for source, outgoing in enumerate(self.transitions):
+            fp.write("".join(f'({source}, "{l}", {target})\n' for l, target in outgoing))
+
+    def compact(self) -> "CompactLts":
+        """
+        Converts the transition system into compressed sparse row form
+
+        :return CompactLts: The transition system, with the labels interned in the order of their first occurrence
+        """
+        labels: dict[str, int] = {}
+        starts = array("q", [0])
+        label_ids = array("i")
+        targets = array("i")
+        for outgoing in self.transitions:
+            label_ids.extend(labels.setdefault(l, len(labels)) for l, _ in outgoing)
+            targets.extend(t for _, t in outgoing)
+            starts.append(len(targets))
+        return CompactLts(list(labels), starts, label_ids, targets, array("i", self.terms), self.initial)
+
+@dataclass(slots=True)
+class CompactLts(object):
+    """
+    A labelled transition system in compressed sparse row (CSR) form, with interned labels
+
+    The outgoing transitions of a state `s` are at the positions `starts[s]` up to `starts[s + 1]` of `label_ids` and `targets`.
+    The buffers are arrays, which take 8 bytes per transition, or views of a file mapped into memory by :meth:`load`.
+
+    :param list[str] labels: The distinct labels, indexed by `label_ids`
+    :param Sequence[int] starts: The position of the first outgoing transition of each state, followed by the number of transitions
+    :param Sequence[int] label_ids: The label of each transition
+    :param Sequence[int] targets: The target state of each transition
+    :param Sequence[int] | None terms: The term of each state, c.f. :meth:`CcsExplorer.describe`, None if loaded from a file
+    :param int initial: The initial state
+
+    Example:
+    >>> lts = Lts([0, 1], [[("a", 1), (TAU, 0)], [(TAU, 0)]]).compact()
+    >>> lts.labels, list(lts.starts), list(lts.label_ids), list(lts.targets)
+    (['a', 'tau'], [0, 2, 3], [0, 1, 1], [1, 0, 0])
+    >>> lts.outgoing(0)
+    [('a', 1), ('tau', 0)]
+    """
+
+    labels: list[str]
+    starts: tp.Sequence[int]
+    label_ids: tp.Sequence[int]
+    targets: tp.Sequence[int]
+    terms: tp.Sequence[int] | None
+    initial: int = 0
+
+    @property
+    def state_count(self) -> int:
+        return len(self.starts) - 1
+
+    @property
+    def transition_count(self) -> int:
+        return len(self.targets)
+
+    def outgoing(self, state: int) -> list[tuple[str, int]]:
+        """The outgoing transitions of a state, as label and target state"""
+        start, end = self.starts[state], self.starts[state + 1]
+        labels = self.labels
+        return [(labels[l], t) for l, t in zip(self.label_ids[start:end], self.targets[start:end])]
+
+    def expand(self) -> Lts:
+        """
+        Converts the transition system into lists of outgoing transitions, e.g. for :class:`ccs2bigraph.ccs.bisimulation.Bisimulation`
+
+        :return Lts: The transition system, whose terms are the states themselves if they are unknown
+        """
+        terms = list(self.terms) if self.terms is not None else list(range(self.state_count))
+        return Lts(terms, [self.outgoing(s) for s in range(self.state_count)], self.initial)
+
+    def write_aut(self, fp: tp.TextIO) -> None:
+        """
+        Writes the transition system in the Aldebaran (`.aut`) format, like :meth:`Lts.write_aut`
+
+        :param TextIO fp: The file to write to
+        """
+        fp.write(f"des ({self.initial}, {self.transition_count}, {self.state_count})\n")
+        for source in range(self.state_count):
+            fp.write("".join(f'({source}, "{l}", {target})\n' for l, target in self.outgoing(source)))
+
+    def save(self, fp: tp.BinaryIO) -> None:
+        """
+        Writes the transition system in a binary format, which :meth:`load` maps into memory
+
+        The file consists of a header, the labels separated by newlines and the buffers, each aligned to 8 bytes. The terms are not stored.
+
+        :param BinaryIO fp: The file to write to
+        """
+        labels = "\n".join(self.labels).encode()
+        fp.write(_HEADER.pack(_MAGIC, self.state_count, self.transition_count, self.initial, len(labels)))
+        fp.write(labels)
+        fp.write(bytes(_padding(_HEADER.size + len(labels))))
+        for buffer, typecode in ((self.starts, "q"), (self.label_ids, "i"), (self.targets, "i")):
+            data = buffer if isinstance(buffer, (array, memoryview)) else array(typecode, buffer)
+            fp.write(data)
+            fp.write(bytes(_padding(memoryview(data).nbytes)))
+
+    @staticmethod
+    def load(path: str | os.PathLike[str]) -> "CompactLts":
+        """
+        Maps a transition system written by :meth:`save` into memory, without reading the buffers
+
+        :param str | PathLike path: The file
+        :return CompactLts: The transition system, whose buffers are read-only views of the file
+        :raises ValueError: If the file was not written by :meth:`save` on a machine with the same byte order
+
+        Example:
+        >>> import tempfile, pathlib
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     path = pathlib.Path(directory) / "a.lts"
+        ...     with open(path, "wb") as fp:
+        ...         Lts([0, 1], [[("a", 1)], [(TAU, 0)]]).compact().save(fp)
+        ...     lts = CompactLts.load(path)
+        ...     lts.labels, lts.outgoing(0), lts.outgoing(1), lts.terms
+        (['a', 'tau'], [('a', 1)], [('tau', 0)], None)
+        """
+        with open(path, "rb") as fp:
+            view = memoryview(mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ))
+        if len(view) < _HEADER.size:
+            raise ValueError(f"{path} is not a transition system file")
+        magic, states, transitions, initial, size = _HEADER.unpack_from(view)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a transition system file of this byte order")
+
+        offset = _HEADER.size + size
+        labels = str(view[_HEADER.size:offset], "utf-8").split("\n") if size else []
+        buffers: list[memoryview] = []
+        for typecode, count in (("q", states + 1), ("i", transitions), ("i", transitions)):
+            offset += _padding(offset)
+            end = offset + count * struct.calcsize(typecode)
+            buffers.append(view[offset:end].cast(typecode))
+            offset = end
+        return CompactLts(labels, *buffers, terms=None, initial=initial)
+
+def _padding(size: int) -> int:
+    """The number of bytes aligning `size` to 8 bytes"""
+    return -size % 8
+
+class CcsExplorer(object):
+    """
+    Explores the transition systems of the processes of a :class:`CcsRepresentation`
+
+    Terms and the transitions of sequential terms are memoized, hence exploring several processes of the same representation shares the work.
+
+    :param CcsRepresentation ccs: The representation, whose names have to be valid, c.f. :meth:`FinitePureCcsValidatior.validate_names`
+
+    Example:
+    >>> from .fast_grammar import parse
+    >>> explorer = CcsExplorer(parse("A = a.'b.A; B = b.c.B; S = (A | B) \\\\ {b};"))
+    >>> lts = explorer.explore("S")
+    >>> lts.state_count, lts.transition_count
+    (4, 5)
+    >>> [(explorer.describe(lts.terms[s]), l, t) for s, outgoing in enumerate(lts.transitions) for l, t in outgoing]
+    [("((a.'b.A | b.c.B) \\\\ {b})", 'a', 1), ("(('b.A | b.c.B) \\\\ {b})", 'tau', 2), ("((a.'b.A | c.B) \\\\ {b})", 'a', 3), ("((a.'b.A | c.B) \\\\ {b})", 'c', 0), ("(('b.A | c.B) \\\\ {b})", 'c', 1)]
+    """
+
+    def __init__(self, ccs: CcsRepresentation) -> None:
+        self._ccs = ccs
+        # Hash-consing of terms: each term is a tuple of a tag and integer ids of its subterms
+        self._nodes: list[tuple[tp.Any, ...]] = []
+        self._ids: dict[tuple[tp.Any, ...], int] = {}
+        self._transitions: dict[int, tuple[tuple[str, int], ...]] = {}
+        # The term of each process, compiled on first unfolding
+        self._bodies: dict[str, int] = {}
+        # The unfolding of each compound term, c.f. `_unfold`
+        self._unfolded: dict[int, int] = {}
+        # Processes whose bodies are being compiled, to detect unguarded recursion
+        self._compiling: set[str] = set()
+        # Structural keys of terms, c.f. `encode`, in both directions
+        self._keys: dict[int, str] = {}
+        self._decoded: dict[str, int] = {}
+        # The labels each term and each process may ever perform, c.f. `_alphabet`
+        self._alphabets: dict[int, frozenset[str]] = {}
+        self._process_alphabets: dict[str, frozenset[str]] | None = None
+        # The complements of the current visible moves of each component term, c.f. `_ample`
+        self._partners: dict[int, frozenset[str]] = {}
+        # The names and the shapes of terms, c.f. `_names` and `_shape`
+        self._names: dict[int, frozenset[str]] = {}
+        self._shapes: dict[int, str] = {}
+        self._nil = self._id(_NIL)
+
+    @property
+    def term_count(self) -> int:
+        """The number of hash-consed terms, which grows with the explored states"""
+        return len(self._nodes)
+
+    def _id(self, node: tuple[tp.Any, ...]) -> int:
+        term = self._ids.get(node)
+        if term is None:
+            term = self._ids[node] = len(self._nodes)
+            self._nodes.append(node)
+        return term
+
+    def _par(self, terms: tp.Iterable[int]) -> int:
+        """The canonical parallel composition of terms, whose process calls are kept, c.f. :meth:`_unfold`"""
+        return self._compose([], terms)
+
+    def _compose(self, components: list[int], terms: tp.Iterable[int]) -> int:
+        """The canonical parallel composition of canonical `components`, which is extended in place, and further terms"""
+        for term in terms:
+            node = self._nodes[term]
+            if node[0] == "par":
+                components.extend(node[1])
+            elif term != self._nil:
+                components.append(term)
+        if not components:
+            return self._nil
+        if len(components) == 1:
+            return components[0]
+        components.sort()
+        return self._id(("par", tuple(components)))
+
+    def _sum(self, terms: tp.Iterable[int]) -> int:
+        """The canonical alternative of terms, in which duplicates are merged, hence it is only strongly bisimilar to the alternative of the terms"""
+        alternatives: set[int] = set()
+        for term in terms:
+            node = self._nodes[term]
+            if node[0] == "sum":
+                alternatives.update(node[1])
+            elif term != self._nil:
+                alternatives.add(term)
+        if not alternatives:
+            return self._nil
+        if len(alternatives) == 1:
+            return alternatives.pop()
+        return self._id(("sum", tuple(sorted(alternatives))))
+
+    def _hide(self, names: frozenset[str], term: int) -> int:
+        """The canonical hiding of `names` in a term"""
+        if term == self._nil or not names:
+            return term
+        node = self._nodes[term]
+        if node[0] == "hide":
+            names = names | node[1]
+            term = node[2]
+        return self._id(("hide", names, term))
+
+    def _rename(self, renaming: tuple[tuple[str, str], ...], term: int) -> int:
+        """The canonical renaming of a term, with `renaming` as sorted pairs of old and new name"""
+        if term == self._nil or not renaming:
+            return term
+        return self._id(("rename", renaming, term))
+
+    def _call(self, name: str) -> int:
+        return self._id(("call", name))
+
+    def term(self, process: Process) -> int:
+        """
+        Compiles a process into a term
+
+        Process calls are kept, even if they are not guarded, hence processes may refer to processes which are being compiled.
+        They are replaced when the term becomes (part of) a state, c.f. :meth:`_unfold`.
+
+        :param Process process: The process
+        :return int: The id of the term
+        """
+        def _term_helper(current: Process, children: list[int]) -> int:
+            match current:
+                case PrefixedProcess(prefix=prefix): return self._id(("prefix", label(prefix), children[0]))
+                case SumProcesses(): return self._sum(children)
+                case ProcessByName(name=name): return self._call(name)
+                case NilProcess(): return self._nil
+                case ParallelProcesses(): return self._par(children)
+                case HidingProcess(hiding=hiding): return self._hide(self._hidden_names(hiding), children[0])
+                case RenamingProcess(renaming=renaming):
+                    return self._rename(tuple(sorted({r.old.name: r.new.name for r in renaming}.items())), children[0])
+                case _: raise TypeError(f"{current} may not be an abstract process.")
+
+        return transform(process, _term_helper)
+
+    def _hidden_names(self, hiding: ActionSet | ActionSetByName) -> frozenset[str]:
+        if isinstance(hiding, ActionSetByName):
+            hiding = self._ccs.get_action_set(hiding.name).actionSet
+        return frozenset(a.name for a in hiding.actions)
+
+    def _unfold(self, term: int) -> int:
+        """
+        Replaces the process calls of a term which are not below a prefix by the bodies of the processes
+
+        The calls below a prefix are unfolded once the prefix is performed, c.f. :meth:`transitions`.
+
+        :param int term: The id of the term
+        :return int: The id of the unfolded term
+        :raises ValueError: If a process call is not guarded, e.g. in `A = A | a.0`
+        """
+        node = self._nodes[term]
+        match node[0]:
+            case "call": pass
+            case "nil" | "prefix": return term
+            case _:
+                result = self._unfolded.get(term)
+                if result is None:
+                    match node[0]:
+                        case "sum": result = self._sum(map(self._unfold, node[1]))
+                        case "par": result = self._par(map(self._unfold, node[1]))
+                        case "hide": result = self._hide(node[1], self._unfold(node[2]))
+                        case "rename": result = self._rename(node[1], self._unfold(node[2]))
+                        case tag: raise ValueError(f"Unknown term {tag}")
+                    self._unfolded[term] = result
+                return result
+
+        name = node[1]
+        body = self._bodies.get(name)
+        if body is None:
+            if name in self._compiling:
+                raise ValueError(f"Process {name} is not guarded")
+            self._compiling.add(name)
+            try:
+                body = self._bodies[name] = self._unfold(self.term(self._ccs.get_process(name).process))
+            finally:
+                self._compiling.discard(name)
+        return body
+
+    def transitions(self, term: int) -> tuple[tuple[str, int], ...]:
+        """
+        Computes the outgoing transitions of a term according to the SOS rules of CCS
+
+        :param int term: The id of the term
+        :return tuple[tuple[str, int], ...]: The distinct transitions, as label and target term
+        :raises ValueError: If a process call is not guarded, e.g. in `A = A | a.0`
+        """
+        result = self._transitions.get(term)
+        if result is not None:
+            return result
+
+        node = self._nodes[term]
+        match node[0]:
+            case "prefix":
+                result = ((node[1], self._unfold(node[2])),)
+            case "nil":
+                result = ()
+            case "sum":
+                result = tuple(dict.fromkeys(t for alternative in node[1] for t in self.transitions(alternative)))
+            case "call":
+                result = self.transitions(self._unfold(term))
+            case "par":
+                result = self._par_transitions(node[1])
+            case "hide":
+                names, inner = node[1], node[2]
+                inner_node = self._nodes[inner]
+                # The targets of hidden moves of a parallel composition are not even composed
+                moves = self._par_transitions(inner_node[1], names) if inner_node[0] == "par" else self.transitions(inner)
+                result = tuple(
+                    (l, self._hide(names, target))
+                    for l, target in moves
+                    if l == TAU or l.lstrip("'") not in names
+                )
+            case "rename":
+                renaming, inner = dict(node[1]), node[2]
+                result = tuple(dict.fromkeys(
+                    (self._relabel(renaming, l), self._rename(node[1], target))
+                    for l, target in self.transitions(inner)
+                ))
+            case tag:
+                raise ValueError(f"Unknown term {tag}")
+
+        if not self._concurrent(term):
+            self._transitions[term] = result
+        return result
+
+    def _concurrent(self, term: int) -> bool:
+        """
+        Checks whether a term is a parallel composition, possibly hidden or renamed
+
+        The transitions of such terms are not memoized, since they are mostly global states, which are expanded once.
+        """
+        node = self._nodes[term]
+        while node[0] == "hide" or node[0] == "rename":
+            node = self._nodes[node[2]]
+        return node[0] == "par"
+
+    @staticmethod
+    def _relabel(renaming: dict[str, str], l: str) -> str:
+        if l == TAU:
+            return l
+        if l.startswith("'"):
+            return "'" + renaming.get(l[1:], l[1:])
+        return renaming.get(l, l)
+
+    def _par_transitions(self, components: tuple[int, ...], hidden: frozenset[str] = frozenset()) -> tuple[tuple[str, int], ...]:
+        """The transitions of a parallel composition: moves of single components, except on `hidden` actions, and synchronizations of two"""
+        result: dict[tuple[str, int], None] = {}
+        # The visible moves of all components by label, as component index and target
+        offers: dict[str, list[tuple[int, int]]] = {}
+
+        for i, component in enumerate(components):
+            if i and component == components[i - 1]:
+                continue # Equal components have equal moves
+            for l, target in self.transitions(component):
+                if l != TAU:
+                    offers.setdefault(l, []).append((i, target))
+                    if hidden and l.lstrip("'") in hidden:
+                        continue
+                result[(l, self._compose([*components[:i], *components[i + 1:]], (target,)))] = None
+
+        for l, moves in offers.items():
+            if l.startswith("'"):
+                continue
+            partners = offers.get(dual(l))
+            if not partners:
+                continue
+            for i, si in moves:
+                for j, sj in partners:
+                    if i == j:
+                        # A component may synchronize with an equal component
+                        if j + 1 == len(components) or components[j + 1] != components[j]:
+                            continue
+                        j += 1
+                    first, second = min(i, j), max(i, j)
+                    rest = [*components[:first], *components[first + 1:second], *components[second + 1:]]
+                    result[(TAU, self._compose(rest, (si, sj)))] = None
+
+        return tuple(result)
+
+    def _alphabet(self, term: int) -> frozenset[str]:
+        """The labels of the visible actions a term may ever perform, which over-approximate its actual moves"""
+        alphabet = self._alphabets.get(term)
+        if alphabet is not None:
+            return alphabet
+
+        node = self._nodes[term]
+        match node[0]:
+            case "nil": alphabet = frozenset()
+            case "call": alphabet = self._process_alphabet(node[1])
+            case "prefix":
+                alphabet = self._alphabet(node[2])
+                if node[1] != TAU:
+                    alphabet = alphabet | {node[1]}
+            case "sum" | "par": alphabet = frozenset().union(*map(self._alphabet, node[1]))
+            case "hide": alphabet = frozenset(l for l in self._alphabet(node[2]) if l.lstrip("'") not in node[1])
+            case "rename":
+                renaming = dict(node[1])
+                alphabet = frozenset(self._relabel(renaming, l) for l in self._alphabet(node[2]))
+            case tag: raise ValueError(f"Unknown term {tag}")
+
+        self._alphabets[term] = alphabet
+        return alphabet
+
+    def _process_alphabet(self, name: str) -> frozenset[str]:
+        """
+        The labels of the visible actions a process may ever perform
+
+        The alphabets of all processes are computed from their :class:`Process` trees at once, as least fixed point of the process calls.
+        """
+        if self._process_alphabets is None:
+            alphabets: dict[str, frozenset[str]] = {}
+
+            def _alphabet_helper(current: Process, children: list[frozenset[str]]) -> frozenset[str]:
+                match current:
+                    case PrefixedProcess(prefix=prefix):
+                        l = label(prefix)
+                        return children[0] if l == TAU else children[0] | {l}
+                    case SumProcesses() | ParallelProcesses(): return frozenset().union(*children)
+                    case ProcessByName(name=called): return alphabets.get(called, frozenset())
+                    case NilProcess(): return frozenset()
+                    case HidingProcess(hiding=hiding):
+                        names = self._hidden_names(hiding)
+                        return frozenset(l for l in children[0] if l.lstrip("'") not in names)
+                    case RenamingProcess(renaming=renaming):
+                        renamed = {r.old.name: r.new.name for r in renaming}
+                        return frozenset(self._relabel(renamed, l) for l in children[0])
+                    case _: raise TypeError(f"{current} may not be an abstract process.")
+
+            changed = True
+            while changed:
+                changed = False
+                for pa in self._ccs.process_assignments:
+                    alphabet = alphabets.get(pa.name, frozenset()) | transform(pa.process, _alphabet_helper)
+                    if alphabet != alphabets.get(pa.name):
+                        alphabets[pa.name] = alphabet
+                        changed = True
+            self._process_alphabets = alphabets
+        return self._process_alphabets.get(name, frozenset())
+
+    def _ample(self, term: int, states: tp.Mapping[int, int]) -> tuple[tuple[str, int], ...]:
+        """
+        Computes the transitions of a term explored with partial-order reduction, c.f. :meth:`explore_compact`
+
+        If the term is a parallel composition, possibly hidden or renamed, with a component whose current moves are not complementary to the alphabet of any other component,
+        the other components cannot synchronize with it until it moves. Hence its moves are independent of all transitions before them, and an ample set.
+        To not ignore the other components forever, the moves must not lead back to a state which is not after the term in breadth-first order,
+        hence each cycle of the reduced transition system contains a fully explored state. Of the remaining components, the one with the fewest moves is chosen.
+
+        :param int term: The id of the term
+        :param Mapping[int, int] states: The breadth-first number of each state found so far, including `term`
+        :return tuple[tuple[str, int], ...]: The ample set if there is one, otherwise all transitions
+        """
+        wrappers: list[tuple[tp.Any, ...]] = []
+        node = self._nodes[term]
+        while node[0] == "hide" or node[0] == "rename":
+            wrappers.append(node)
+            node = self._nodes[node[2]]
+        if node[0] != "par":
+            return self.transitions(term)
+
+        components: tuple[int, ...] = node[1]
+        alphabets = [self._alphabet(c) for c in components]
+        offered = frozenset().union(*alphabets)
+
+        current = states[term]
+        ample: tuple[tuple[str, int], ...] | None = None
+        for i, component in enumerate(components):
+            if i and component == components[i - 1]:
+                continue # Equal components have equal moves
+            partners = self._partners.get(component)
+            if partners is None:
+                partners = self._partners[component] = frozenset(dual(l) for l, _ in self.transitions(component) if l != TAU)
+            # Only check the other components if the component itself offers the complements
+            synchronizing = partners & offered
+            if synchronizing and (not synchronizing <= alphabets[i] or any(
+                not synchronizing.isdisjoint(alphabet) for j, alphabet in enumerate(alphabets) if j != i
+            )):
+                continue
+            moves: dict[tuple[str, int], None] = {}
+            for l, target in self.transitions(component):
+                # Apply the hidings and renamings from the inside out
+                for wrapper in reversed(wrappers):
+                    if wrapper[0] == "rename":
+                        l = self._relabel(dict(wrapper[1]), l)
+                    elif l != TAU and l.lstrip("'") in wrapper[1]:
+                        break
+                else:
+                    target = self._compose([*components[:i], *components[i + 1:]], (target,))
+                    for wrapper in reversed(wrappers):
+                        target = self._hide(wrapper[1], target) if wrapper[0] == "hide" else self._rename(wrapper[1], target)
+                    moves[(l, target)] = None
+            if moves and (ample is None or len(moves) < len(ample)) and all(states.get(target, current + 1) > current for _, target in moves):
+                ample = tuple(moves)
+
+        return self.transitions(term) if ample is None else ample
+
+    def _names_of(self, term: int) -> frozenset[str]:
+        """The action names and the process names, prefixed by `@`, occurring in a term, without unfolding process calls"""
+        names = self._names.get(term)
+        if names is not None:
+            return names
+
+        node = self._nodes[term]
+        match node[0]:
+            case "nil": names = frozenset()
+            case "call": names = frozenset((f"@{node[1]}",))
+            case "prefix":
+                names = self._names_of(node[2])
+                if node[1] != TAU:
+                    names = names | {node[1].lstrip("'")}
+            case "sum" | "par": names = frozenset().union(*map(self._names_of, node[1]))
+            case "hide": names = self._names_of(node[2]) | node[1]
+            case "rename": names = self._names_of(node[2]).union(*node[1])
+            case tag: raise ValueError(f"Unknown term {tag}")
+
+        self._names[term] = names
+        return names
+
+    def _shape(self, term: int) -> str:
+        """A key of a term like :meth:`encode`, but without names, hence equal for terms which are equal up to names"""
+        shape = self._shapes.get(term)
+        if shape is not None:
+            return shape
+
+        node = self._nodes[term]
+        match node[0]:
+            case "nil": shape = "0"
+            case "call": shape = "@"
+            case "prefix": shape = "." + ("t" if node[1] == TAU else "'" if node[1].startswith("'") else "") + ":" + self._shape(node[2])
+            case "sum" | "par":
+                children = sorted(map(self._shape, node[1]))
+                shape = ("+" if node[0] == "sum" else "|") + "".join(f"{len(c)}:{c}" for c in children)
+            case "hide": shape = f"\\{len(node[1])}:{self._shape(node[2])}"
+            case "rename": shape = f"[{len(node[1])}:{self._shape(node[2])}"
+            case tag: raise ValueError(f"Unknown term {tag}")
+
+        self._shapes[term] = shape
+        return shape
+
+    def _match(self, first: int, second: int, mapping: dict[str, str], matched: set[tuple[int, int]]) -> bool:
+        """
+        Extends a mapping of the names of a term, c.f. :meth:`_names_of`, such that it maps the term to another one
+
+        Process calls are matched by their bodies. The children of sums and parallel compositions are matched in the order of their shapes,
+        hence a mapping may be missed if several children have the same shape.
+
+        :param int first: The id of the term whose names are mapped
+        :param int second: The id of the term they are mapped to
+        :param dict[str, str] mapping: The mapping, which is extended in place
+        :param set[tuple[int, int]] matched: The pairs of terms matched so far, to stop at recursive process calls
+        :return bool: Whether the mapping could be extended consistently, which does not imply that it is injective
+        """
+        if (first, second) in matched:
+            return True
+        matched.add((first, second))
+
+        def _extend(name: str, other: str) -> bool:
+            return mapping.setdefault(name, other) == other
+
+        a, b = self._nodes[first], self._nodes[second]
+        if a[0] != b[0]:
+            return False
+        match a[0]:
+            case "nil":
+                return True
+            case "call":
+                return _extend(f"@{a[1]}", f"@{b[1]}") and self._match(self._unfold(first), self._unfold(second), mapping, matched)
+            case "prefix":
+                if a[1] == TAU or b[1] == TAU:
+                    return a[1] == b[1] and self._match(a[2], b[2], mapping, matched)
+                return a[1].startswith("'") == b[1].startswith("'") and _extend(a[1].lstrip("'"), b[1].lstrip("'")) and self._match(a[2], b[2], mapping, matched)
+            case "sum" | "par":
+                if self._shape(first) != self._shape(second):
+                    return False
+                return all(self._match(c, d, mapping, matched) for c, d in zip(sorted(a[1], key=self._shape), sorted(b[1], key=self._shape)))
+            case "hide":
+                if len(a[1]) != len(b[1]) or not self._match(a[2], b[2], mapping, matched):
+                    return False
+                # Names used by the hidden term are mapped already, the others are matched in their order
+                mapped = {mapping[n] for n in a[1] if n in mapping}
+                if not mapped <= b[1]:
+                    return False
+                return all(_extend(n, m) for n, m in zip(sorted(n for n in a[1] if n not in mapping), sorted(b[1] - mapped)))
+            case "rename":
+                return len(a[1]) == len(b[1]) and all(
+                    _extend(old, other_old) and _extend(new, other_new)
+                    for (old, new), (other_old, other_new) in zip(a[1], b[1])
+                ) and self._match(a[2], b[2], mapping, matched)
+            case tag:
+                raise ValueError(f"Unknown term {tag}")
+
+    def _permute(self, permutation: dict[str, str], term: int, memo: dict[int, int]) -> int:
+        """
+        Exchanges the names of a term, c.f. :meth:`_names_of`
+
+        :param dict[str, str] permutation: The bijection of names, which are kept if they are not mapped
+        :param int term: The id of the term
+        :param dict[int, int] memo: The permuted terms of `permutation` so far
+        :return int: The id of the permuted term
+        """
+        result = memo.get(term)
+        if result is not None:
+            return result
+
+        node = self._nodes[term]
+        match node[0]:
+            case "nil": result = term
+            case "call": result = self._call(permutation.get(f"@{node[1]}", f"@{node[1]}")[1:])
+            case "prefix":
+                l = node[1]
+                if l != TAU:
+                    name = l.lstrip("'")
+                    l = l[:len(l) - len(name)] + permutation.get(name, name)
+                result = self._id(("prefix", l, self._permute(permutation, node[2], memo)))
+            case "sum": result = self._sum(self._permute(permutation, c, memo) for c in node[1])
+            case "par": result = self._par(self._permute(permutation, c, memo) for c in node[1])
+            case "hide": result = self._hide(frozenset(permutation.get(n, n) for n in node[1]), self._permute(permutation, node[2], memo))
+            case "rename":
+                renaming = tuple(sorted((permutation.get(old, old), permutation.get(new, new)) for old, new in node[1]))
+                result = self._rename(renaming, self._permute(permutation, node[2], memo))
+            case tag: raise ValueError(f"Unknown term {tag}")
+
+        memo[term] = result
+        return result
+
+    def _processes(self, term: int) -> set[str]:
+        """The names of the processes which a term calls, transitively"""
+        processes: set[str] = set()
+        pending = [term]
+        while pending:
+            for subterm in walk(_Term(self, pending.pop())):
+                node = self._nodes[subterm.id]
+                if node[0] == "call" and node[1] not in processes:
+                    processes.add(node[1])
+                    pending.append(self._unfold(subterm.id))
+        return processes
+
+    def _symmetries(self, initial: int) -> list["_Symmetry"]:
+        """
+        Finds interchangeable parallel components of an initial state, c.f. :meth:`explore_compact`
+
+        Components with the same shape are matched to the first one. Exchanging the names of the first component and of a matched one
+        has to be an automorphism of the system, i.e. has to map the initial state to itself and the body of each reachable process to the body of the exchanged process.
+        Then all permutations of the interchangeable components are automorphisms, since they are generated by these exchanges.
+
+        :param int initial: The id of the initial state
+        :return list[_Symmetry]: The groups of interchangeable components, whose names are disjoint
+        """
+        # The hidings and renamings around the components
+        wrappers: list[tuple[tp.Any, ...]] = []
+        node = self._nodes[initial]
+        while node[0] == "hide" or node[0] == "rename":
+            wrappers.append(node[:2])
+            node = self._nodes[node[2]]
+        if node[0] != "par":
+            return []
+
+        shapes: dict[str, list[int]] = {}
+        for component in dict.fromkeys(node[1]):
+            shapes.setdefault(self._shape(component), []).append(component)
+        processes = self._processes(initial)
+        symmetries: list[_Symmetry] = []
+        # The names of the components found interchangeable so far
+        taken: set[str] = set()
+        for components in shapes.values():
+            slots: list[dict[str, str]] = []
+            for component in components[1:]:
+                mapping: dict[str, str] = {}
+                if not self._match(components[0], component, mapping, set()):
+                    continue
+                mapping = {n: m for n, m in mapping.items() if n != m}
+                images = set(mapping.values())
+                # Equal components are interchangeable anyway, since parallel components are sorted
+                if not mapping or len(images) != len(mapping) or (slots and mapping.keys() != slots[0].keys()):
+                    continue
+                if not images.isdisjoint(mapping) or not images.isdisjoint(taken):
+                    continue
+                exchange = mapping | {m: n for n, m in mapping.items()}
+                if self._automorphism(exchange, initial, processes):
+                    slots.append(mapping)
+                    taken |= images
+            if slots:
+                if not taken.isdisjoint(slots[0]):
+                    continue
+                taken.update(slots[0])
+                symmetries.append(_Symmetry([{n: n for n in slots[0]}, *slots], tuple(wrappers)))
+                logger.info("Found %d interchangeable components", len(slots) + 1)
+        return symmetries
+
+    def _automorphism(self, exchange: dict[str, str], initial: int, processes: set[str]) -> bool:
+        """Checks whether exchanging names maps the initial state to itself and the body of each process to the body of the exchanged process"""
+        memo: dict[int, int] = {}
+        if self._permute(exchange, initial, memo) != initial:
+            return False
+        for process in processes:
+            other = exchange.get(f"@{process}", f"@{process}")[1:]
+            if other not in processes or self._permute(exchange, self._unfold(self._call(process)), memo) != self._unfold(self._call(other)):
+                return False
+        return True
+
+    def _representative(self, term: int, symmetries: list["_Symmetry"], memo: dict[tuple[tuple[int, ...], ...], dict[int, int]]) -> int:
+        """
+        Replaces a state by the representative of its symmetric states, c.f. :meth:`explore_compact`
+
+        The interchangeable components are sorted by their local states, i.e. by the keys of the components owned by each, with the names of the first one.
+        Components are owned by an interchangeable component if they contain its names only.
+        The components of a state are those of its parallel composition within the hidings and renamings of the initial state.
+        Any other state, e.g. a single renamed component, is a single component.
+
+        :param int term: The id of the state
+        :param list[_Symmetry] symmetries: The groups of interchangeable components, c.f. :meth:`_symmetries`
+        :param memo: The permuted terms of each permutation, by the order of the components of each group
+        :return int: The id of the representative
+        """
+        node: tuple[tp.Any, ...] | None = self._nodes[term]
+        for wrapper in symmetries[0].wrappers:
+            if node[:2] != wrapper:
+                node = None
+                break
+            node = self._nodes[node[2]]
+        components: tuple[int, ...] = node[1] if node is not None and node[0] == "par" else (self._unfold(term),)
+
+        orders: list[tuple[int, ...]] = []
+        permutation: dict[str, str] = {}
+        for symmetry in symmetries:
+            local: list[list[str]] = [[] for _ in symmetry.slots]
+            for component in components:
+                owners = {symmetry.owners[n] for n in self._names_of(component) if n in symmetry.owners}
+                if len(owners) == 1:
+                    slot = owners.pop()
+                    local[slot].append(self.encode(self._permute(symmetry.exchanges[slot], component, symmetry.normalized[slot])))
+            for keys in local:
+                keys.sort()
+            order = tuple(sorted(range(len(local)), key=local.__getitem__))
+            orders.append(order)
+            # The component at position `r` of the order is moved to slot `r`
+            for r, slot in enumerate(order):
+                if r != slot:
+                    permutation.update(zip(symmetry.slots[slot].values(), symmetry.slots[r].values()))
+
+        if not permutation:
+            return term
+        return self._permute(permutation, term, memo.setdefault(tuple(orders), {}))
+
+    def encode(self, term: int) -> str:
+        """
+        Computes a structural key of a term, which is independent of the ids of this explorer
+
+        Equal terms of different explorers of the same representation have equal keys, hence keys can be exchanged between processes.
+        A key starts with a character for the kind of term. Subterms of sums and parallel compositions are ordered by their keys,
+        and each is preceded by its length, such that :meth:`decode` can look up repeated subterms without parsing them.
+
+        :param int term: The id of the term
+        :return str: The key
+
+        Example:
+        >>> from .fast_grammar import parse
+        >>> explorer = CcsExplorer(parse("A = b.0 | a.A; B = (A | A)[c/a] \\\\ {b};"))
+        >>> explorer.encode(explorer.initial("A")), explorer.encode(explorer.initial("B"))
+        ('|5:.a:@A4:.b:0', '\\\\b:[c/a:|5:.a:@A5:.a:@A4:.b:04:.b:0')
+        >>> other = CcsExplorer(parse("A = b.0 | a.A;"))
+        >>> other.describe(other.decode(explorer.encode(explorer.initial("A"))))
+        '(a.A | b.0)'
+        """
+        key = self._keys.get(term)
+        if key is not None:
+            return key
+
+        node = self._nodes[term]
+        match node[0]:
+            case "nil": key = "0"
+            case "call": key = f"@{node[1]}"
+            case "prefix": key = f".{node[1]}:{self.encode(node[2])}"
+            case "sum" | "par":
+                children = sorted(map(self.encode, node[1]))
+                key = ("+" if node[0] == "sum" else "|") + "".join(f"{len(c)}:{c}" for c in children)
+            case "hide": key = f"\\{','.join(sorted(node[1]))}:{self.encode(node[2])}"
+            case "rename": key = f"[{','.join(f'{new}/{old}' for old, new in node[1])}:{self.encode(node[2])}"
+            case tag: raise ValueError(f"Unknown term {tag}")
+
+        self._keys[term] = key
+        self._decoded.setdefault(key, term)
+        return key
+
+    def decode(self, key: str) -> int:
+        """
+        Hash-conses a term from its key, c.f. :meth:`encode`
+
+        :param str key: The key
+        :return int: The id of the term
+        """
+        term = self._decoded.get(key)
+        if term is not None:
+            return term
+
+        match key[0]:
+            case "0": term = self._nil
+            case "@": term = self._call(key[1:])
+            case ".":
+                l, _, child = key[1:].partition(":")
+                term = self._id(("prefix", l, self.decode(child)))
+            case "+" | "|":
+                children: list[int] = []
+                i = 1
+                while i < len(key):
+                    j = key.index(":", i)
+                    end = j + 1 + int(key[i:j])
+                    children.append(self.decode(key[j + 1:end]))
+                    i = end
+                term = self._sum(children) if key[0] == "+" else self._par(children)
+            case "\\":
+                names, _, child = key[1:].partition(":")
+                term = self._hide(frozenset(names.split(",")), self.decode(child))
+            case "[":
+                pairs, _, child = key[1:].partition(":")
+                renaming = tuple((old, new) for new, old in (p.split("/") for p in pairs.split(",")))
+                term = self._rename(renaming, self.decode(child))
+            case tag:
+                raise ValueError(f"Unknown term {tag}")
+
+        self._decoded[key] = term
+        return term
+
+    def describe(self, term: int) -> str:
+        """
+        Renders a term in CCS syntax
+
+        :param int term: The id of the term
+        :return str: The term
+        """
+        def _describe_helper(current: int, children: list[str]) -> str:
+            node = self._nodes[current]
+            match node[0]:
+                case "nil": return "0"
+                case "call": return node[1]
+                case "prefix": return f"{node[1]}.{children[0]}"
+                case "sum": return "(" + " + ".join(children) + ")"
+                case "par": return "(" + " | ".join(children) + ")"
+                case "hide": return f"({children[0]} \\ {{{', '.join(sorted(node[1]))}}})"
+                case "rename": return f"{children[0]}[{', '.join(f'{new}/{old}' for old, new in node[1])}]"
+                case tag: raise ValueError(f"Unknown term {tag}")
+
+        return transform(_Term(self, term), lambda t, children: _describe_helper(t.id, children))
+
+    def initial(self, init: str | Process) -> int:
+        """
+        Compiles the initial state of an exploration
+
+        :param str | Process init: The name of the initial process, or the initial process itself
+        :return int: The id of the unfolded term
+        """
+        return self._unfold(self._call(self._ccs.get_process(init).name) if isinstance(init, str) else self.term(init))
+
+    def explore(self, init: str | Process, max_states: int | None = None, partial_order: bool = False, symmetry: bool = False) -> Lts:
+        """
+        Explores the states reachable from a process breadth-first
+
+        :param str | Process init: The name of the initial process, or the initial process itself
+        :param int | None max_states: The maximal number of states, unbounded if None
+        :param bool partial_order: Whether to explore only one interleaving of independent components, c.f. :meth:`explore_compact`
+        :param bool symmetry: Whether to explore only one representative of symmetric states, c.f. :meth:`explore_compact`
+        :return Lts: The transition system, whose initial state is 0
+        :raises ValueError: If the state space exceeds `max_states`, or both reductions are requested
+        """
+        return self.explore_compact(init, max_states, partial_order, symmetry).expand()
+
+    def explore_compact(self, init: str | Process, max_states: int | None = None, partial_order: bool = False, symmetry: bool = False) -> CompactLts:
+        """
+        Explores the states reachable from a process breadth-first, like :meth:`explore`, into compressed sparse row form
+
+        With partial-order reduction, the moves of independent components are explored in one order only.
+        The reduced transition system is a subsystem of the full one with the same deadlocks and labels, but fewer states and transitions.
+
+        With symmetry reduction, interchangeable parallel components of the initial state are detected, and each state is replaced by a representative
+        which differs by a permutation of these components. The labels of its transitions are those of the representative.
+        Symmetric states usually share their representative, but this is not guaranteed, hence the reduced transition system is not necessarily minimal.
+
+        :param str | Process init: The name of the initial process, or the initial process itself
+        :param int | None max_states: The maximal number of states, unbounded if None
+        :param bool partial_order: Whether to explore only one interleaving of independent components
+        :param bool symmetry: Whether to explore only one representative of symmetric states
+        :return CompactLts: The transition system, whose initial state is 0
+        :raises ValueError: If the state space exceeds `max_states`, or both reductions are requested, whose combination is not sound in general
+
+        Example:
+        >>> from .fast_grammar import parse
+        >>> explorer = CcsExplorer(parse("A = a.b.0 | c.d.0 | 'c.0;"))
+        >>> full, reduced = explorer.explore_compact("A"), explorer.explore_compact("A", partial_order=True)
+        >>> (full.state_count, full.transition_count), (reduced.state_count, reduced.transition_count)
+        ((18, 36), (8, 9))
+        >>> sorted(full.labels) == sorted(reduced.labels)
+        True
+        >>> explorer = CcsExplorer(parse("C = a.b.c.C; S = C[a0/a] | C[a1/a] | C[a2/a];"))
+        >>> explorer.explore_compact("S").state_count, explorer.explore_compact("S", symmetry=True).state_count
+        (27, 10)
+        """
+        if partial_order and symmetry:
+            raise ValueError("Partial-order and symmetry reduction cannot be combined")
+
+        with tracing.span("explore", partial_order=partial_order, symmetry=symmetry) as attributes:
+            initial = self.initial(init)
+            symmetries = self._symmetries(initial) if symmetry else []
+            # The representative of each state, and the permuted terms of each permutation
+            representatives: dict[int, int] = {}
+            permuted: dict[tuple[tuple[int, ...], ...], dict[int, int]] = {}
+            if symmetries:
+                initial = self._representative(initial, symmetries, permuted)
+
+            states: dict[int, int] = {initial: 0}
+            # The terms in breadth-first order double as the queue, since iterating an array also visits the items appended meanwhile
+            terms = array("i", [initial])
+            labels: dict[str, int] = {}
+            starts = array("q", [0])
+            label_ids = array("i")
+            targets = array("i")
+            for term in terms:
+                for l, target in self._ample(term, states) if partial_order else self.transitions(term):
+                    if symmetries:
+                        representative = representatives.get(target)
+                        if representative is None:
+                            representative = representatives[target] = self._representative(target, symmetries, permuted)
+                        target = representative
+                    state = states.get(target)
+                    if state is None:
+                        if max_states is not None and len(terms) >= max_states:
+                            raise ValueError(f"The state space exceeds {max_states} states")
+                        state = states[target] = len(terms)
+                        terms.append(target)
+                    label_id = labels.get(l)
+                    if label_id is None:
+                        label_id = labels[l] = len(labels)
+                    label_ids.append(label_id)
+                    targets.append(state)
+                starts.append(len(targets))
+
+            lts = CompactLts(list(labels), starts, label_ids, targets, terms)
+            attributes["states"] = lts.state_count
+            attributes["transitions"] = lts.transition_count
+
+        logger.info("Explored %d states and %d transitions", lts.state_count, lts.transition_count)
+        return lts
+
+@dataclass(frozen=True, slots=True)
+class _Symmetry(object):
+    """
+    A group of interchangeable parallel components, c.f. :meth:`CcsExplorer._symmetries`
+
+    :param list[dict[str, str]] slots: For each component, the bijection from the names of the first component to its names, c.f. :meth:`CcsExplorer._names_of`
+    :param tuple wrappers: The hidings and renamings of the initial state around the components, without their subterms
+    """
+
+    slots: list[dict[str, str]]
+    wrappers: tuple[tuple[tp.Any, ...], ...]
+    owners: dict[str, int] = field(init=False)
+    """The component of each name of the components"""
+    exchanges: list[dict[str, str]] = field(init=False)
+    """For each component, the exchange of its names with those of the first component"""
+    normalized: list[dict[int, int]] = field(init=False)
+    """For each component, the terms permuted by its exchange so far"""
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "owners", {m: slot for slot, mapping in enumerate(self.slots) for m in mapping.values()})
+        object.__setattr__(self, "exchanges", [mapping | {m: n for n, m in mapping.items()} for mapping in self.slots])
+        object.__setattr__(self, "normalized", [{} for _ in self.slots])
+
+@dataclass(frozen=True, slots=True)
+class _Term(object):
+    """A term of a :class:`CcsExplorer` with access to its subterms, c.f. :mod:`ccs2bigraph.traversal`"""
+
+    explorer: CcsExplorer
+    id: int
+
+    def children(self) -> tp.Sequence["_Term"]:
+        node = self.explorer._nodes[self.id] # pyright: ignore[reportPrivateUsage]
+        match node[0]:
+            case "prefix": return (_Term(self.explorer, node[2]),)
+            case "sum" | "par": return [_Term(self.explorer, c) for c in node[1]]
+            case "hide" | "rename": return (_Term(self.explorer, node[2]),)
+            case _: return ()
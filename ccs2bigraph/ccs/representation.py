@@ -15,20 +15,28 @@ This file provides classes for the individual parts of CCS terms, i.e.
 import logging
 logger = logging.getLogger(__name__)
 
+import sys
 from abc import ABC
-from dataclasses import dataclass
-from typing import Self
+import typing as tp
+from dataclasses import dataclass, field
+from typing import Self, Sequence
 
-@dataclass(frozen=True)
-class Action(object):
+from ..interning import Interned
+
+@dataclass(frozen=True, slots=True, init=False)
+class Action(Interned):
     """
     Represents Actions of CCS Terms
+
+    Actions are interned, i.e. there is only one instance per name.
     
     :param str name: The name of the Action, starting with a lowercase character
 
     Example
     >>> str(Action('a'))
     'a'
+    >>> Action('a') is Action('a')
+    True
     """
 
     name: str
@@ -36,7 +44,7 @@ class Action(object):
     def __str__(self) -> str:
         return f"{self.name}"
     
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, init=False)
 class DualAction(Action):
     """
     Represents Dual Actions of CCS Terms
@@ -52,7 +60,7 @@ class DualAction(Action):
     def __str__(self) -> str:
         return f"'{self.name}"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Renaming(object):
     """
     Represents a single renaming of a CCS action
@@ -67,7 +75,7 @@ class Renaming(object):
     def __str__(self) -> str:
         return f"{self.new}/{self.old}"
 
-@dataclass()
+@dataclass(slots=True)
 class ActionSet(object):
     """
     Represents a set of `Action`s, used for instance in `HidingProcess`.
@@ -83,7 +91,7 @@ class ActionSet(object):
     def __str__(self) -> str:
         return "{" + ", ".join(map(str, self.actions)) + "}"
     
-@dataclass()
+@dataclass(slots=True)
 class ActionSetByName(object):
     """
     Refers to an `ActionSetAssignment` by its name.
@@ -96,10 +104,13 @@ class ActionSetByName(object):
     """
     name: str
 
+    def __post_init__(self):
+        self.name = sys.intern(self.name)
+
     def __str__(self) -> str:
         return self.name
 
-@dataclass()
+@dataclass(slots=True)
 class ActionSetAssignment(object):
     """
     Assignment of an `ActionSet` to a name.
@@ -124,10 +135,20 @@ class Process(ABC):
     :param Self | None parent: The parent process of each parent expression. For example, the :class:`NilProcess` in `a.0` has the `PrefixedProcess(Action("a"), NilProcess)` as its parent.  
     """
 
+    __slots__ = ("parent",)
+
     def __init__(self, *, parent: Self | None = None):
         self.parent = parent
 
-@dataclass()
+    def children(self) -> Sequence["Process"]:
+        """
+        The direct subprocesses, c.f. :mod:`ccs2bigraph.traversal`
+
+        :return Sequence[Process]: The subprocesses from left to right
+        """
+        return ()
+
+@dataclass(slots=True)
 class NilProcess(Process):
     """
     The empty process.
@@ -138,12 +159,12 @@ class NilProcess(Process):
     """
 
     def __post_init__(self):
-        super().__init__()
+        Process.__init__(self)
 
     def __str__(self):
         return "0"
     
-@dataclass()
+@dataclass(slots=True)
 class ProcessByName(Process):
     """
     Refers to an `ProcessAssignment` by its name.
@@ -157,12 +178,13 @@ class ProcessByName(Process):
     name: str
 
     def __post_init__(self):
-        super().__init__()
+        Process.__init__(self)
+        self.name = sys.intern(self.name)
     
     def __str__(self):
         return self.name
 
-@dataclass()
+@dataclass(slots=True)
 class PrefixedProcess(Process):
     """
     Process representing the result of a prefix operation.
@@ -180,12 +202,15 @@ class PrefixedProcess(Process):
     remaining: Process
 
     def __post_init__(self):
-        super().__init__()
+        Process.__init__(self)
     
     def __str__(self) -> str:
         return f"({self.prefix}.{self.remaining})"
 
-@dataclass()
+    def children(self) -> Sequence[Process]:
+        return (self.remaining,)
+
+@dataclass(slots=True)
 class HidingProcess(Process):
     """
     Process representing the result of a hiding operation
@@ -203,12 +228,15 @@ class HidingProcess(Process):
     hiding: ActionSet | ActionSetByName
 
     def __post_init__(self):
-        super().__init__()
+        Process.__init__(self)
     
     def __str__(self) -> str:
         return f"({self.process} \\ {self.hiding})"
 
-@dataclass()
+    def children(self) -> Sequence[Process]:
+        return (self.process,)
+
+@dataclass(slots=True)
 class RenamingProcess(Process):
     """
     Process representing the result of a renaming operation
@@ -230,12 +258,15 @@ class RenamingProcess(Process):
     renaming: list[Renaming]
 
     def __post_init__(self):
-        super().__init__()
+        Process.__init__(self)
 
     def __str__(self) -> str:
         return f"({self.process}[" + ", ".join(map(str, self.renaming)) + "])"
 
-@dataclass()
+    def children(self) -> Sequence[Process]:
+        return (self.process,)
+
+@dataclass(slots=True)
 class SumProcesses(Process):
     """
     Process representing the result of one (or more consequtive) alternative operations
@@ -249,12 +280,15 @@ class SumProcesses(Process):
     sums: list[Process]
 
     def __post_init__(self):
-        super().__init__()
+        Process.__init__(self)
     
     def __str__(self) -> str:
         return "(" + " + ".join(map(str, self.sums)) + ")"
 
-@dataclass()
+    def children(self) -> Sequence[Process]:
+        return self.sums
+
+@dataclass(slots=True)
 class ParallelProcesses(Process):
     """
     Process representing the result of one (or more consequtive) parallel composition operations
@@ -268,12 +302,15 @@ class ParallelProcesses(Process):
     parallels: list[Process]
 
     def __post_init__(self):
-        super().__init__()
+        Process.__init__(self)
     
     def __str__(self) -> str:
         return "(" + " | ".join(map(str, self.parallels)) + ")"
+
+    def children(self) -> Sequence[Process]:
+        return self.parallels
     
-@dataclass()
+@dataclass(slots=True)
 class ProcessAssignment:
     """
     Assignment of a `Process` to a name.
@@ -291,47 +328,284 @@ class ProcessAssignment:
     def __str__(self) -> str:
         return f"{self.name} = {self.process};"
     
-@dataclass()
+class ActionIndex(object):
+    """
+    Index of the alphabet of a :class:`CcsRepresentation`.
+
+    Maps each action (in its non-dual form) to the names of the process assignments and action set assignments using it.
+    Actions are kept in the order in which they were first used.
+    Assignments sharing a name are counted separately, so that removing one of them keeps the uses of the others.
+
+    Example:
+    >>> index = ActionIndex()
+    >>> index.add_process("A", [Action("a"), Action("b")])
+    >>> index.add_action_set("H", [Action("b")])
+    >>> Action("b") in index, Action("c") in index
+    (True, False)
+    >>> index.processes_using(Action("b")), index.action_sets_using(Action("b"))
+    ({'A'}, {'H'})
+    >>> index.remove_process("A", [Action("a"), Action("b")])
+    >>> list(map(str, index))
+    ['b']
+    """
+
+    __slots__ = ("_uses",)
+
+    def __init__(self) -> None:
+        # Per action the number of uses by process assignments and by action set assignments of each name
+        self._uses: dict[Action, tuple[dict[str, int], dict[str, int]]] = {}
+
+    @staticmethod
+    def actions_of(process: Process) -> dict[Action, None]:
+        """
+        Collects the actions used in a process, in their non-dual form and in order of their first occurrence in the source text.
+
+        Action sets referred to by name are not resolved.
+
+        :param Process process: The process to inspect
+        :return dict[Action, None]: The actions, as an insertion ordered set
+
+        Example:
+        >>> actions = ActionIndex.actions_of(HidingProcess(RenamingProcess(PrefixedProcess(DualAction("a"), NilProcess()), [Renaming(Action("b"), Action("a"))]), ActionSet([Action("c")])))
+        >>> list(map(str, actions))
+        ['a', 'b', 'c']
+        """
+        actions: dict[Action, None] = {}
+        # Renamings and hidings follow their process in the source, hence their actions are pushed before it
+        stack: list[Process | list[Action]] = [process]
+        while stack:
+            match stack.pop():
+                case list() as pending: actions.update(dict.fromkeys(pending))
+                case NilProcess() | ProcessByName(): pass
+                case SumProcesses(sums=children) | ParallelProcesses(parallels=children):
+                    stack.extend(reversed(children))
+                case PrefixedProcess(prefix=prefix, remaining=remaining):
+                    # Construct new (non-dual) action with the same name
+                    actions[Action(prefix.name)] = None
+                    stack.append(remaining)
+                case HidingProcess(process=p, hiding=hiding):
+                    if isinstance(hiding, ActionSet): stack.append(hiding.actions)
+                    stack.append(p)
+                case RenamingProcess(process=p, renaming=renaming):
+                    # Again, construct new (non-dual) actions with the same name
+                    stack.append([Action(r.new.name) for r in renaming])
+                    stack.append(p)
+                case p: raise TypeError(f"{p} may not be an abstract process.")
+        return actions
+
+    def _add(self, kind: int, name: str, actions: tp.Iterable[Action]) -> None:
+        for action in dict.fromkeys(actions):
+            uses = self._uses.get(action)
+            if uses is None:
+                uses = self._uses[action] = ({}, {})
+            uses[kind][name] = uses[kind].get(name, 0) + 1
+
+    def _remove(self, kind: int, name: str, actions: tp.Iterable[Action]) -> None:
+        for action in dict.fromkeys(actions):
+            uses = self._uses.get(action)
+            if uses is None or name not in uses[kind]:
+                raise ValueError(f"{action} is not used by {name}")
+            if uses[kind][name] > 1:
+                uses[kind][name] -= 1
+                continue
+            del uses[kind][name]
+            if not uses[0] and not uses[1]:
+                del self._uses[action]
+
+    def add_process(self, name: str, actions: tp.Iterable[Action]) -> None:
+        """
+        Records the actions used by a process assignment
+
+        :param str name: The name of the process assignment
+        :param Iterable[Action] actions: The (non-dual) actions it uses, c.f. :meth:`actions_of`
+        """
+        self._add(0, name, actions)
+
+    def remove_process(self, name: str, actions: tp.Iterable[Action]) -> None:
+        """
+        Forgets the actions used by a process assignment
+
+        :param str name: The name of the process assignment
+        :param Iterable[Action] actions: The (non-dual) actions it uses, as passed to :meth:`add_process`
+        :raises ValueError: If an action was not recorded for the process assignment
+        """
+        self._remove(0, name, actions)
+
+    def add_action_set(self, name: str, actions: tp.Iterable[Action]) -> None:
+        """
+        Records the actions of an action set assignment
+
+        :param str name: The name of the action set assignment
+        :param Iterable[Action] actions: The actions of the set
+        """
+        self._add(1, name, actions)
+
+    def remove_action_set(self, name: str, actions: tp.Iterable[Action]) -> None:
+        """
+        Forgets the actions of an action set assignment
+
+        :param str name: The name of the action set assignment
+        :param Iterable[Action] actions: The actions of the set
+        :raises ValueError: If an action was not recorded for the action set assignment
+        """
+        self._remove(1, name, actions)
+
+    def processes_using(self, action: Action) -> set[str]:
+        """
+        :param Action action: The (non-dual) action
+        :return set[str]: The names of the process assignments using `action`
+        """
+        uses = self._uses.get(action)
+        return set(uses[0]) if uses else set()
+
+    def action_sets_using(self, action: Action) -> set[str]:
+        """
+        :param Action action: The action
+        :return set[str]: The names of the action set assignments containing `action`
+        """
+        uses = self._uses.get(action)
+        return set(uses[1]) if uses else set()
+
+    def __contains__(self, action: object) -> bool:
+        return action in self._uses
+
+    def __iter__(self) -> tp.Iterator[Action]:
+        return iter(self._uses)
+
+    def __len__(self) -> int:
+        return len(self._uses)
+
+@dataclass(slots=True)
 class CcsRepresentation:
     """
     Representation a closed CCS expression.
 
+    Assignments should be added and removed via :meth:`add` and :meth:`remove`, which keep the `alphabet` and the symbol tables `processes` and `action_sets` up to date.
+    If a name is defined multiple times, the symbol tables refer to its first definition.
+
     :param list[ProcessAssignment] process_assignments: The defined processes in the CCS expression
     :param list[ActionSetAssignment] action_set_assignments: The defined action sets in the CCS expression
+    :param ActionIndex alphabet: The index of all used actions. If it is empty, it is built from the assignments.
+
+    Example:
+    >>> ccs = CcsRepresentation([ProcessAssignment("A", PrefixedProcess(DualAction("a"), NilProcess()))], [])
+    >>> Action("a") in ccs.alphabet
+    True
+    >>> ccs.add(ActionSetAssignment("H", ActionSet([Action("b")])))
+    >>> sorted(map(str, ccs.get_all_actions()))
+    ['a', 'b']
+    >>> str(ccs.get_action_set("H"))
+    'set H = {b};'
     """
     process_assignments: list[ProcessAssignment]
     action_set_assignments: list[ActionSetAssignment]
+    alphabet: ActionIndex = field(default_factory=ActionIndex, compare=False, repr=False)
+    processes: dict[str, ProcessAssignment] = field(init=False, default_factory=dict, compare=False, repr=False)
+    action_sets: dict[str, ActionSetAssignment] = field(init=False, default_factory=dict, compare=False, repr=False)
 
-    def get_all_actions(self) -> set[Action]:
+    def __post_init__(self):
+        for pa in self.process_assignments:
+            self.processes.setdefault(pa.name, pa)
+        for asa in self.action_set_assignments:
+            self.action_sets.setdefault(asa.name, asa)
+
+        if not self.alphabet:
+            for asa in self.action_set_assignments:
+                self.alphabet.add_action_set(asa.name, asa.actionSet.actions)
+            for pa in self.process_assignments:
+                self.alphabet.add_process(pa.name, ActionIndex.actions_of(pa.process))
+
+    def add(self, assignment: ProcessAssignment | ActionSetAssignment) -> None:
         """
-        Collects all actions present in the given CCS Representation. This includes all actions used in the processes in their non-dual form as well as all actions present in any defined action set
+        Adds an assignment and indexes its actions
+
+        :param ProcessAssignment | ActionSetAssignment assignment: The assignment to add
         """
-        actions: set[Action] = set()
-        
-        # Gather actions from action set assignments
-        for asa in self.action_set_assignments:
-            actions = actions.union(set(asa.actionSet.actions))
+        match assignment:
+            case ProcessAssignment(name=name, process=process):
+                self.process_assignments.append(assignment)
+                self.processes.setdefault(name, assignment)
+                self.alphabet.add_process(name, ActionIndex.actions_of(process))
+            case ActionSetAssignment(name=name, actionSet=action_set):
+                self.action_set_assignments.append(assignment)
+                self.action_sets.setdefault(name, assignment)
+                self.alphabet.add_action_set(name, action_set.actions)
+
+    def remove(self, assignment: ProcessAssignment | ActionSetAssignment) -> None:
+        """
+        Removes an assignment and its actions from the index
 
-        # Gather actions from process assignments
-        def _gather_helper(p: Process) -> set[Action]:
-            match p:
-                case NilProcess() | ProcessByName(): return set()
-                case PrefixedProcess(prefix=prefix, remaining=remaining):
-                    # Construct new (non-dual) action with the same name
-                    return _gather_helper(remaining).union(set([Action(prefix.name)]))
-                case HidingProcess(process=process, hiding=hiding):
-                    if isinstance(hiding, ActionSet): return _gather_helper(process).union(set(hiding.actions))
-                    else: return _gather_helper(process)
-                case RenamingProcess(process=process, renaming=renaming):
-                    return _gather_helper(process).union(
-                        # Again, construct new (non-dual) actions with the same name
-                        set([Action(r.new.name) for r in renaming])
-                    )
-                case SumProcesses(sums=processes) | ParallelProcesses(parallels=processes):
-                    return set[Action].union(*map(_gather_helper, processes))
-                case Process(): raise TypeError(f"{p} may not be an abstract process.")
+        :param ProcessAssignment | ActionSetAssignment assignment: The assignment to remove
+        :raises ValueError: If the assignment is not part of the representation
+        """
+        match assignment:
+            case ProcessAssignment(name=name, process=process):
+                self.process_assignments.remove(assignment)
+                if self.processes.get(name) is assignment:
+                    # Fall back to the next definition of the same name, if any
+                    del self.processes[name]
+                    for pa in self.process_assignments:
+                        if pa.name == name:
+                            self.processes[name] = pa
+                            break
+                self.alphabet.remove_process(name, ActionIndex.actions_of(process))
+            case ActionSetAssignment(name=name, actionSet=action_set):
+                self.action_set_assignments.remove(assignment)
+                if self.action_sets.get(name) is assignment:
+                    # Fall back to the next definition of the same name, if any
+                    del self.action_sets[name]
+                    for asa in self.action_set_assignments:
+                        if asa.name == name:
+                            self.action_sets[name] = asa
+                            break
+                self.alphabet.remove_action_set(name, action_set.actions)
+
+    def get_process(self, name: str) -> ProcessAssignment:
+        """
+        Looks up a process assignment by its name
 
-        for pa in self.process_assignments:
-            actions = actions.union(_gather_helper(pa.process))
+        :param str name: The name of the process
+        :return ProcessAssignment: The (first) assignment of the name
+        :raises ValueError: If the process is undefined
+        """
+        try:
+            return self.processes[name]
+        except KeyError:
+            raise ValueError(f"Process {name} is undefined") from None
+
+    def get_action_set(self, name: str) -> ActionSetAssignment:
+        """
+        Looks up an action set assignment by its name
 
-        return actions
\ No newline at end of file
+        :param str name: The name of the action set
+        :return ActionSetAssignment: The (first) assignment of the name
+        :raises ValueError: If the action set is undefined
+        """
+        try:
+            return self.action_sets[name]
+        except KeyError:
+            raise ValueError(f"ActionSet {name} is undefined") from None
+
+    def duplicate_names(self) -> list[str]:
+        """
+        Collects the names of processes and action sets which are defined multiple times, each reported once
+
+        :return list[str]: The names in order of their first definition
+        """
+        if len(self.processes) == len(self.process_assignments) and len(self.action_sets) == len(self.action_set_assignments):
+            return []
+
+        seen: set[tuple[bool, str]] = set()
+        duplicates: dict[str, None] = {}
+        for assignment in [*self.process_assignments, *self.action_set_assignments]:
+            key = (isinstance(assignment, ProcessAssignment), assignment.name)
+            if key in seen:
+                duplicates[assignment.name] = None
+            seen.add(key)
+        return list(duplicates)
+
+    def get_all_actions(self) -> set[Action]:
+        """
+        Collects all actions present in the given CCS Representation. This includes all actions used in the processes in their non-dual form as well as all actions present in any defined action set
+        """
+        return set(self.alphabet)
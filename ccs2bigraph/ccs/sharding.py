@@ -0,0 +1,281 @@
+"""
+Sharded Exploration of Labelled Transition Systems
+
+:class:`ShardedExplorer` explores the states reachable from a process like :meth:`CcsExplorer.explore`, but in several worker processes.
+Each state is owned by one worker, selected by a hash of its structural key, c.f. :meth:`CcsExplorer.encode`.
+Only the owner records whether a state was visited and expands it, hence the visited sets are disjoint shards.
+
+The exploration proceeds in rounds, i.e. breadth-first levels: in each round, every worker deduplicates the states sent to it, expands the new ones
+and sends their successors to their owners, batched into a single message per owner. The coordinating process only starts the rounds and detects termination.
+"""
+
+import logging
+logger = logging.getLogger(__name__)
+
+import multiprocessing
+import time
+import typing as tp
+import zlib
+from dataclasses import dataclass
+
+from .lts import CcsExplorer, Lts
+from .representation import *
+from .. import tracing
+
+_Entry = tuple[str, int, str]
+"""A state sent to its owner, with the global id of the source state and the label of the transition, or -1 for the initial state"""
+
+def _owner(key: str, workers: int) -> int:
+    """The worker owning a state, which has to be the same in all processes, unlike the builtin `hash` of strings"""
+    return zlib.crc32(key.encode()) % workers
+
+@dataclass(frozen=True, slots=True)
+class WorkerStatistics(object):
+    """
+    The work of a single worker of a :class:`ShardedExplorer`
+
+    :param int states: The number of states owned by the worker
+    :param int transitions: The number of outgoing transitions of these states
+    :param float seconds: The time spent deduplicating and expanding states, without waiting for the other workers
+
+    Example:
+    >>> WorkerStatistics(1000, 3000, 0.5).states_per_second
+    2000.0
+    """
+
+    states: int
+    transitions: int
+    seconds: float
+
+    @property
+    def states_per_second(self) -> float:
+        return self.states / self.seconds if self.seconds > 0 else 0.0
+
+@dataclass(frozen=True, slots=True)
+class ShardedExploration(object):
+    """
+    The result of :meth:`ShardedExplorer.explore`
+
+    :param int state_count: The number of reachable states
+    :param int transition_count: The number of transitions between them
+    :param int rounds: The number of rounds which found new states, i.e. of breadth-first levels
+    :param float seconds: The wall-clock time of the exploration
+    :param list[WorkerStatistics] workers: The work of each worker
+    :param Lts | None lts: The transition system, if collected
+    """
+
+    state_count: int
+    transition_count: int
+    rounds: int
+    seconds: float
+    workers: list[WorkerStatistics]
+    lts: Lts | None
+
+class ShardedExplorer(object):
+    """
+    Explores the transition systems of the processes of a :class:`CcsRepresentation` in several worker processes
+
+    Different from :class:`CcsExplorer`, the states of the collected transition system are numbered by worker, not in breadth-first order.
+    The numbering is deterministic for a fixed number of workers.
+
+    :param CcsRepresentation ccs: The representation, whose names have to be valid, c.f. :meth:`FinitePureCcsValidatior.validate_names`
+    :param int workers: The number of worker processes
+
+    Example:
+    >>> from .fast_grammar import parse
+    >>> explorer = ShardedExplorer(parse("A = a.'b.A; B = b.c.B; S = (A | B) \\\\ {b};"), workers=2)
+    >>> exploration = explorer.explore("S")
+    >>> exploration.state_count, exploration.transition_count, exploration.rounds
+    (4, 5, 4)
+    >>> sum(w.states for w in exploration.workers)
+    4
+    """
+
+    def __init__(self, ccs: CcsRepresentation, workers: int) -> None:
+        if workers < 1:
+            raise ValueError("At least one worker is required")
+        self._ccs = ccs
+        self._workers = workers
+        self.explorer = CcsExplorer(ccs)
+        """The explorer of the terms of the collected transition systems"""
+
+    def explore(self, init: str | Process, max_states: int | None = None, collect: bool = True) -> ShardedExploration:
+        """
+        Explores the states reachable from a process
+
+        :param str | Process init: The name of the initial process, or the initial process itself
+        :param int | None max_states: The maximal number of states, unbounded if None
+        :param bool collect: Whether to collect the transition system, which is assembled in the current process
+        :return ShardedExploration: The sizes of the state space and the work of the workers
+        :raises ValueError: If the state space exceeds `max_states`, or a process call is not guarded
+        """
+        workers = self._workers
+        key = self.explorer.encode(self.explorer.initial(init))
+
+        # Forking a process with running threads (e.g. the feeder threads of queues) may deadlock, hence prefer a fork server
+        context = multiprocessing.get_context("forkserver") if "forkserver" in multiprocessing.get_all_start_methods() else multiprocessing.get_context()
+        inboxes = [context.Queue() for _ in range(workers)]
+        controls = [context.Queue() for _ in range(workers)]
+        results = context.Queue()
+
+        with tracing.span("explore_sharded", workers=workers) as attributes:
+            start = time.perf_counter()
+            processes = [
+                context.Process(target=_explore_shard, args=(shard, self._ccs, inboxes, controls[shard], results, collect), daemon=True)
+                for shard in range(workers)
+            ]
+            for process in processes:
+                process.start()
+
+            try:
+                owner = _owner(key, workers)
+                for shard, inbox in enumerate(inboxes):
+                    inbox.put((0, 0, [(key, -1, "")] if shard == owner else []))
+
+                states = 0
+                rounds = 0
+                expected = 1
+                while True:
+                    for control in controls:
+                        control.put((rounds, expected))
+                    rounds += 1
+                    sent = 0
+                    for _ in range(workers):
+                        new, count = _result(results.get())
+                        states += new
+                        sent += count
+                    if max_states is not None and states > max_states:
+                        raise ValueError(f"The state space exceeds {max_states} states")
+                    if not sent:
+                        break
+                    expected = workers
+
+                for control in controls:
+                    control.put(None)
+                shards: list[tuple[WorkerStatistics, list[str], list[tuple[int, str, int]]]] = [tp.cast(tp.Any, None)] * workers
+                for _ in range(workers):
+                    shard, statistics, keys, transitions = _result(results.get())
+                    shards[shard] = (statistics, keys, transitions)
+                for process in processes:
+                    process.join()
+            finally:
+                for process in processes:
+                    if process.is_alive():
+                        process.terminate()
+                        process.join()
+
+            seconds = time.perf_counter() - start
+            statistics = [s for s, _, _ in shards]
+            lts = self._assemble(key, shards) if collect else None
+            exploration = ShardedExploration(states, sum(s.transitions for s in statistics), rounds - 1, seconds, statistics, lts)
+            attributes["states"] = exploration.state_count
+            attributes["transitions"] = exploration.transition_count
+            attributes["rounds"] = exploration.rounds
+
+        logger.info("Explored %d states and %d transitions with %d workers in %d rounds", exploration.state_count, exploration.transition_count, workers, exploration.rounds)
+        return exploration
+
+    def _assemble(self, initial: str, shards: list[tuple[WorkerStatistics, list[str], list[tuple[int, str, int]]]]) -> Lts:
+        """
+        Assembles the transition system from the shards, numbering the states by worker
+
+        :param str initial: The key of the initial state
+        :param shards: The statistics, the keys of the owned states and the transitions into them, as global source id, label and local target id, of each worker
+        :return Lts: The transition system
+        """
+        workers = self._workers
+        offsets: list[int] = []
+        terms: list[int] = []
+        for _, keys, _ in shards:
+            offsets.append(len(terms))
+            terms.extend(map(self.explorer.decode, keys))
+
+        transitions: list[list[tuple[str, int]]] = [[] for _ in terms]
+        for shard, (_, _, incoming) in enumerate(shards):
+            offset = offsets[shard]
+            for source, l, target in incoming:
+                transitions[offsets[source % workers] + source // workers].append((l, offset + target))
+        for outgoing in transitions:
+            outgoing.sort()
+
+        owner = _owner(initial, workers)
+        return Lts(terms, transitions, offsets[owner] + shards[owner][1].index(initial))
+
+def _result(message: tuple[tp.Any, ...]) -> tuple[tp.Any, ...]:
+    """Unpacks a message of a worker, raising the exception of a failed worker"""
+    if message[0] == "error":
+        raise message[1]
+    return message[1:]
+
+def _explore_shard(shard: int, ccs: CcsRepresentation, inboxes: list[tp.Any], control: tp.Any, results: tp.Any, collect: bool) -> None:
+    """
+    Explores the states owned by a worker process, c.f. :meth:`ShardedExplorer.explore`
+
+    Each round, the worker receives the batches of all workers, sends one batch to each worker and reports the number of new states and of sent states.
+    Finally, it reports its statistics and, if `collect`, the keys of its states and the transitions into them.
+    States are numbered globally by their local number times the number of workers plus the owning worker.
+
+    :param int shard: The number of the worker
+    :param CcsRepresentation ccs: The representation
+    :param list[Queue] inboxes: The batches sent to each worker, as round, sender and :data:`_Entry` list
+    :param Queue control: The rounds to run, as round and number of expected batches, or None at the end of the exploration
+    :param Queue results: The reports to the coordinating process
+    :param bool collect: Whether to collect the transition system
+    """
+    try:
+        workers = len(inboxes)
+        inbox = inboxes[shard]
+        explorer = CcsExplorer(ccs)
+        # The local number of each visited state by its term in `explorer`
+        visited: dict[int, int] = {}
+        # The key and owner of each successor term
+        owners: dict[int, tuple[str, int]] = {}
+        keys: list[str] = []
+        incoming: list[tuple[int, str, int]] = []
+        # Batches of the next round, which may overtake batches of the current round sent by slower workers
+        early: list[tuple[int, int, list[_Entry]]] = []
+        transitions = 0
+        seconds = 0.0
+
+        while (command := control.get()) is not None:
+            current, expected = command
+            received: dict[int, list[_Entry]] = {}
+            pending, early = early, []
+            while len(received) < expected:
+                number, sender, batch = pending.pop() if pending else inbox.get()
+                if number == current:
+                    received[sender] = batch
+                else:
+                    early.append((number, sender, batch))
+            early.extend(pending)
+
+            start = time.perf_counter()
+            batches: list[list[_Entry]] = [[] for _ in range(workers)]
+            new = 0
+            for sender in sorted(received):
+                for key, source, l in received[sender]:
+                    term = explorer.decode(key)
+                    state = visited.get(term)
+                    if state is None:
+                        state = visited[term] = len(visited)
+                        new += 1
+                        if collect:
+                            keys.append(key)
+                        gid = state * workers + shard
+                        for label, target in explorer.transitions(term):
+                            target_owner = owners.get(target)
+                            if target_owner is None:
+                                target_key = explorer.encode(target)
+                                target_owner = owners[target] = (target_key, _owner(target_key, workers))
+                            batches[target_owner[1]].append((target_owner[0], gid, label))
+                            transitions += 1
+                    if collect and source >= 0:
+                        incoming.append((source, l, state))
+            for receiver, batch in enumerate(batches):
+                inboxes[receiver].put((current + 1, shard, batch))
+            seconds += time.perf_counter() - start
+            results.put(("round", new, sum(map(len, batches))))
+
+        results.put(("done", shard, WorkerStatistics(len(visited), transitions, seconds), keys, incoming))
+    except Exception as e:
+        results.put(("error", e))
@@ -0,0 +1,95 @@
+"""
+Reachability Slicing of CCS Processes
+
+Restricts a :class:`CcsRepresentation` to the processes which the initial process may (transitively) call via :class:`ProcessByName`.
+"""
+
+import logging
+logger = logging.getLogger(__name__)
+
+from collections import deque
+
+from .representation import *
+from ..traversal import walk
+
+class CcsSlicer(object):
+    """
+    Wrapper class for Slicing
+    """
+
+    @staticmethod
+    def call_graph(ccs: CcsRepresentation) -> dict[str, list[str]]:
+        """
+        Static method to compute which processes each process refers to
+
+        If a process is defined multiple times, the references of all its definitions are combined.
+
+        :param CcsRepresentation ccs: The CCS to analyze
+        :return dict[str, list[str]]: The names of the processes called by each process, in order of their first occurrence
+
+        Example:
+        >>> CcsSlicer.call_graph(CcsRepresentation([
+        ...     ProcessAssignment("A", ParallelProcesses([ProcessByName("B"), ProcessByName("A"), ProcessByName("B")])),
+        ...     ProcessAssignment("B", NilProcess()),
+        ... ], []))
+        {'A': ['B', 'A'], 'B': []}
+        """
+        calls: dict[str, dict[str, None]] = {}
+        for pa in ccs.process_assignments:
+            called = calls.setdefault(pa.name, {})
+            for p in walk(pa.process):
+                if isinstance(p, ProcessByName):
+                    called[p.name] = None
+        return {name: list(called) for name, called in calls.items()}
+
+    @staticmethod
+    def reachable(ccs: CcsRepresentation, init_process: str) -> set[str]:
+        """
+        Static method to compute the processes reachable from `init_process`, including itself
+
+        References to undefined processes are ignored, c.f. :meth:`FinitePureCcsValidatior.validate_names`.
+
+        :param CcsRepresentation ccs: The CCS to analyze
+        :param str init_process: The name of the initial process
+        :return set[str]: The names of the reachable processes
+        :raises ValueError: If the initial process is undefined
+        """
+        ccs.get_process(init_process)
+        graph = CcsSlicer.call_graph(ccs)
+
+        reachable = {init_process}
+        queue = deque([init_process])
+        while queue:
+            for called in graph.get(queue.popleft(), []):
+                if called not in reachable and called in graph:
+                    reachable.add(called)
+                    queue.append(called)
+        return reachable
+
+    @staticmethod
+    def slice(ccs: CcsRepresentation, init_process: str) -> CcsRepresentation:
+        """
+        Static method to restrict `ccs` to the processes reachable from `init_process`
+
+        The processes keep their order, all action sets are kept.
+
+        :param CcsRepresentation ccs: The CCS to slice
+        :param str init_process: The name of the initial process
+        :return CcsRepresentation: The sliced CCS, sharing its assignments with `ccs`
+        :raises ValueError: If the initial process is undefined
+
+        Example:
+        >>> sliced = CcsSlicer.slice(CcsRepresentation([
+        ...     ProcessAssignment("A", ProcessByName("B")),
+        ...     ProcessAssignment("B", NilProcess()),
+        ...     ProcessAssignment("C", ProcessByName("A")),
+        ... ], []), "A")
+        >>> [pa.name for pa in sliced.process_assignments]
+        ['A', 'B']
+        """
+        reachable = CcsSlicer.reachable(ccs, init_process)
+        logger.info("Slicing keeps %d of %d processes", len(reachable), len(ccs.processes))
+        return CcsRepresentation(
+            [pa for pa in ccs.process_assignments if pa.name in reachable],
+            list(ccs.action_set_assignments),
+        )
@@ -5,6 +5,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 from .representation import *
+from ..traversal import walk
 
 class FinitePureCcsValidatior(object):
     """
@@ -21,50 +22,73 @@ class FinitePureCcsValidatior(object):
         :param CcsRepresentation ccs: CCS to check finity and pureness (i.e. whether or not all alternatives are guarded)
         """
 
-        def _traverse_helper(p: Process) -> bool:
+        def _validate_helper(p: Process) -> None:
             """
-            Returns whether or not the current process :param:`p` is valid
+            Checks the current process :param:`p` without its children
 
             :param Process p: The process to be validated
-            :return bool: Whether or not it is valid
+            :raises ValueError: If it is invalid
             """
             match p:
                 case SumProcesses(sums=sums):
                     # Check whether all children are prefixed
                     if not all([isinstance(s, PrefixedProcess) for s in sums]): 
                         raise ValueError("Unguarded child in Sum!", p)
-                    
-                    return all(map(_traverse_helper, sums))
                 
                 case NilProcess(): 
                     # Correct by definition
-                    return True
+                    pass
                 
                 case ProcessByName(): 
                     # TODO: is this correct?
-                    return True
+                    pass
                 
-                case PrefixedProcess(prefix=_, remaining=r): 
+                case PrefixedProcess(): 
                     # Check if parent is a SumProcess
                     if not isinstance(p.parent, SumProcesses): 
                         raise ValueError("Prefix without Sum-parent!", p)
-                    
-                    # Check remaining process after prefix
-                    return _traverse_helper(r)
                 
-                case HidingProcess(process=p, hiding=_): 
-                    # No errors possible, check remaining process
-                    return _traverse_helper(p)
-                
-                case RenamingProcess(process=p, renaming=_): 
-                    # No errors possible, check remaining process
-                    return _traverse_helper(p)
-                
-                case ParallelProcesses(parallels=ps): 
-                    return all(map(_traverse_helper, ps))
+                case HidingProcess() | RenamingProcess() | ParallelProcesses(): 
+                    # No errors possible, only the children need to be checked
+                    pass
                 
                 case Process(): 
                     raise TypeError(f"{p} may not be an abstract process.")
         
+        for pa in ccs.process_assignments:
+            for p in walk(pa.process):
+                _validate_helper(p)
+
+        # All Checks passed
+        return True
+
+    @staticmethod
+    def validate_names(ccs: CcsRepresentation) -> bool:
+        """
+        Static method to check that all referenced processes and action sets are defined exactly once
+
+        :param CcsRepresentation ccs: CCS to check
+        :raises ValueError: If a name is undefined or defined multiple times. All such names are reported together, each of them once.
+        """
+        # Undefined names in order of their first use
+        undefined: dict[str, None] = {}
+
+        for pa in ccs.process_assignments:
+            for p in walk(pa.process):
+                match p:
+                    case ProcessByName(name=name):
+                        if name not in ccs.processes:
+                            undefined[f"Process {name}"] = None
+                    case HidingProcess(hiding=ActionSetByName(name=name)):
+                        if name not in ccs.action_sets:
+                            undefined[f"ActionSet {name}"] = None
+                    case _:
+                        pass
+
+        errors = [f"{name} is undefined" for name in undefined]
+        errors += [f"{name} is defined multiple times" for name in ccs.duplicate_names()]
+        if errors:
+            raise ValueError("; ".join(errors))
+
         # All Checks passed
-        return all(map(_traverse_helper, [pa.process for pa in ccs.process_assignments]))
\ No newline at end of file
+        return True
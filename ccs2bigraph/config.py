@@ -4,11 +4,45 @@ Configuration Store
 All optional options set by argparse will hold their default values here.
 """
 
-from importlib.resources import files
-from importlib.resources.abc import Traversable
+import typing as tp
+from pathlib import Path
+
+if tp.TYPE_CHECKING:
+    from importlib.resources.abc import Traversable
 
 # Paths for the template
-control_template: Traversable = files('ccs2bigraph.templates').joinpath('controls.big')
-bigraphs_template: Traversable = files('ccs2bigraph.templates').joinpath('bigraphs.big')
-reactions_template: Traversable = files('ccs2bigraph.templates').joinpath('reactions.big')
-brs_template: Traversable = files('ccs2bigraph.templates').joinpath('brs.big')
\ No newline at end of file
+# Their defaults are resolved on first access, c.f. `__getattr__`, since importing importlib.resources noticeably slows down the CLI start.
+control_template: "Traversable"
+bigraphs_template: "Traversable"
+reactions_template: "Traversable"
+brs_template: "Traversable"
+
+_DEFAULT_TEMPLATES = {
+    "control_template": "controls.big",
+    "bigraphs_template": "bigraphs.big",
+    "reactions_template": "reactions.big",
+    "brs_template": "brs.big",
+}
+
+def __getattr__(name: str) -> tp.Any:
+    """Resolves the default template paths on first access"""
+    if name in _DEFAULT_TEMPLATES:
+        from importlib.resources import files
+        value = files('ccs2bigraph.templates').joinpath(_DEFAULT_TEMPLATES[name])
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Cache of parsed CCS input files, disabled if None
+cache_dir: Path | None = None
+cache_max_entries: int = 256
+
+# Translation: whether each Nil process keeps all actions as idle names
+add_actions: bool = False
+
+# Translation: whether only the processes reachable from the initial process are translated
+slice_unreachable: bool = False
+
+# Translation: minimal size of repeated subterms lifted into shared bigraph definitions, disabled if None
+extract_min_size: int | None = None
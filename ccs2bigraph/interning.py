@@ -0,0 +1,115 @@
+"""
+Interning of Named and Compound Terms
+
+Large models refer to the same few hundred action, link and control names millions of times.
+Classes deriving from :class:`Interned` are flyweights: constructing them with an equal name returns the very same (immutable) instance.
+
+Compound terms are hash-consed by :class:`HashConsing`: constructing a term from the same arguments returns the very same instance.
+Since the arguments are hash-consed themselves, structurally equal terms are identical, so equality and hashing are by identity and thus take constant time.
+"""
+
+import sys
+import typing as tp
+import weakref
+from abc import ABCMeta
+
+_instances: dict[tuple[type, str], tp.Any] = {}
+"""All interned instances by their class and name. Bounded by the number of distinct names."""
+
+class Interned(object):
+    """
+    Mixin for frozen, slotted dataclasses whose only field is `name`.
+
+    The dataclass must be declared with `init=False`, since the instance is initialized in `__new__`.
+
+    Example:
+    >>> from dataclasses import dataclass
+    >>> @dataclass(frozen=True, slots=True, init=False)
+    ... class Name(Interned):
+    ...     name: str
+    >>> Name("a") is Name("a")
+    True
+    """
+
+    __slots__ = ()
+
+    name: str
+
+    def __new__(cls, name: str) -> tp.Self:
+        key = (cls, name)
+        instance = _instances.get(key)
+        if instance is None:
+            instance = object.__new__(cls)
+            object.__setattr__(instance, "name", sys.intern(name))
+            _instances[key] = instance
+        return instance
+
+    def __reduce__(self) -> tuple[type, tuple[str]]:
+        # Unpickling and copying go through `__new__`, hence preserve the interning
+        return (type(self), (self.name,))
+
+_terms: dict[tuple[tp.Any, ...], weakref.ref] = {}
+"""Weak references to all live hash-consed instances by their class and arguments"""
+
+class _Entry(weakref.ref):
+    """
+    A weak reference in `_terms`, which removes its entry once the instance is collected
+
+    The key refers to the arguments strongly. Removing it right away releases the subterms of a collected term, which are thereby collected in turn.
+    """
+
+    __slots__ = ("key",)
+
+    def __new__(cls, instance: tp.Any, key: tuple[tp.Any, ...]) -> tp.Self:
+        return super().__new__(cls, instance, _remove)
+
+    def __init__(self, instance: tp.Any, key: tuple[tp.Any, ...]) -> None:
+        super().__init__(instance, _remove)
+        self.key = key
+
+def _remove(entry: weakref.ref) -> None:
+    """Removes the entry of a collected instance, unless it was replaced by a new instance meanwhile"""
+    key = tp.cast(_Entry, entry).key
+    if _terms.get(key) is entry:
+        del _terms[key]
+
+class HashConsing(ABCMeta):
+    """
+    Metaclass for frozen, slotted dataclasses which are compared by identity, i.e. declared with `eq=False`.
+
+    The fields must be immutable and hashable, except for lists, which are converted to tuples.
+    Instances must be weakly referenceable, i.e. a base class must declare a `__weakref__` slot.
+    The instances are only referenced weakly, so they are collected as usual.
+
+    Example:
+    >>> from dataclasses import dataclass
+    >>> class Term(metaclass=HashConsing):
+    ...     __slots__ = ("__weakref__",)
+    >>> @dataclass(frozen=True, slots=True, eq=False)
+    ... class Pair(Term):
+    ...     left: tp.Any
+    ...     right: tp.Any
+    >>> Pair(1, [2]) is Pair(1, right=[2])
+    True
+    >>> Pair(1, [2]).right
+    (2,)
+    >>> {Pair(1, 2), Pair(1, 2), Pair(2, 1)} == {Pair(2, 1), Pair(1, 2)}
+    True
+    """
+
+    def __call__(cls, *args: tp.Any, **kwargs: tp.Any) -> tp.Any:
+        if kwargs:
+            args = (*args, *(kwargs[name] for name in cls.__match_args__[len(args):])) # pyright: ignore[reportAttributeAccessIssue]
+        if list in map(type, args):
+            args = tuple(tuple(a) if type(a) is list else a for a in args)
+
+        key = (cls, *args)
+        ref = _terms.get(key)
+        if ref is not None:
+            instance = ref()
+            if instance is not None:
+                return instance
+
+        instance = super().__call__(*args)
+        _terms[key] = _Entry(instance, key)
+        return instance
@@ -0,0 +1,105 @@
+"""
+Tracing of Pipeline Stages
+
+The stages of the pipeline (parse, augment, validate, translate, serialize, ...) are wrapped in a :func:`span`.
+Once tracing is enabled by :func:`enable`, each finished span is written as one JSON object per line, containing
+- `span`: the name of the stage,
+- `parent`: the name of the enclosing span, if any,
+- `start`: the seconds since tracing was enabled,
+- `duration_ms`: the duration of the stage,
+- `allocated_blocks`: the change in the number of allocated memory blocks (c.f. :func:`sys.getallocatedblocks`), i.e. the memory retained by the stage,
+- `error`: the name of the exception leaving the span, if any,
+- and any additional attributes of the span.
+
+Spans are written when they end, i.e. nested spans precede their parent.
+While tracing is disabled, a span only costs a function call, hence spans are meant for stages and not for individual terms.
+"""
+
+import sys
+import time
+import typing as tp
+from contextlib import contextmanager
+
+_sink: tp.TextIO | None = None
+"""The file the spans are written to, tracing is disabled if None"""
+
+_origin = 0
+"""The time tracing was enabled, in nanoseconds"""
+
+_open: list[str] = []
+"""The names of the currently open spans, innermost last"""
+
+def enable(fp: tp.TextIO) -> None:
+    """
+    Writes all following spans to a file
+
+    :param TextIO fp: The file, which is flushed after each span
+    """
+    global _sink, _origin
+    _sink = fp
+    _origin = time.perf_counter_ns()
+
+def disable() -> None:
+    """Stops writing spans"""
+    global _sink
+    _sink = None
+
+def enabled() -> bool:
+    """Whether spans are written"""
+    return _sink is not None
+
+@contextmanager
+def span(name: str, **attributes: tp.Any) -> tp.Iterator[dict[str, tp.Any]]:
+    """
+    Measures a stage
+
+    :param str name: The name of the stage
+    :param Any attributes: Additional JSON-serializable attributes of the span
+    :return Iterator[dict[str, Any]]: The attributes, to which further attributes may be added while the span is open
+
+    Example:
+    >>> import io, json
+    >>> trace = io.StringIO()
+    >>> enable(trace)
+    >>> with span("outer", size=2):
+    ...     with span("inner") as attributes:
+    ...         attributes["items"] = 3
+    >>> disable()
+    >>> [(s["span"], s["parent"], s.get("size"), s.get("items")) for s in map(json.loads, trace.getvalue().splitlines())]
+    [('inner', 'outer', None, 3), ('outer', None, 2, None)]
+    """
+    if _sink is None:
+        yield attributes
+        return
+
+    parent = _open[-1] if _open else None
+    _open.append(name)
+    error = None
+    blocks = sys.getallocatedblocks()
+    start = time.perf_counter_ns()
+    try:
+        yield attributes
+    except BaseException as e:
+        error = type(e).__name__
+        raise
+    finally:
+        end = time.perf_counter_ns()
+        blocks = sys.getallocatedblocks() - blocks
+        _open.pop()
+
+        sink = _sink
+        if sink is not None:
+            # Imported only when tracing, to keep the start of the CLI fast
+            import json
+            record: dict[str, tp.Any] = {
+                "span": name,
+                "parent": parent,
+                "start": round((start - _origin) / 1e9, 6),
+                "duration_ms": round((end - start) / 1e6, 3),
+                "allocated_blocks": blocks,
+            }
+            if error is not None:
+                record["error"] = error
+            record.update(attributes)
+            sink.write(json.dumps(record) + "\n")
+            sink.flush()
@@ -2,13 +2,19 @@
 Translation of a CCS representation to a Bigraph representation
 """
 
+import copy
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from functools import reduce
 from textwrap import dedent
 from .ccs import representation as ccs
 from .ccs.validation import FinitePureCcsValidatior 
 from .ccs.augmentation import CcsAugmentor
+from .ccs.slicing import CcsSlicer
 from .bigraph import representation as big
-from . import config
+from .bigraph.extraction import SubtermExtractor
+from . import config, tracing
+from .traversal import transform
 
 class FiniteCcsTranslator(object):
     """
@@ -84,11 +90,35 @@ class FiniteCcsTranslator(object):
     Besides the rule "ccs_dual" for synchronizing actions as defined by Millner, we introduced the rules "ccs_send", "ccs_get", "ccs_dual_hidden". Further, we introduced the rule "ccs_meta_call" for "calling" named processes.
     """
 
+    IDLE_NIL_NAME = "nil_actions"
+    """
+    Name of the bigraph assignment of `Nil` together with all actions as idle names, c.f. `config.add_actions`
+
+    The expansion is defined once and referred to by each translated :class:`NilProcess`, instead of being repeated for each of them.
+    """
+
     def __init__(self, ccs: ccs.CcsRepresentation, init_process: str) -> None:
+        if config.slice_unreachable:
+            # Only translate what the initial process may call, this also shrinks the agent in `start`
+            with tracing.span("slice"):
+                ccs = CcsSlicer.slice(ccs, init_process)
         self._ccs = ccs
-        self._ccs_actions = self._ccs.get_all_actions()
+        # The alphabet is indexed in order of first use, which keeps the generated idle names deterministic
+        self._ccs_actions = list(self._ccs.alphabet)
         self._init_bigraph = f"{init_process.lower()}_proc"
 
+    def _control_bigraph(self, control: str, link: str | None = None) -> big.ControlBigraph:
+        """
+        Constructs the control bigraph `control{link}`, or `control` without a link
+
+        Bigraphs are hash-consed, hence all occurences of the same control bigraph share one instance.
+
+        :param str control: The name of the control
+        :param str | None link: The name of the only link, if any
+        :return big.ControlBigraph: The control bigraph
+        """
+        return big.ControlBigraph(big.ControlByName(control), () if link is None else (big.Link(link),))
+
     def _bigraph_name_from_process_name(self, process_name: str) -> str:
         """
         Generates a bigraph name from a given process name
@@ -116,42 +146,30 @@ class FiniteCcsTranslator(object):
         :param ccs.ProcessAssignment process_assignment: The process assignment to be translated
         :return big.BigraphAssignment: The resulting translation. 
         """
-        def _translation_helper(current: ccs.Process) -> big.Bigraph:
+        def _translation_helper(current: ccs.Process, children: list[big.Bigraph]) -> big.Bigraph:
             match current:
                 case ccs.NilProcess():
                     if config.add_actions:
-                        merging: list[big.Bigraph] = [
-                            big.IdleNameBigraph(big.Link(a.name)) 
-                            for a in self._ccs_actions
-                        ]
-                        merging.append(big.ControlBigraph(big.ControlByName("Nil"), []))
-                        return big.MergedBigraphs(merging)
+                        # Refer to the shared expansion, c.f. `_generate_idle_nil_bigraph`
+                        return big.BigraphByName(self.IDLE_NIL_NAME)
                     else:
-                        return big.ControlBigraph(big.ControlByName("Nil"), [])
+                        return self._control_bigraph("Nil")
                 case ccs.ProcessByName(name=name):
                     # ProcessByName corresponds to a "call" to a process, hence represent it accordingly.
                     # Conveniently, together with the representation of ProcessAssignments, this also solves recursive calls
-                    link = big.Link(f"{name.lower()}_proc")
-                    return big.ControlBigraph(big.ControlByName("Call"), [link])
-                case ccs.PrefixedProcess(prefix=prefix, remaining=remaining):
+                    return self._control_bigraph("Call", f"{name.lower()}_proc")
+                case ccs.PrefixedProcess(prefix=prefix):
                     if isinstance(prefix, ccs.DualAction):
-                        ctrl = big.ControlBigraph(big.ControlByName("Send"), [big.Link(prefix.name)])
+                        ctrl = self._control_bigraph("Send", prefix.name)
                     else:
-                        ctrl = big.ControlBigraph(big.ControlByName("Get"), [big.Link(prefix.name)])
+                        ctrl = self._control_bigraph("Get", prefix.name)
 
-                    return big.NestingBigraph(ctrl, _translation_helper(remaining))
-                case ccs.HidingProcess(process=process, hiding=hiding):
+                    return big.NestingBigraph(ctrl, children[0])
+                case ccs.HidingProcess(hiding=hiding):
                     # Infer actual actionSet behind hiding
                     if isinstance(hiding, ccs.ActionSetByName):
-                        # Filter out all action sets with the matching name
-                        action_sets = list(filter(lambda a: a.name == hiding.name, self._ccs.action_set_assignments))
-                        
-                        if len(action_sets) > 1:
-                            raise ValueError("ActionSet is defined multiple times")
-                        if len(action_sets) == 0:
-                            raise ValueError("ActionSet is undefined")
-                        
-                        actions = action_sets[0].actionSet.actions
+                        # Duplicate definitions have already been rejected by the validation
+                        actions = self._ccs.get_action_set(hiding.name).actionSet.actions
                     else: actions = hiding.actions
 
                     # Create Links from actions
@@ -162,8 +180,8 @@ class FiniteCcsTranslator(object):
                         return big.ClosedBigraph(l, b) #type: ignore
 
                     # Create C(L, C(L, C(L, _t(p)))) form by folding/reducing
-                    return reduce(_closed_parameter_swap, links, _translation_helper(process))
-                case ccs.RenamingProcess(process=process, renaming=renaming):
+                    return reduce(_closed_parameter_swap, links, children[0])
+                case ccs.RenamingProcess(renaming=renaming):
                     # Helper to translate CCS renaming into Bigraph renaming
                     def _renaming_helper(ccs_renaming: ccs.Renaming) -> big.Renaming:
                         return big.Renaming(
@@ -178,14 +196,14 @@ class FiniteCcsTranslator(object):
                         return big.RenamingBigraph(r, b) #type: ignore
                     
                     # Create R(L, R(L, R(L, _t(p)))) form by folding/reducing
-                    return reduce(_renaming_parameter_swap, big_renamings, _translation_helper(process))
+                    return reduce(_renaming_parameter_swap, big_renamings, children[0])
                     
-                case ccs.ParallelProcesses(parallels=parallels):
-                    return big.MergedBigraphs(list(map(_translation_helper, parallels)))
-                case ccs.SumProcesses(sums=sums):
+                case ccs.ParallelProcesses():
+                    return big.MergedBigraphs(children)
+                case ccs.SumProcesses():
                     return big.NestingBigraph(
-                        big.ControlBigraph(big.ControlByName("Alt"), []),
-                        big.MergedBigraphs(list(map(_translation_helper, sums)))
+                        self._control_bigraph("Alt"),
+                        big.MergedBigraphs(children)
                     )
                 case ccs.Process(): raise TypeError(f"{current} may not be an abstract process.")
 
@@ -197,7 +215,7 @@ class FiniteCcsTranslator(object):
                             self._bigraph_name_from_process_name(process_assignment.name)
                         )
                     ]),
-                    _translation_helper(process_assignment.process)
+                    transform(process_assignment.process, _translation_helper)
                 )
             ) 
     
@@ -209,23 +227,49 @@ class FiniteCcsTranslator(object):
         # Initially, assert that
         # - there is at least one process to be translated
         # - the process is valid for pure finite ccs (i.e. all alternatives are prefix-guarded)
+        # - all referenced processes and action sets are defined exactly once
         # - TODO: Renaming must be valid
 
         if not len(self._ccs.process_assignments) >= 1:
             raise ValueError("No processes defined.")
-        if not FinitePureCcsValidatior.validate(self._ccs):
-            raise ValueError("Invalid Processes.")
+        with tracing.span("validate"):
+            if not FinitePureCcsValidatior.validate(self._ccs):
+                raise ValueError("Invalid Processes.")
+            if not FinitePureCcsValidatior.validate_names(self._ccs):
+                raise ValueError("Invalid Names.")
 
-        bigraph_assignments = [
-            self._generate_bigraph_assignment_from_process_assignment(pa)
-            for pa in self._ccs.process_assignments
-        ]
+        with tracing.span("generate", processes=len(self._ccs.process_assignments)):
+            bigraph_assignments = [
+                self._generate_bigraph_assignment_from_process_assignment(pa)
+                for pa in self._ccs.process_assignments
+            ]
 
         # Append template for initial bigraph, essentially "calling" the corresponding process
-        result = bigraph_assignments + [self._generate_init_bigraph(bigraph_assignments)]
+        result = self._generate_definitions() + bigraph_assignments + [self._generate_init_bigraph(bigraph_assignments)]
 
         return result
     
+    def _generate_idle_nil_bigraph(self) -> big.BigraphAssignment:
+        """
+        Generates the expansion of :class:`NilProcess` if `config.add_actions` is set, i.e. `Nil` together with all actions as idle names
+
+        :return big.BigraphAssignment: The assignment named `IDLE_NIL_NAME`
+        """
+        merging: list[big.Bigraph] = [
+            big.IdleNameBigraph(big.Link(a.name)) 
+            for a in self._ccs_actions
+        ]
+        merging.append(self._control_bigraph("Nil"))
+        return big.BigraphAssignment(self.IDLE_NIL_NAME, big.MergedBigraphs(merging))
+
+    def _generate_definitions(self) -> list[big.BigraphAssignment]:
+        """
+        Generates the bigraph assignments which the translated processes refer to
+
+        :return list[big.BigraphAssignment]: The assignments, which precede those of the processes
+        """
+        return [self._generate_idle_nil_bigraph()] if config.add_actions else []
+
     def _generate_init_bigraph(self, bigraph_assignments: list[big.BigraphAssignment]) -> big.BigraphAssignment:
 
         merging_wrapper: list[big.Bigraph] = [
@@ -252,12 +296,93 @@ class FiniteCcsTranslator(object):
             )
         )
 
-    def translate(self) -> big.BigraphRepresentation:
-        for pa in self._ccs.process_assignments:
-            pa.process = CcsAugmentor.augment(pa.process)
+    def _generate_bigraph_content_parallel(self, workers: int) -> list[big.BigraphAssignment]:
+        """
+        Applies the Ccs -> Bigraph transformation like `_generate_bigraph_content`, but augments, validates and translates the process assignments in `workers` processes
 
-        return big.BigraphRepresentation(
-            self.CCS_CONTROLS,
-            self._generate_bigraph_content(),
-            self.CCS_REACTION_RULES,
-        )
+        The process assignments are split into consecutive chunks, whose results are collected in order. Hence, the result is the same as that of `_generate_bigraph_content`.
+        Different from the single process translation, the process assignments of the CCS representation are not replaced by their augmentation.
+
+        :param int workers: The number of worker processes
+        """
+        process_assignments = self._ccs.process_assignments
+        if not len(process_assignments) >= 1:
+            raise ValueError("No processes defined.")
+
+        # Several chunks per worker balance differently sized processes
+        chunk_size = -(-len(process_assignments) // (workers * _CHUNKS_PER_WORKER))
+        chunks = [process_assignments[i:i + chunk_size] for i in range(0, len(process_assignments), chunk_size)]
+
+        # Workers only need the action sets and the alphabet, not all processes
+        worker = copy.copy(self)
+        worker._ccs = ccs.CcsRepresentation([], self._ccs.action_set_assignments)
+
+        # Forking a process with running threads (e.g. the pool's own manager thread) may deadlock, hence prefer a fork server
+        context = multiprocessing.get_context("forkserver") if "forkserver" in multiprocessing.get_all_start_methods() else None
+        with tracing.span("validate"):
+            if not FinitePureCcsValidatior.validate_names(self._ccs):
+                raise ValueError("Invalid Names.")
+
+        with tracing.span("generate", processes=len(process_assignments), chunks=len(chunks)):
+            with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker, initargs=(worker, config.add_actions)) as executor:
+                bigraph_assignments = [ba for result in executor.map(_translate_chunk, chunks) for ba in result]
+
+        # Append template for initial bigraph, essentially "calling" the corresponding process
+        return self._generate_definitions() + bigraph_assignments + [self._generate_init_bigraph(bigraph_assignments)]
+
+    def translate(self, workers: int = 1) -> big.BigraphRepresentation:
+        """
+        Translates the CCS representation
+
+        :param int workers: The number of worker processes, the translation runs in the current process if it is 1
+        :return big.BigraphRepresentation: The translation, which does not depend on the number of workers
+        """
+        if workers < 1:
+            raise ValueError("At least one worker is required")
+        with tracing.span("translate", workers=workers):
+            if workers > 1:
+                content = self._generate_bigraph_content_parallel(workers)
+            else:
+                with tracing.span("augment"):
+                    for pa in self._ccs.process_assignments:
+                        pa.process = CcsAugmentor.augment(pa.process)
+                content = self._generate_bigraph_content()
+
+            if config.extract_min_size is not None:
+                with tracing.span("extract", min_size=config.extract_min_size) as attributes:
+                    content = SubtermExtractor(config.extract_min_size).extract(content)
+                    attributes["assignments"] = len(content)
+
+            return big.BigraphRepresentation(
+                self.CCS_CONTROLS,
+                content,
+                self.CCS_REACTION_RULES,
+            )
+
+_CHUNKS_PER_WORKER = 4
+
+_worker: FiniteCcsTranslator | None = None
+"""The translator of a worker process, c.f. `FiniteCcsTranslator._generate_bigraph_content_parallel`"""
+
+def _init_worker(translator: FiniteCcsTranslator, add_actions: bool) -> None:
+    global _worker
+    _worker = translator
+    # The configuration is not inherited if worker processes are spawned
+    config.add_actions = add_actions
+
+def _translate_chunk(process_assignments: list[ccs.ProcessAssignment]) -> list[big.BigraphAssignment]:
+    """
+    Augments, validates and translates a chunk of process assignments in a worker process
+
+    :param list[ccs.ProcessAssignment] process_assignments: The chunk
+    :return list[big.BigraphAssignment]: The translations, in the same order
+    """
+    assert _worker is not None
+    for pa in process_assignments:
+        pa.process = CcsAugmentor.augment(pa.process)
+    if not FinitePureCcsValidatior.validate(ccs.CcsRepresentation(process_assignments, [])):
+        raise ValueError("Invalid Processes.")
+    return [
+        _worker._generate_bigraph_assignment_from_process_assignment(pa) # pyright: ignore[reportPrivateUsage]
+        for pa in process_assignments
+    ]
@@ -0,0 +1,75 @@
+"""
+Iterative Traversal of Terms
+
+Both CCS processes (:class:`ccs2bigraph.ccs.representation.Process`) and bigraphs (:class:`ccs2bigraph.bigraph.representation.Bigraph`) expose their direct subterms via `children()`.
+The functions in this file traverse such terms with an explicit stack instead of recursion, so that the depth of a term is only limited by memory.
+"""
+
+import typing as tp
+
+class Node(tp.Protocol):
+    """A term whose direct subterms are accessible via `children()`"""
+
+    def children(self) -> tp.Sequence[tp.Any]: ...
+
+N = tp.TypeVar("N", bound=Node)
+R = tp.TypeVar("R")
+
+def walk(root: N) -> tp.Iterator[N]:
+    """
+    Visits all subterms of `root` (including `root` itself) in pre-order, i.e. parents before their children and children from left to right.
+
+    :param N root: The term to traverse
+    :return Iterator[N]: The subterms
+
+    Example:
+    >>> from ccs2bigraph.ccs.representation import *
+    >>> list(map(str, walk(SumProcesses([PrefixedProcess(Action("a"), NilProcess()), ProcessByName("B")]))))
+    ['((a.0) + B)', '(a.0)', '0', 'B']
+    """
+    stack: list[N] = [root]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        node = pop()
+        yield node
+        children = node.children()
+        if children:
+            extend(reversed(children))
+
+def transform(root: N, rebuild: tp.Callable[[N, list[R]], R]) -> R:
+    """
+    Computes a result for `root` bottom-up, i.e. in post-order.
+
+    For every subterm, `rebuild` is called with the subterm itself and the results of its children (in order).
+
+    :param N root: The term to transform
+    :param Callable[[N, list[R]], R] rebuild: Computes the result of a subterm from the results of its children
+    :return R: The result of `root`
+
+    Example:
+    >>> from ccs2bigraph.ccs.representation import *
+    >>> transform(SumProcesses([PrefixedProcess(Action("a"), NilProcess()), ProcessByName("B")]), lambda p, depths: 1 + max(depths, default=0))
+    3
+    """
+    results: list[R] = []
+    # Each entry is a subterm and the number of its children, or -1 if its children are not expanded yet
+    stack: list[tuple[N, int]] = [(root, -1)]
+    pop = stack.pop
+    push = stack.append
+
+    while stack:
+        node, count = pop()
+        if count < 0:
+            children = node.children()
+            push((node, len(children)))
+            for child in reversed(children):
+                push((child, -1))
+        elif count == 0:
+            results.append(rebuild(node, []))
+        else:
+            arguments = results[-count:]
+            del results[-count:]
+            results.append(rebuild(node, arguments))
+
+    return results[0]
@@ -0,0 +1,114 @@
+"""Bigraph Subterm Extraction Tests"""
+
+import pathlib
+
+import pytest
+
+from ccs2bigraph.bigraph.extraction import *
+from ccs2bigraph.bigraph.representation import *
+from ccs2bigraph.bigraph.validation import BigraphValidator
+from ccs2bigraph.ccs.fast_grammar import parse
+from ccs2bigraph.translation import FiniteCcsTranslator
+from ccs2bigraph.traversal import transform
+from ccs2bigraph import config
+
+_DEKKER = pathlib.Path(__file__).parent / "res" / "dekker.ccs"
+
+def helper_inline(assignments: list[BigraphAssignment]) -> dict[str, Bigraph]:
+    """Replaces all references to shared assignments by their definitions"""
+    definitions: dict[str, Bigraph] = {}
+
+    def _inline(current: Bigraph, children: list[Bigraph]) -> Bigraph:
+        match current:
+            case BigraphByName(name=name) if name.startswith("shared_"): return definitions[name]
+            case ClosedBigraph(link=link): return ClosedBigraph(link, children[0])
+            case NestingBigraph(): return NestingBigraph(children[0], children[1]) # type: ignore
+            case RenamingBigraph(renaming=renaming): return RenamingBigraph(renaming, children[0])
+            case MergedBigraphs(): return MergedBigraphs(children)
+            case ParallelBigraphs(): return ParallelBigraphs(children)
+            case _: return current
+
+    for assignment in assignments:
+        definitions[assignment.name] = transform(assignment.bigraph, _inline)
+    return definitions
+
+def helper_alt(action: str, process: str) -> Bigraph:
+    return NestingBigraph(
+        ControlBigraph(ControlByName("Alt"), []),
+        NestingBigraph(ControlBigraph(ControlByName("Get"), [Link(action)]), ControlBigraph(ControlByName("Call"), [Link(process)]))
+    )
+
+class Test_Subterm_Extraction():
+    def test_no_repetition(self):
+        inp = [BigraphAssignment("a", helper_alt("x", "p")), BigraphAssignment("b", helper_alt("y", "p"))]
+        act = SubtermExtractor(2).extract(inp)
+        assert act == inp
+
+    def test_threshold(self):
+        inp = [
+            BigraphAssignment("a", MergedBigraphs([helper_alt("x", "p"), OneBigraph()])),
+            BigraphAssignment("b", MergedBigraphs([helper_alt("x", "p"), IdBigraph()])),
+        ]
+        assert len(SubtermExtractor(5).extract(inp)) == 3
+        assert len(SubtermExtractor(6).extract(inp)) == 2
+
+    def test_nested_repetition_lifted_once(self):
+        # The inner alternative only repeats within the outer merging, hence only the outer one is lifted
+        outer = MergedBigraphs([helper_alt("x", "p"), OneBigraph()])
+        inp = [BigraphAssignment("a", MergedBigraphs([outer, IdBigraph()])), BigraphAssignment("b", MergedBigraphs([IdBigraph(), outer]))]
+        act = SubtermExtractor(2).extract(inp)
+        assert [str(a) for a in act] == [
+            "big shared_0 = ((Alt.(Get{x}.Call{p})) | 1);",
+            "big a = (shared_0 | id);",
+            "big b = (id | shared_0);",
+        ]
+
+    def test_inner_definitions_first(self):
+        inp = [
+            BigraphAssignment("a", MergedBigraphs([MergedBigraphs([helper_alt("x", "p"), OneBigraph()]), IdBigraph()])),
+            BigraphAssignment("b", MergedBigraphs([MergedBigraphs([helper_alt("x", "p"), OneBigraph()]), OneBigraph()])),
+            BigraphAssignment("c", MergedBigraphs([helper_alt("x", "p"), IdBigraph()])),
+        ]
+        act = SubtermExtractor(2).extract(inp)
+        assert [str(a) for a in act] == [
+            "big shared_0 = (Alt.(Get{x}.Call{p}));",
+            "big shared_1 = (shared_0 | 1);",
+            "big a = (shared_1 | id);",
+            "big b = (shared_1 | 1);",
+            "big c = (shared_0 | id);",
+        ]
+
+    def test_definitions_after_referenced_assignments(self):
+        # The lifted subterm refers to the assignment `n`, hence it has to be defined after it
+        alt = NestingBigraph(ControlBigraph(ControlByName("Alt"), []), MergedBigraphs([BigraphByName("n"), OneBigraph()]))
+        inp = [
+            BigraphAssignment("n", ControlBigraph(ControlByName("Nil"), [])),
+            BigraphAssignment("a", MergedBigraphs([alt, IdBigraph()])),
+            BigraphAssignment("b", MergedBigraphs([OneBigraph(), alt])),
+        ]
+        act = SubtermExtractor(2).extract(inp)
+        assert [str(a) for a in act] == [
+            "big n = Nil;",
+            "big shared_0 = (Alt.(n | 1));",
+            "big a = (shared_0 | id);",
+            "big b = (1 | shared_0);",
+        ]
+
+    def test_name_clash(self):
+        inp = [BigraphAssignment("shared_0", MergedBigraphs([helper_alt("x", "p"), helper_alt("x", "p")]))]
+        act = SubtermExtractor(2).extract(inp)
+        assert act[0].name == "shared_1"
+
+    def test_invalid_min_size(self):
+        with pytest.raises(ValueError):
+            SubtermExtractor(1)
+
+    def test_translation_equivalent(self, monkeypatch: pytest.MonkeyPatch):
+        exp = FiniteCcsTranslator(parse(_DEKKER.read_text()), "Dekker-2").translate()
+        monkeypatch.setattr(config, "extract_min_size", 3)
+        act = FiniteCcsTranslator(parse(_DEKKER.read_text()), "Dekker-2").translate()
+
+        assert len(act.bigraphs) > len(exp.bigraphs)
+        assert BigraphValidator(act).validate()
+        inlined = helper_inline(act.bigraphs)
+        assert all(inlined[a.name] == a.bigraph for a in exp.bigraphs)
@@ -1,5 +1,12 @@
 """Bigraph Representation Tests"""
 
+import copy
+import gc
+import io
+import pickle
+
+from ccs2bigraph import interning
+
 from ccs2bigraph.bigraph.representation import *
 
 class Test_Control():
@@ -40,6 +47,60 @@ class Test_Link():
         act = str(inp)
         assert exp == act
 
+    def test_interned_link(self):
+        assert Link("a") is Link("a")
+        assert ControlByName("A") is ControlByName("A")
+        assert copy.deepcopy(Link("a")) is Link("a")
+
+    def test_slots(self):
+        for node in [Link("a"), ControlBigraph(ControlByName("A"), []), OneBigraph(), MergedBigraphs([])]:
+            assert not hasattr(node, "__dict__")
+
+class Test_Hash_Consing():
+    def _bigraph(self) -> Bigraph:
+        return ClosedBigraph(Link("x"), MergedBigraphs([
+            NestingBigraph(ControlBigraph(ControlByName("A"), [Link("x")]), OneBigraph()),
+            RenamingBigraph(Renaming(Link("y"), [Link("x")]), IdBigraph()),
+        ]))
+
+    def test_identity(self):
+        inp = self._bigraph()
+        assert inp is self._bigraph()
+        assert inp == self._bigraph()
+        assert hash(inp) == hash(self._bigraph())
+        assert MergedBigraphs([OneBigraph()]) is not ParallelBigraphs([OneBigraph()])
+        assert ControlBigraph(ControlByName("A"), [Link("x")]) is ControlBigraph(control=ControlByName("A"), links=(Link("x"),))
+
+    def test_tuples(self):
+        inp = MergedBigraphs([OneBigraph(), IdBigraph()])
+        assert inp.merging == (OneBigraph(), IdBigraph())
+        assert Renaming(Link("y"), [Link("x")]).olds == (Link("x"),)
+
+    def test_copy_and_pickle(self):
+        inp = self._bigraph()
+        assert copy.copy(inp) is inp
+        assert copy.deepcopy(inp) is inp
+        assert pickle.loads(pickle.dumps(inp)) is inp
+        assert pickle.loads(pickle.dumps(Renaming(Link("y"), [Link("x")]))) is Renaming(Link("y"), [Link("x")])
+
+    def test_collected(self):
+        inp = NestingBigraph(ControlBigraph(ControlByName("Collected"), []), IdBigraph())
+        key = (NestingBigraph, inp.control, inp.inner)
+        assert key in interning._terms # pyright: ignore[reportPrivateUsage]
+        del inp
+        gc.collect()
+        assert key not in interning._terms # pyright: ignore[reportPrivateUsage]
+
+    def test_collected_deep(self):
+        before = len(interning._terms) # pyright: ignore[reportPrivateUsage]
+        inp = ControlBigraph(ControlByName("Collected"), [Link("deep")])
+        for i in range(20000):
+            inp = NestingBigraph(ControlBigraph(ControlByName("Collected"), [Link(f"deep{i % 7}")]), MergedBigraphs([inp, IdBigraph()]))
+        assert len(interning._terms) > before + 20000 # pyright: ignore[reportPrivateUsage]
+        del inp
+        gc.collect()
+        assert len(interning._terms) <= before + 7 # pyright: ignore[reportPrivateUsage]
+
 class Test_Bigraph():
     def test_one_bigraph(self):
         inp = OneBigraph()
@@ -313,3 +374,39 @@ class Test_Complex_Bigraph():
         exp = r"(/x (/z (/w ((M{x}.((K{x,z}.1) | (L.(K{z,w}.1)))) || (K{w,x}.(M{w}.1))))))"
         act = str(inp)
         assert exp == act
+
+class Test_Write():
+    def _write(self, bigraph: Bigraph) -> str:
+        buffer = io.StringIO()
+        write_bigraph(buffer, bigraph)
+        return buffer.getvalue()
+
+    def test_same_as_str(self):
+        inp = ClosedBigraph(Link("x"), ParallelBigraphs([
+            RenamingBigraph(Renaming(Link("y"), [Link("a"), Link("b")]), MergedBigraphs([IdleNameBigraph(Link("a")), BigraphByName("B")])),
+            NestingBigraph(IdBigraph(), MergedBigraphs([])),
+            MergedBigraphs([OneBigraph()]),
+        ]))
+        exp = "(/x ((y/{a,b} ({a} | B)) || (id.()) || (1)))"
+        assert exp == str(inp)
+        assert exp == self._write(inp)
+
+    def test_deep_bigraph(self):
+        depth = 100_000
+        inp: Bigraph = OneBigraph()
+        for _ in range(depth):
+            inp = NestingBigraph(ControlBigraph(ControlByName("A"), []), inp)
+        act = self._write(inp)
+        assert act == "(A." * depth + "1" + ")" * depth
+
+    def test_representation(self):
+        inp = BigraphRepresentation(
+            [ControlDefinition(Control("A", 0))],
+            [BigraphAssignment("a", OneBigraph()), BigraphAssignment("b", MergedBigraphs([BigraphByName("a"), IdBigraph()]))],
+            [BigraphReaction("r", "A -> A;")],
+        )
+        exp = "ctrl A = 0;\n\nbig a = 1;\nbig b = (a | id);\n\nreact r =\n    A -> A;\n\nbegin brs\n    init start;\n    rules = [{r}];\nend\n"
+        buffer = io.StringIO()
+        inp.write_to(buffer)
+        assert exp == buffer.getvalue()
+        assert exp == str(inp)
@@ -204,4 +204,51 @@ class Test_Complex_Bigraph_Validation():
             ],
             [],
         )
-        assert BigraphValidator(inp).validate() == True
\ No newline at end of file
+        assert BigraphValidator(inp).validate() == True
+
+class Test_Violations():
+    def _controls(self) -> list[ControlDefinition]:
+        return [ControlDefinition(Control("A", 1)), ControlDefinition(AtomicControl("B", 0))]
+
+    def test_none(self):
+        inp = BigraphRepresentation(self._controls(), [BigraphAssignment("a", NestingBigraph(ControlBigraph(ControlByName("A"), [Link("x")]), ControlBigraph(ControlByName("B"), [])))], [])
+        assert BigraphValidator(inp).violations() == []
+
+    def test_all_occurrences(self):
+        shared = NestingBigraph(ControlBigraph(ControlByName("A"), [Link("x")]), ControlBigraph(ControlByName("C"), []))
+        inp = BigraphRepresentation(
+            self._controls(),
+            [
+                BigraphAssignment("a", MergedBigraphs([shared, ControlBigraph(ControlByName("B"), [Link("y")]), shared])),
+                BigraphAssignment("b", ClosedBigraph(Link("x"), shared)),
+            ],
+            [],
+        )
+        act = list(map(str, BigraphValidator(inp).violations()))
+        exp = [
+            "a[0][1]: Control C is undefined",
+            "a[1]: Control B has arity 0, but is used with 1 links",
+            "a[2][1]: Control C is undefined",
+            "b[0][1]: Control C is undefined",
+        ]
+        assert exp == act
+        assert not BigraphValidator(inp).validate()
+
+    def test_duplicate_control(self):
+        inp = BigraphRepresentation(
+            self._controls() + [ControlDefinition(Control("A", 1))],
+            [BigraphAssignment("a", ControlBigraph(ControlByName("A"), [Link("x")])), BigraphAssignment("b", OneBigraph())],
+            [],
+        )
+        act = BigraphValidator(inp).violations()
+        assert act == [BigraphViolation("a", (), "Control A is defined multiple times")]
+
+    def test_deep_bigraph(self):
+        depth = 100_000
+        bigraph: Bigraph = ControlBigraph(ControlByName("C"), [])
+        for i in range(depth):
+            bigraph = NestingBigraph(ControlBigraph(ControlByName("A"), [Link(f"x{i % 2}")]), bigraph)
+        inp = BigraphRepresentation(self._controls(), [BigraphAssignment("a", bigraph)], [])
+        act = BigraphValidator(inp).violations()
+        assert len(act) == 1
+        assert act[0].path == (1,) * depth
@@ -2,6 +2,7 @@
 
 from ccs2bigraph.ccs.representation import *
 from ccs2bigraph.ccs.augmentation import *
+from ccs2bigraph.traversal import walk
 
 import typing as tp
 
@@ -125,4 +126,40 @@ class Test_Process_Augmentation():
                     ])
                 ])
             )
-        ])
\ No newline at end of file
+        ])
+
+    def test_input_unchanged(self):
+        def build() -> Process:
+            return ParallelProcesses([
+                PrefixedProcess(Action("a"), PrefixedProcess(DualAction("b"), NilProcess())),
+                HidingProcess(SumProcesses([PrefixedProcess(Action("c"), NilProcess())]), ActionSet([Action("c")])),
+            ])
+        inp = CcsAugmentor._augment_parents(build()) # pyright: ignore[reportPrivateUsage]
+        parents = [(p, p.parent) for p in walk(inp)]
+
+        act = CcsAugmentor.augment(inp)
+
+        assert inp == build()
+        assert act != inp
+        for p, parent in parents:
+            assert p.parent is parent
+
+    def test_augmented_returned(self):
+        inp = CcsAugmentor.augment(ParallelProcesses([PrefixedProcess(Action("a"), NilProcess()), ProcessByName("B")]))
+        parents = [(p, p.parent) for p in walk(inp)]
+
+        act = CcsAugmentor.augment(inp)
+
+        assert act is inp
+        for p, parent in parents:
+            assert p.parent is parent
+
+    def test_parents_refer_to_result(self):
+        inp = ParallelProcesses([PrefixedProcess(Action("a"), PrefixedProcess(Action("b"), NilProcess())), NilProcess()])
+
+        act = CcsAugmentor.augment(inp)
+
+        assert act.parent is None
+        for p in walk(act):
+            for child in p.children():
+                assert child.parent is p
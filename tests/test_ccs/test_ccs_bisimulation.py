@@ -0,0 +1,237 @@
+"""CCS Bisimulation Tests"""
+
+import pathlib
+import random
+
+import pytest
+
+import ccs2bigraph.ccs.fast_grammar as fg
+from ccs2bigraph.ccs.bisimulation import Bisimulation, Distinction, TauClosure, WeakBisimulation, compare, union
+from ccs2bigraph.ccs.lts import CcsExplorer, Lts, TAU
+
+_RES = pathlib.Path(__file__).parent.parent / "res"
+_REGISTER = pathlib.Path(__file__).parent.parent.parent / "res" / "register.ccs"
+
+def _naive(lts: Lts) -> list[int]:
+    """Computes the classes of the coarsest strong bisimulation by refining with signatures until a fixpoint"""
+    classes = [0] * lts.state_count
+    while True:
+        ids: dict[tuple[int, frozenset[tuple[str, int]]], int] = {}
+        refined = [
+            ids.setdefault((classes[s], frozenset((l, classes[t]) for l, t in outgoing)), len(ids))
+            for s, outgoing in enumerate(lts.transitions)
+        ]
+        if len(ids) == len(set(classes)):
+            return refined
+        classes = refined
+
+def _random_lts(rng: random.Random, labels: tuple[str, ...] = ("a", "b")) -> Lts:
+    n = rng.randint(1, 10)
+    transitions: list[list[tuple[str, int]]] = [[] for _ in range(n)]
+    for _ in range(rng.randint(0, 25)):
+        transition = (rng.choice(labels), rng.randrange(n))
+        source = transitions[rng.randrange(n)]
+        if transition not in source:
+            source.append(transition)
+    return Lts(list(range(n)), transitions)
+
+def _internal(lts: Lts, states: set[int]) -> set[int]:
+    """The states reachable by internal transitions"""
+    reached = set(states)
+    stack = list(states)
+    while stack:
+        for l, t in lts.transitions[stack.pop()]:
+            if l == TAU and t not in reached:
+                reached.add(t)
+                stack.append(t)
+    return reached
+
+def _weak(lts: Lts, state: int, label: str, proper: bool = False) -> set[int]:
+    """The states reachable by a weak move"""
+    if label == TAU:
+        return _internal(lts, {t for l, t in lts.transitions[state] if l == TAU} if proper else {state})
+    return _internal(lts, {t for s in _internal(lts, {state}) for l, t in lts.transitions[s] if l == label})
+
+def _saturate(lts: Lts) -> Lts:
+    labels = {l for outgoing in lts.transitions for l, _ in outgoing} | {TAU}
+    return Lts(lts.terms, [[(l, t) for l in labels for t in _weak(lts, s, l)] for s in range(lts.state_count)])
+
+def _congruent(lts: Lts, classes: list[int], first: int, second: int) -> bool:
+    return classes[first] == classes[second] and all(
+        any(classes[a] == classes[t] for a in _weak(lts, defender, l, proper=True))
+        for attacker, defender in ((first, second), (second, first))
+        for l, t in lts.transitions[attacker]
+    )
+
+def _assert_wins_weak(lts: Lts, bisimulation: WeakBisimulation, first: int, second: int, distinction: Distinction) -> None:
+    """Checks that the weak play is valid and won by the attacker against all answers"""
+    current = (first, second)
+    for i, r in enumerate(distinction.rounds):
+        attacker, defender = current[r.side], current[1 - r.side]
+        if r.weak:
+            assert r.attacker in _weak(lts, attacker, r.label)
+            answers = _weak(lts, defender, r.label)
+        else:
+            assert i == 0
+            assert (r.label, r.attacker) in lts.transitions[attacker]
+            answers = _weak(lts, defender, r.label, proper=True)
+        if r.defender is None:
+            assert not answers
+            assert i == len(distinction.rounds) - 1
+            return
+        assert r.defender in answers
+        assert not any(bisimulation.equivalent(r.attacker, t) for t in answers)
+        current = (r.attacker, r.defender) if r.side == 0 else (r.defender, r.attacker)
+    assert False, "The last round is answered"
+
+def _assert_wins(lts: Lts, bisimulation: Bisimulation, first: int, second: int, distinction: Distinction) -> None:
+    """Checks that the play is valid and won by the attacker against all answers"""
+    current = (first, second)
+    for i, r in enumerate(distinction.rounds):
+        attacker, defender = current[r.side], current[1 - r.side]
+        assert (r.label, r.attacker) in lts.transitions[attacker]
+        answers = [t for l, t in lts.transitions[defender] if l == r.label]
+        if r.defender is None:
+            assert not answers
+            assert i == len(distinction.rounds) - 1
+            return
+        assert r.defender in answers
+        assert not any(bisimulation.equivalent(r.attacker, t) for t in answers)
+        current = (r.attacker, r.defender) if r.side == 0 else (r.defender, r.attacker)
+    assert False, "The last round is answered"
+
+class Test_Bisimulation():
+    def test_branching(self):
+        # a.(b.0 + c.0) and a.b.0 + a.c.0
+        lts = Lts(list(range(6)), [[("a", 1)], [("b", 2), ("c", 2)], [], [("a", 4), ("a", 5)], [("b", 2)], [("c", 2)]])
+        bisimulation = Bisimulation(lts)
+        assert not bisimulation.equivalent(0, 3)
+        assert bisimulation.block_count == 6
+        distinction = bisimulation.distinguish(0, 3)
+        assert distinction is not None
+        assert distinction.trace[0] == "a"
+        _assert_wins(lts, bisimulation, 0, 3, distinction)
+
+    def test_cycles(self):
+        # Cycles of lengths 2 and 3 over the same label are bisimilar, but not to a terminating state
+        lts = Lts(list(range(6)), [[("a", 1)], [("a", 0)], [("a", 3)], [("a", 4)], [("a", 2)], []])
+        bisimulation = Bisimulation(lts)
+        assert bisimulation.block_count == 2
+        assert bisimulation.equivalent(0, 4)
+        assert bisimulation.distinguish(0, 4) is None
+        distinction = bisimulation.distinguish(5, 1)
+        assert distinction is not None
+        assert distinction.describe("P", "Q") == "Q --a-->, P cannot answer"
+
+    def test_random(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            lts = _random_lts(rng)
+            bisimulation = Bisimulation(lts)
+            classes = _naive(lts)
+            assert bisimulation.block_count == len(set(classes))
+            for p in range(lts.state_count):
+                for q in range(lts.state_count):
+                    assert bisimulation.equivalent(p, q) == (classes[p] == classes[q])
+                    if classes[p] != classes[q]:
+                        distinction = bisimulation.distinguish(p, q)
+                        assert distinction is not None
+                        _assert_wins(lts, bisimulation, p, q, distinction)
+
+    def test_union(self):
+        lts = union(Lts([0, 1], [[("a", 1)], []]), Lts([2], [[("a", 0)]]))
+        assert lts.terms == [0, 1, 2]
+        assert lts.transitions == [[("a", 1)], [], [("a", 2)]]
+
+class Test_Tau_Closure():
+    def test_components(self):
+        # A cycle 0 -> 1 -> 0 reaching the chain 2 -> 3
+        closure = TauClosure(Lts(list(range(5)), [[(TAU, 1)], [(TAU, 0), (TAU, 2)], [(TAU, 3), ("a", 4)], [], []]))
+        components = closure.components
+        assert components[0] == components[1]
+        assert closure.component_count == 4
+        assert closure.successors(components[0]) == (components[2],)
+        assert {closure.representatives[c] for c in closure.closure(components[1])} >= {2, 3}
+        assert closure.closure(components[4]) == (components[4],)
+
+    def test_memoized(self):
+        closure = TauClosure(Lts(list(range(4)), [[(TAU, 2)], [(TAU, 2)], [(TAU, 3)], []]))
+        first = closure.closure(closure.components[0])
+        assert closure.closure(closure.components[0]) is first
+        assert set(first) == {closure.components[0]} | set(closure.closure(closure.components[2]))
+
+    def test_deep_chain(self):
+        n = 5000
+        closure = TauClosure(Lts(list(range(n)), [[(TAU, s + 1)] for s in range(n - 1)] + [[]]))
+        assert len(closure.closure(closure.components[0])) == n
+
+class Test_Weak_Bisimulation():
+    def test_random(self):
+        rng = random.Random(1)
+        for _ in range(300):
+            lts = _random_lts(rng, ("a", "b", TAU, TAU))
+            bisimulation = WeakBisimulation(lts)
+            classes = _naive(_saturate(lts))
+            assert bisimulation.block_count == len(set(classes))
+            for p in range(lts.state_count):
+                for q in range(lts.state_count):
+                    assert bisimulation.equivalent(p, q) == (classes[p] == classes[q])
+                    congruent = _congruent(lts, classes, p, q)
+                    assert bisimulation.congruent(p, q) == congruent
+                    for congruence, equivalent in ((False, classes[p] == classes[q]), (True, congruent)):
+                        distinction = bisimulation.distinguish(p, q, congruence)
+                        assert (distinction is None) == equivalent
+                        if distinction is not None:
+                            _assert_wins_weak(lts, bisimulation, p, q, distinction)
+
+    def test_inert_internal_transitions(self):
+        # A chain of internal transitions before a visible one, and a divergent cycle
+        lts = Lts(list(range(6)), [[(TAU, 1)], [(TAU, 2)], [("a", 3)], [(TAU, 3)], [("a", 5)], []])
+        bisimulation = WeakBisimulation(lts)
+        assert bisimulation.equivalent(0, 4)
+        assert bisimulation.equivalent(3, 5)
+        assert not bisimulation.congruent(0, 4)
+        assert bisimulation.congruent(0, 1)
+
+class Test_Compare():
+    def test_congruent_processes(self):
+        explorer = CcsExplorer(fg.parse("A = D | b.0; D = a.D; B = b.D + a.B;"))
+        assert compare(explorer, "A", "B") is None
+
+    def test_buffer(self):
+        explorer = CcsExplorer(fg.parse((_RES / "basic_buffer.ccs").read_text()))
+        assert compare(explorer, "Spec", "Spec") is None
+        distinction = compare(explorer, "Buff3", "Spec")
+        assert distinction is not None
+        assert distinction.trace[-1] == "tau"
+
+    def test_register(self):
+        explorer = CcsExplorer(fg.parse(_REGISTER.read_text()))
+        distinction = compare(explorer, "Impl", "Spec")
+        assert distinction is not None
+        assert distinction.describe("Impl", "Spec") == "Impl --tau-->, Spec cannot answer"
+        assert compare(explorer, "Impl", "TwoBitRegisterImpl") is None
+        # The specification synchronizes on the mutex visibly
+        distinction = compare(explorer, "Impl", "Spec", equivalence="weak")
+        assert distinction is not None
+        assert distinction.weak
+
+    def test_weak(self):
+        explorer = CcsExplorer(fg.parse((_RES / "basic_buffer.ccs").read_text()))
+        assert compare(explorer, "Buff3", "Spec", equivalence="weak") is None
+        assert compare(explorer, "Buff3", "Spec", equivalence="congruence") is None
+        explorer = CcsExplorer(fg.parse((_RES / "dekker.ccs").read_text()))
+        assert compare(explorer, "Dekker-2", "Spec", equivalence="weak") is None
+
+    def test_congruence(self):
+        explorer = CcsExplorer(fg.parse("A = tau.a.0; B = a.0; C = tau.B;"))
+        assert compare(explorer, "A", "B", equivalence="weak") is None
+        distinction = compare(explorer, "A", "B", equivalence="congruence")
+        assert distinction is not None
+        assert distinction.describe("A", "B") == "A --tau-->, B cannot answer"
+        assert compare(explorer, "A", "C", equivalence="congruence") is None
+
+    def test_unknown_equivalence(self):
+        explorer = CcsExplorer(fg.parse("A = a.0;"))
+        with pytest.raises(ValueError, match="Unknown equivalence 'trace'"):
+            compare(explorer, "A", "A", equivalence="trace") # pyright: ignore[reportArgumentType]
@@ -0,0 +1,76 @@
+"""CCS AST Cache Tests"""
+
+import io
+import os
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+
+from ccs2bigraph.ccs.cache import AstCache
+from ccs2bigraph.ccs.representation import *
+
+_CCS = CcsRepresentation(
+    [ProcessAssignment("A", PrefixedProcess(Action("a"), ProcessByName("A")))],
+    [ActionSetAssignment("H", ActionSet([Action("a")]))]
+)
+
+def _put_and_get(directory: pathlib.Path) -> bool:
+    cache = AstCache(directory)
+    key = cache.key(b"A = a.A;", "fast")
+    cache.put(key, _CCS)
+    return cache.get(key) == _CCS
+
+class Test_Ast_Cache():
+    def test_roundtrip(self, tmp_path: pathlib.Path):
+        cache = AstCache(tmp_path)
+        key = cache.key(b"A = a.A;", "fast")
+        cache.put(key, _CCS)
+        assert cache.get(key) == _CCS
+
+    def test_miss(self, tmp_path: pathlib.Path):
+        cache = AstCache(tmp_path)
+        assert cache.get(cache.key(b"A = a.A;", "fast")) is None
+
+    def test_key(self):
+        key = AstCache.key(b"A = a.A;", "fast")
+        assert key == AstCache.key(io.BytesIO(b"A = a.A;"), "fast")
+        assert key != AstCache.key(b"A = a.A;", "pyparsing")
+        assert key != AstCache.key(b"A = b.A;", "fast")
+
+    def test_corrupt_entry(self, tmp_path: pathlib.Path):
+        cache = AstCache(tmp_path)
+        key = cache.key(b"A = a.A;", "fast")
+        cache.put(key, _CCS)
+        for path in tmp_path.iterdir():
+            path.write_bytes(b"garbage")
+
+        assert cache.get(key) is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_lru_eviction(self, tmp_path: pathlib.Path):
+        cache = AstCache(tmp_path, max_entries=2)
+        keys = [cache.key(f"A = a{i}.A;".encode(), "fast") for i in range(3)]
+
+        cache.put(keys[0], _CCS)
+        cache.put(keys[1], _CCS)
+        # Make the first entry the most recently used one
+        for i, key in enumerate(keys[:2]):
+            os.utime(tmp_path / f"{key}.ccs.z", (i, i))
+        assert cache.get(keys[0]) == _CCS
+
+        cache.put(keys[2], _CCS)
+
+        assert cache.get(keys[0]) == _CCS
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[2]) == _CCS
+
+    def test_clear(self, tmp_path: pathlib.Path):
+        cache = AstCache(tmp_path)
+        key = cache.key(b"A = a.A;", "fast")
+        cache.put(key, _CCS)
+        cache.clear()
+        assert cache.get(key) is None
+
+    def test_concurrent_access(self, tmp_path: pathlib.Path):
+        with ProcessPoolExecutor(4) as executor:
+            assert all(executor.map(_put_and_get, [tmp_path] * 16))
+        assert [p.name for p in tmp_path.iterdir() if p.name.startswith(".tmp-")] == []
@@ -0,0 +1,82 @@
+"""CCS Out-of-Core Exploration Tests"""
+
+import json
+import pathlib
+import typing as tp
+
+import pytest
+
+import ccs2bigraph.ccs.fast_grammar as fg
+from ccs2bigraph.ccs.disk import DiskExplorer
+from ccs2bigraph.ccs.lts import CcsExplorer, CompactLts
+from ccs2bigraph.ccs.representation import CcsRepresentation
+
+_RES = pathlib.Path(__file__).parent.parent / "res"
+
+def _buffer(cells: int) -> str:
+    """A buffer of one-place cells, with 2^cells states"""
+    renamings = ["[l1/b]"] + [f"[l{c}/a, l{c + 1}/b]" for c in range(1, cells - 1)] + [f"[l{cells - 1}/a]"]
+    hidden = ", ".join(f"l{c}" for c in range(1, cells))
+    return f"Cell = a.'b.Cell; Buff = ({' | '.join('Cell' + r for r in renamings)}) \\ {{{hidden}}};"
+
+def _csr(lts: CompactLts) -> tuple[list[str], list[int], list[int], list[int]]:
+    return lts.labels, list(lts.starts), list(lts.label_ids), list(lts.targets)
+
+def _transitions(keys: tp.Callable[[int], str], lts: CompactLts) -> set[tuple[str, str, str]]:
+    return {(keys(source), l, keys(target)) for source in range(lts.state_count) for l, target in lts.outgoing(source)}
+
+def _expected(ccs: CcsRepresentation, init: str) -> set[tuple[str, str, str]]:
+    explorer = CcsExplorer(ccs)
+    lts = explorer.explore_compact(init)
+    return _transitions(lambda state: explorer.encode(lts.terms[state]), lts)
+
+class Test_Disk_Explorer():
+    def test_same_transition_system(self, tmp_path: pathlib.Path):
+        ccs = fg.parse(_buffer(10))
+        # Keep only a few states in memory, such that most are found on disk
+        explorer = DiskExplorer(ccs, tmp_path, memory_states=4)
+        lts = explorer.explore("Buff")
+        assert lts is not None
+        assert (lts.state_count, lts.terms) == (1024, None)
+        assert _transitions(explorer.key, lts) == _expected(ccs, "Buff")
+        other = CcsExplorer(ccs)
+        assert other.decode(explorer.key(0)) == other.initial("Buff")
+
+    def test_pause_and_resume(self, tmp_path: pathlib.Path):
+        ccs = fg.parse((_RES / "dekker.ccs").read_text())
+        expected = DiskExplorer(ccs, tmp_path / "uninterrupted").explore("Dekker-2")
+        assert expected is not None
+        pauses = 0
+        while (lts := DiskExplorer(ccs, tmp_path / "paused", checkpoint_interval=7).explore("Dekker-2", pause_after=10)) is None:
+            pauses += 1
+            checkpoint = json.loads((tmp_path / "paused" / "checkpoint.json").read_text())
+            assert checkpoint["expanded"] == 10 * pauses
+        assert pauses == 11
+        assert _csr(lts) == _csr(expected)
+        # A completed exploration is not repeated
+        explorer = DiskExplorer(ccs, tmp_path / "paused")
+        lts = explorer.explore("Dekker-2", pause_after=0)
+        assert lts is not None and _csr(lts) == _csr(expected)
+        assert _transitions(explorer.key, lts) == _expected(ccs, "Dekker-2")
+
+    def test_resume_discards_unchecked_work(self, tmp_path: pathlib.Path):
+        ccs = fg.parse((_RES / "dekker.ccs").read_text())
+        expected = DiskExplorer(ccs, tmp_path / "uninterrupted").explore("Dekker-2")
+        assert expected is not None
+        assert DiskExplorer(ccs, tmp_path / "crashed").explore("Dekker-2", pause_after=50) is None
+        checkpoint = (tmp_path / "crashed" / "checkpoint.json").read_text()
+        assert DiskExplorer(ccs, tmp_path / "crashed").explore("Dekker-2", pause_after=30) is None
+        # Rewind to the first checkpoint, as if the second run had crashed
+        (tmp_path / "crashed" / "checkpoint.json").write_text(checkpoint)
+        lts = DiskExplorer(ccs, tmp_path / "crashed").explore("Dekker-2")
+        assert lts is not None and _csr(lts) == _csr(expected)
+
+    def test_other_process(self, tmp_path: pathlib.Path):
+        ccs = fg.parse((_RES / "basic_buffer.ccs").read_text())
+        assert DiskExplorer(ccs, tmp_path).explore("Buff3", pause_after=1) is None
+        with pytest.raises(ValueError, match="contains the exploration of another process"):
+            DiskExplorer(ccs, tmp_path).explore("Spec")
+
+    def test_max_states(self, tmp_path: pathlib.Path):
+        with pytest.raises(ValueError, match="exceeds 4 states"):
+            DiskExplorer(fg.parse((_RES / "basic_buffer.ccs").read_text()), tmp_path).explore("Buff3", max_states=4)
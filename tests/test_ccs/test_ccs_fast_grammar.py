@@ -0,0 +1,108 @@
+"""Fast CCS Parser Tests"""
+
+import pathlib
+
+import pytest
+
+import ccs2bigraph.ccs.grammar as g
+import ccs2bigraph.ccs.fast_grammar as fg
+from ccs2bigraph.ccs.representation import *
+
+_TESTS_DIR = pathlib.Path(__file__).parent.parent
+_CORPUS = sorted((_TESTS_DIR / "res").glob("*.ccs")) + sorted((_TESTS_DIR.parent / "res").glob("*.ccs"))
+
+_SNIPPETS = [
+    "A = 0;",
+    "A = a.0;",
+    "A = 'a.0;",
+    "A = a.0 + b.0;",
+    "A = 'a.0 + 'b.0 + c.A;",
+    "A = a.0 | b.0 | 'c.0;",
+    "A = (a.0 | b.0) | c.0;",
+    "A = ((a.0));",
+    "A = a.(b.0 + c.0);",
+    "A = a.B \\ H;",
+    "A = (a.0) \\ {a, b};",
+    "A = B[a/b][c/d];",
+    "A = B['a/b, c/'d];",
+    "A = a.b.0[x/y];",
+    "A = (B)[a/b] \\ {a} + C;",
+    "A! = 0; A# = 0; A' = 0; A- = 0; A? = 0; A^ = 0; A_ = 0;",
+    "set A! = {a}; set H = {a, b, c, d};",
+    "Testcase = (((x.y.z.Test) + 'a.'b.0 | a.b.A)[a/b, b/a, x/x]) \\ {a, b, c};",
+    "Testcase = ((a.'b.One)[x/y] + ('a.(b.Two[x/y])) \\ L) | (((x.y.z.Test) + 'a.'b.0 | a.b.A)[a/b, b/a, x/x]) \\ {a, b, c};",
+    "* comment\nA = a.0 * trailing comment\n + b.0;",
+]
+
+class Test_Differential():
+    @pytest.mark.parametrize("path", _CORPUS, ids=lambda p: p.name)
+    def test_corpus(self, path: pathlib.Path):
+        inp = path.read_text()
+        exp = g.parse(inp, engine="pyparsing")
+        act = g.parse(inp, engine="fast")
+        assert exp == act
+        assert list(exp.alphabet) == list(act.alphabet)
+
+    @pytest.mark.parametrize("inp", _SNIPPETS)
+    def test_snippets(self, inp: str):
+        exp = g.parse(inp, engine="pyparsing")
+        act = g.parse(inp, engine="fast")
+        assert exp == act
+        assert list(exp.alphabet) == list(act.alphabet)
+
+class Test_Fast_Grammar():
+    def test_tokenize(self):
+        inp = "Spec' = 'b.Spec + a0.Spec''; * comment"
+        exp = ["Spec'", "=", "'", "b", ".", "Spec", "+", "a0", ".", "Spec''", ";", ""]
+        act = [t[1] for t in fg.tokenize(inp)]
+        assert exp == act
+
+    def test_nested_hiding(self):
+        inp = "A = B \\ H \\ {a};"
+        exp = CcsRepresentation(
+            [
+                ProcessAssignment(
+                    "A",
+                    HidingProcess(
+                        HidingProcess(ProcessByName("B"), ActionSetByName("H")),
+                        ActionSet([Action("a")])
+                    )
+                )
+            ],
+            []
+        )
+        assert fg.parse(inp) == exp
+
+    def test_long_prefix_chain(self):
+        depth = 5000
+        inp = "A = " + ".".join(f"a{i}" for i in range(depth)) + ".0;"
+        act = fg.parse(inp).process_assignments[0].process
+
+        for i in range(depth):
+            assert isinstance(act, PrefixedProcess)
+            assert act.prefix == Action(f"a{i}")
+            act = act.remaining
+        assert act == NilProcess()
+
+    def test_long_sum(self):
+        width = 5000
+        inp = "A = " + " + ".join(f"a{i}.0" for i in range(width)) + ";"
+        act = fg.parse(inp).process_assignments[0].process
+        assert isinstance(act, SumProcesses)
+        assert len(act.sums) == width
+
+    def test_invalid_character(self):
+        with pytest.raises(ValueError, match="line 2, column 5"):
+            fg.parse("A = 0;\nB = $;")
+
+    def test_missing_finalizer(self):
+        with pytest.raises(ValueError, match="Expected ';'"):
+            fg.parse("A = a.0")
+
+    def test_invalid_action_name(self):
+        with pytest.raises(ValueError):
+            fg.parse("A = Invalid.0;")
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError):
+            g.parse("A = 0;", engine="unknown") # type: ignore
@@ -1,5 +1,6 @@
 """CCS Grammar Tests"""
 
+import io
 import pyparsing as pp
 import pathlib
 
@@ -1145,4 +1146,48 @@ class Test_Ccs_Input_Grammar():
         )
 
         act = g.parse(inp)
-        assert exp == act
\ No newline at end of file
+        assert exp == act
+
+class Test_Parse_Iter():
+    class _ChunkedStream():
+        """Text stream which records how many chunks were read"""
+        def __init__(self, raw: str, chunk_size: int):
+            self._chunks = [raw[i:i + chunk_size] for i in range(0, len(raw), chunk_size)]
+            self.reads = 0
+
+        def read(self, size: int = -1) -> str:
+            self.reads += 1
+            return self._chunks.pop(0) if self._chunks else ""
+
+    @pytest.mark.parametrize("engine", g.ENGINES)
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+    def test_register(self, engine: g.Engine, chunk_size: int):
+        path = pathlib.Path(__file__).parent.parent.parent / "res" / "register.ccs"
+        exp = g.parse(path.read_text())
+
+        with open(path) as f:
+            act = list(g.parse_iter(f, engine=engine, chunk_size=chunk_size))
+
+        assert exp.process_assignments == [s for s in act if isinstance(s, ProcessAssignment)]
+        assert exp.action_set_assignments == [s for s in act if isinstance(s, ActionSetAssignment)]
+
+    def test_comment_with_finalizer(self):
+        inp = "* A = a.0;\nA = b.0 * c.0;\n + c.0;"
+        exp = [ProcessAssignment("A", SumProcesses([PrefixedProcess(Action("b"), NilProcess()), PrefixedProcess(Action("c"), NilProcess())]))]
+        act = list(g.parse_iter(io.StringIO(inp), chunk_size=3))
+        assert exp == act
+
+    def test_yields_before_end_of_stream(self):
+        stream = self._ChunkedStream("A = 0;" + " " * 100 + "B = 0;", 10)
+        statements = g.parse_iter(stream, chunk_size=10) # type: ignore
+
+        assert next(statements) == ProcessAssignment("A", NilProcess())
+        assert stream.reads == 1
+
+    def test_unterminated_statement(self):
+        with pytest.raises(ValueError):
+            list(g.parse_iter(io.StringIO("A = 0; B = 0")))
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError):
+            list(g.parse_iter(io.StringIO("A = 0;"), engine="unknown")) # type: ignore
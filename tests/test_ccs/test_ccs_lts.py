@@ -0,0 +1,275 @@
+"""CCS Transition System Tests"""
+
+import io
+import pathlib
+
+import pytest
+
+import ccs2bigraph.ccs.fast_grammar as fg
+from ccs2bigraph.ccs.lts import CcsExplorer, CompactLts, Lts, TAU
+
+_RES = pathlib.Path(__file__).parent.parent / "res"
+
+def _explore(source: str, init: str, max_states: int | None = None) -> tuple[CcsExplorer, Lts]:
+    explorer = CcsExplorer(fg.parse(source))
+    return explorer, explorer.explore(init, max_states)
+
+def _transitions(explorer: CcsExplorer, lts: Lts) -> set[tuple[str, str, str]]:
+    return {
+        (explorer.describe(lts.terms[source]), l, explorer.describe(lts.terms[target]))
+        for source, outgoing in enumerate(lts.transitions)
+        for l, target in outgoing
+    }
+
+class Test_Sos():
+    def test_prefix_and_sum(self):
+        explorer, lts = _explore("A = a.b.0 + 'c.0;", "A")
+        assert _transitions(explorer, lts) == {
+            ("(a.b.0 + 'c.0)", "a", "b.0"),
+            ("(a.b.0 + 'c.0)", "'c", "0"),
+            ("b.0", "b", "0"),
+        }
+
+    def test_parallel_synchronization(self):
+        explorer, lts = _explore("A = a.0 | 'a.0;", "A")
+        assert _transitions(explorer, lts) == {
+            ("(a.0 | 'a.0)", "a", "'a.0"),
+            ("(a.0 | 'a.0)", "'a", "a.0"),
+            ("(a.0 | 'a.0)", TAU, "0"),
+            ("'a.0", "'a", "0"),
+            ("a.0", "a", "0"),
+        }
+
+    def test_equal_components_synchronize(self):
+        _, lts = _explore("A = (a.0 + 'a.0) | (a.0 + 'a.0);", "A")
+        assert ("tau", 2) in lts.transitions[0]
+        assert lts.state_count == 3
+
+    def test_hiding(self):
+        explorer, lts = _explore("set H = {a}; A = (a.b.0 | 'a.0) \\ H;", "A")
+        assert _transitions(explorer, lts) == {
+            ("((a.b.0 | 'a.0) \\ {a})", TAU, "(b.0 \\ {a})"),
+            ("(b.0 \\ {a})", "b", "0"),
+        }
+
+    def test_renaming(self):
+        explorer, lts = _explore("B = a.'b.B; A = B[c/a];", "A")
+        assert {(l, t) for outgoing in lts.transitions for l, t in outgoing} == {("c", 1), ("'b", 0)}
+        assert explorer.describe(lts.terms[1]) == "'b.B[c/a]"
+
+    def test_calls(self):
+        _, lts = _explore("A = a.B; B = b.A + c.0;", "A")
+        assert lts.state_count == 3
+        assert lts.labels() == {"a", "b", "c"}
+
+    def test_structural_congruence(self):
+        explorer, lts = _explore("A = (a.0 | b.0) + (b.0 | a.0) + 0; B = A | 0; C = b.0 | a.0;", "B")
+        assert explorer.describe(lts.terms[0]) == "(a.0 | b.0)"
+        assert explorer.explore("C").terms[0] == lts.terms[0]
+
+    def test_tau_prefix(self):
+        _, lts = _explore("A = tau.a.0 | 'tau.0;", "A")
+        assert lts.labels() == {TAU, "a"}
+        # The internal actions interleave, but do not synchronize
+        assert (lts.state_count, lts.transition_count) == (6, 7)
+
+    def test_process_term(self):
+        explorer = CcsExplorer(fg.parse("A = a.A;"))
+        lts = explorer.explore(fg.parse("B = a.A | a.A;").get_process("B").process)
+        assert lts.state_count == 1
+        assert lts.transitions == [[("a", 0)]]
+
+class Test_Explore():
+    def test_buffer(self):
+        explorer = CcsExplorer(fg.parse((_RES / "basic_buffer.ccs").read_text()))
+        buffer = explorer.explore("Buff3")
+        spec = explorer.explore("Spec")
+        assert (buffer.state_count, buffer.transition_count) == (8, 12)
+        assert (spec.state_count, spec.transition_count) == (4, 6)
+        assert buffer.labels() == {"a", "'b", TAU}
+
+    def test_dekker(self):
+        explorer = CcsExplorer(fg.parse((_RES / "dekker.ccs").read_text()))
+        lts = explorer.explore("Dekker-2")
+        assert (lts.state_count, lts.transition_count) == (114, 228)
+        assert lts.labels() == {"enter", "exit", TAU}
+
+    def test_unguarded_recursion(self):
+        with pytest.raises(ValueError, match="Process A is not guarded"):
+            _explore("A = A | a.0;", "A")
+
+    def test_guarded_recursion_in_sum(self):
+        explorer, lts = _explore("A = a.(A + b.0);", "A")
+        assert _transitions(explorer, lts) == {
+            ("a.(A + b.0)", "a", "(b.0 + a.(A + b.0))"),
+            ("(b.0 + a.(A + b.0))", "a", "(b.0 + a.(A + b.0))"),
+            ("(b.0 + a.(A + b.0))", "b", "0"),
+        }
+
+    def test_guarded_recursion_in_hiding(self):
+        explorer, lts = _explore("A = a.((A) \\ {b});", "A")
+        assert _transitions(explorer, lts) == {
+            ("a.(A \\ {b})", "a", "(a.(A \\ {b}) \\ {b})"),
+            ("(a.(A \\ {b}) \\ {b})", "a", "(a.(A \\ {b}) \\ {b})"),
+        }
+
+    def test_guarded_recursion_in_parallel(self):
+        explorer = CcsExplorer(fg.parse("A = a.(A | b.0);"))
+        initial = explorer.initial("A")
+        assert [(l, explorer.describe(t)) for l, t in explorer.transitions(initial)] == [("a", "(b.0 | a.(A | b.0))")]
+        with pytest.raises(ValueError, match="exceeds 5 states"):
+            explorer.explore("A", max_states=5)
+
+    def test_undefined_process(self):
+        with pytest.raises(ValueError, match="Process B is undefined"):
+            _explore("A = a.B;", "A")
+
+    def test_max_states(self):
+        source = "A = a.b.A;"
+        assert _explore(source, "A", 2)[1].state_count == 2
+        with pytest.raises(ValueError, match="exceeds 1 states"):
+            _explore(source, "A", 1)
+
+    def test_write_aut(self):
+        _, lts = _explore("A = a.B; B = 'b.A;", "A")
+        out = io.StringIO()
+        lts.write_aut(out)
+        assert out.getvalue() == 'des (0, 2, 2)\n(0, "a", 1)\n(1, "\'b", 0)\n'
+
+class Test_Keys():
+    def test_round_trip(self):
+        source = (_RES / "dekker.ccs").read_text() + "S = a.'b.S + c.0; R = (S | S | c.0)[x/a, y/c] \\ {y};"
+        explorer = CcsExplorer(fg.parse(source))
+        other = CcsExplorer(fg.parse(source))
+        # Compile the processes in a different order, such that the ids of equal terms differ
+        other.explore("R")
+        for init in ("Dekker-2", "R"):
+            lts = explorer.explore(init)
+            for term in lts.terms:
+                key = explorer.encode(term)
+                decoded = other.decode(key)
+                assert other.encode(decoded) == key
+                assert sorted((l, other.encode(t)) for l, t in other.transitions(decoded)) == sorted((l, explorer.encode(t)) for l, t in explorer.transitions(term))
+                assert explorer.decode(key) == term
+
+    def test_canonical_order(self):
+        explorer = CcsExplorer(fg.parse("A = a.0 | b.0; B = b.0 | a.0;"))
+        assert explorer.encode(explorer.initial("A")) == explorer.encode(explorer.initial("B")) == "|4:.a:04:.b:0"
+
+class Test_Compact():
+    def test_explore(self):
+        explorer = CcsExplorer(fg.parse((_RES / "dekker.ccs").read_text()))
+        lts = explorer.explore("Dekker-2")
+        compact = explorer.explore_compact("Dekker-2")
+        assert (compact.state_count, compact.transition_count) == (114, 228)
+        assert compact.expand() == lts
+        assert list(compact.terms or ()) == lts.terms
+        assert sorted(compact.labels) == sorted(lts.labels())
+        assert lts.compact().expand() == lts
+
+    def test_save_and_load(self, tmp_path: pathlib.Path):
+        explorer = CcsExplorer(fg.parse((_RES / "basic_buffer.ccs").read_text()))
+        compact = explorer.explore_compact("Buff3")
+        with open(tmp_path / "buff3.lts", "wb") as fp:
+            compact.save(fp)
+        loaded = CompactLts.load(tmp_path / "buff3.lts")
+        assert loaded.terms is None
+        assert (loaded.labels, list(loaded.starts), list(loaded.label_ids), list(loaded.targets)) == (compact.labels, list(compact.starts), list(compact.label_ids), list(compact.targets))
+        expected, actual = io.StringIO(), io.StringIO()
+        compact.write_aut(expected)
+        loaded.write_aut(actual)
+        assert actual.getvalue() == expected.getvalue()
+
+    def test_empty(self, tmp_path: pathlib.Path):
+        with open(tmp_path / "nil.lts", "wb") as fp:
+            CcsExplorer(fg.parse("A = 0;")).explore_compact("A").save(fp)
+        loaded = CompactLts.load(tmp_path / "nil.lts")
+        assert (loaded.state_count, loaded.transition_count, loaded.labels) == (1, 0, [])
+
+    def test_invalid_file(self, tmp_path: pathlib.Path):
+        (tmp_path / "a.aut").write_text('des (0, 0, 1)\n' * 4)
+        with pytest.raises(ValueError, match="not a transition system file"):
+            CompactLts.load(tmp_path / "a.aut")
+
+def _keyed(explorer: CcsExplorer, lts: CompactLts) -> tuple[set[tuple[str, str, str]], set[str]]:
+    """The transitions and the deadlocks of a transition system, by keys of the terms"""
+    keys = [explorer.encode(t) for t in lts.terms or ()]
+    transitions = {(keys[s], l, keys[t]) for s in range(lts.state_count) for l, t in lts.outgoing(s)}
+    return transitions, {keys[s] for s in range(lts.state_count) if not lts.outgoing(s)}
+
+class Test_Partial_Order():
+    def test_independent_components(self):
+        explorer = CcsExplorer(fg.parse("A = a.b.0 | c.d.0 | e.f.0;"))
+        full = explorer.explore_compact("A")
+        reduced = explorer.explore_compact("A", partial_order=True)
+        assert (full.state_count, reduced.state_count) == (27, 7)
+        assert sorted(reduced.labels) == sorted(full.labels)
+
+    def test_synchronizing_components(self):
+        explorer = CcsExplorer(fg.parse("C = a.'b.C; S = (C | C[b/a, c/b] | d.'d.0 | 'c.0) \\ {b};"))
+        full = explorer.explore_compact("S")
+        reduced = explorer.explore_compact("S", partial_order=True)
+        assert (full.state_count, reduced.state_count) == (24, 7)
+        full_transitions, full_deadlocks = _keyed(explorer, full)
+        reduced_transitions, reduced_deadlocks = _keyed(explorer, reduced)
+        assert reduced_transitions <= full_transitions
+        assert reduced_deadlocks == full_deadlocks
+        assert sorted(reduced.labels) == sorted(full.labels)
+
+    def test_cycles_do_not_ignore_components(self):
+        # Only moving the first component would cycle without ever moving the second one
+        explorer = CcsExplorer(fg.parse("C = a.b.C; S = C | C[x/a, y/b];"))
+        reduced = explorer.explore_compact("S", partial_order=True)
+        assert sorted(reduced.labels) == ["a", "b", "x", "y"]
+
+    def test_dekker(self):
+        explorer = CcsExplorer(fg.parse((_RES / "dekker.ccs").read_text()))
+        full = explorer.explore_compact("Dekker-2")
+        reduced = explorer.explore_compact("Dekker-2", partial_order=True)
+        assert reduced.state_count < full.state_count
+        full_transitions, full_deadlocks = _keyed(explorer, full)
+        reduced_transitions, reduced_deadlocks = _keyed(explorer, reduced)
+        assert reduced_transitions <= full_transitions
+        assert reduced_deadlocks == full_deadlocks
+        assert sorted(reduced.labels) == sorted(full.labels)
+        assert explorer.explore("Dekker-2", partial_order=True) == reduced.expand()
+
+class Test_Symmetry():
+    def test_clients(self):
+        clients = " | ".join(f"Client{c}" for c in range(4))
+        source = "Server = request.'response.Server;" + "".join(
+            f"Client{c} = p{c}.q{c}.'request.response.Client{c};" for c in range(4)
+        ) + f"System = (Server | {clients}) \\ {{request, response}};"
+        explorer = CcsExplorer(fg.parse(source))
+        full = explorer.explore_compact("System")
+        reduced = explorer.explore_compact("System", symmetry=True)
+        # The representatives are the multisets of the local states of the clients
+        assert (full.state_count, reduced.state_count) == (189, 25)
+        assert {explorer.encode(t) for t in reduced.terms or ()} <= {explorer.encode(t) for t in full.terms or ()}
+
+    def test_renamed_components(self):
+        explorer = CcsExplorer(fg.parse("C = a.'b.0 + c.0; S = (C[a0/a, c0/c] | C[a1/a, c1/c] | C[a2/a, c2/c] | b.b.0) \\ {b};"))
+        full = explorer.explore_compact("S")
+        reduced = explorer.explore_compact("S", symmetry=True)
+        assert (full.state_count, reduced.state_count) == (53, 19)
+        assert sorted(reduced.labels) == sorted(full.labels)
+        deadlocks = [s for s in range(reduced.state_count) if not reduced.outgoing(s)]
+        assert len(deadlocks) == 4
+
+    def test_single_renamed_component(self):
+        # After one client terminates, the state is the renamed parallel composition of the other one
+        explorer = CcsExplorer(fg.parse("C = s.(s.0 | 'a.0) + t.(a.0 | 'a.0); S = C[a0/a] | C[a1/a];"))
+        full = explorer.explore_compact("S")
+        reduced = explorer.explore_compact("S", symmetry=True)
+        # The representatives are the multisets of two of the 7 local states of a client
+        assert (full.state_count, reduced.state_count) == (49, 28)
+        assert sum(explorer.describe(t).startswith("('a.0 | a.0)[") for t in reduced.terms or ()) == 1
+
+    def test_asymmetric_system(self):
+        # The components are equal up to renaming, but only the first one may synchronize with the last one
+        explorer = CcsExplorer(fg.parse("C = a.b.C; S = C[a0/a] | C[a1/a] | 'a0.0;"))
+        assert explorer.explore_compact("S", symmetry=True).state_count == explorer.explore_compact("S").state_count
+
+    def test_combined_reductions(self):
+        with pytest.raises(ValueError, match="cannot be combined"):
+            CcsExplorer(fg.parse("A = a.0;")).explore_compact("A", partial_order=True, symmetry=True)
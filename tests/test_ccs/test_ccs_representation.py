@@ -1,5 +1,9 @@
 """CCS Representation Tests"""
 
+import pickle
+
+import pytest
+
 from ccs2bigraph.ccs.representation import *
 
 class Test_Actions():
@@ -212,4 +216,129 @@ class Test_CcsRepresentation_Get_Actions():
         )
         exp = set([Action("new")])
         act = inp.get_all_actions()
-        assert exp == act
\ No newline at end of file
+        assert exp == act
+
+class Test_Compact_Nodes():
+    def test_interned_actions(self):
+        assert Action("a") is Action("a")
+        assert DualAction("a") is DualAction("a")
+        assert Action("a") is not DualAction("a")
+        assert Action("a") != DualAction("a")
+
+    def test_interned_names(self):
+        name = "".join(["Long", "Name"]) # Not interned by the compiler
+        assert ProcessByName(name).name is ProcessByName("LongName").name
+        assert ActionSetByName(name).name is ActionSetByName("LongName").name
+
+    def test_pickle_preserves_interning(self):
+        inp = PrefixedProcess(DualAction("a"), NilProcess())
+        act = pickle.loads(pickle.dumps(inp))
+        assert act == inp
+        assert act.prefix is DualAction("a")
+
+    def test_slots(self):
+        for node in [Action("a"), NilProcess(), ProcessByName("A"), PrefixedProcess(Action("a"), NilProcess()), SumProcesses([])]:
+            assert not hasattr(node, "__dict__")
+
+class Test_ActionIndex():
+    def _ccs(self) -> CcsRepresentation:
+        return CcsRepresentation(
+            [
+                ProcessAssignment("A", PrefixedProcess(DualAction("a"), HidingProcess(ProcessByName("B"), ActionSet([Action("h")])))),
+                ProcessAssignment("B", RenamingProcess(PrefixedProcess(Action("b"), NilProcess()), [Renaming(Action("a"), Action("b"))])),
+            ],
+            [
+                ActionSetAssignment("H", ActionSet([Action("h"), Action("c")])),
+            ]
+        )
+
+    def test_built_from_assignments(self):
+        inp = self._ccs()
+        assert list(inp.alphabet) == [Action("h"), Action("c"), Action("a"), Action("b")]
+        assert len(inp.alphabet) == 4
+
+    def test_membership(self):
+        inp = self._ccs()
+        assert Action("a") in inp.alphabet
+        assert Action("x") not in inp.alphabet
+        assert DualAction("a") not in inp.alphabet # Only non-dual actions are indexed
+
+    def test_uses(self):
+        inp = self._ccs()
+        assert inp.alphabet.processes_using(Action("a")) == {"A", "B"}
+        assert inp.alphabet.processes_using(Action("h")) == {"A"}
+        assert inp.alphabet.action_sets_using(Action("h")) == {"H"}
+        assert inp.alphabet.action_sets_using(Action("a")) == set()
+        assert inp.alphabet.processes_using(Action("x")) == set()
+
+    def test_add(self):
+        inp = self._ccs()
+        inp.add(ProcessAssignment("C", PrefixedProcess(Action("x"), NilProcess())))
+        assert Action("x") in inp.alphabet
+        assert inp.alphabet.processes_using(Action("x")) == {"C"}
+        assert len(inp.process_assignments) == 3
+
+    def test_remove(self):
+        inp = self._ccs()
+        inp.remove(inp.process_assignments[1])
+        assert Action("b") not in inp.alphabet
+        assert inp.alphabet.processes_using(Action("a")) == {"A"}
+
+        inp.remove(inp.action_set_assignments[0])
+        assert Action("c") not in inp.alphabet
+        assert inp.alphabet.processes_using(Action("h")) == {"A"}
+        assert inp.get_all_actions() == {Action("a"), Action("h")}
+
+    def test_remove_duplicate_name(self):
+        inp = self._ccs()
+        duplicate = ProcessAssignment("A", PrefixedProcess(Action("a"), NilProcess()))
+        inp.add(duplicate)
+        inp.remove(duplicate)
+        assert inp.alphabet.processes_using(Action("a")) == {"A", "B"}
+
+    def test_remove_unknown(self):
+        inp = self._ccs()
+        with pytest.raises(ValueError):
+            inp.remove(ProcessAssignment("X", NilProcess()))
+        with pytest.raises(ValueError):
+            inp.alphabet.remove_process("X", [Action("a")])
+
+class Test_Symbol_Tables():
+    def test_lookup(self):
+        a = ProcessAssignment("A", NilProcess())
+        h = ActionSetAssignment("H", ActionSet([Action("a")]))
+        inp = CcsRepresentation([a], [h])
+        assert inp.get_process("A") is a
+        assert inp.get_action_set("H") is h
+        assert inp.processes == {"A": a}
+        assert inp.action_sets == {"H": h}
+
+    def test_undefined(self):
+        inp = CcsRepresentation([], [])
+        with pytest.raises(ValueError, match="Process A is undefined"):
+            inp.get_process("A")
+        with pytest.raises(ValueError, match="ActionSet H is undefined"):
+            inp.get_action_set("H")
+
+    def test_first_definition_wins(self):
+        first = ProcessAssignment("A", NilProcess())
+        second = ProcessAssignment("A", ProcessByName("A"))
+        inp = CcsRepresentation([first, second], [])
+        assert inp.get_process("A") is first
+        assert inp.duplicate_names() == ["A"]
+
+        inp.remove(first)
+        assert inp.get_process("A") is second
+        assert inp.duplicate_names() == []
+
+    def test_add_remove(self):
+        inp = CcsRepresentation([], [])
+        h = ActionSetAssignment("H", ActionSet([Action("a")]))
+        inp.add(h)
+        assert inp.get_action_set("H") is h
+        inp.remove(h)
+        assert "H" not in inp.action_sets
+
+    def test_same_name_for_process_and_action_set(self):
+        inp = CcsRepresentation([ProcessAssignment("A", NilProcess())], [ActionSetAssignment("A", ActionSet([]))])
+        assert inp.duplicate_names() == []
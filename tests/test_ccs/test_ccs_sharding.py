@@ -0,0 +1,52 @@
+"""CCS Sharded Exploration Tests"""
+
+import pathlib
+
+import pytest
+
+import ccs2bigraph.ccs.fast_grammar as fg
+from ccs2bigraph.ccs.bisimulation import Bisimulation, union
+from ccs2bigraph.ccs.lts import CcsExplorer
+from ccs2bigraph.ccs.sharding import ShardedExplorer
+
+_RES = pathlib.Path(__file__).parent.parent / "res"
+_REGISTER = pathlib.Path(__file__).parent.parent.parent / "res" / "register.ccs"
+
+class Test_Sharded_Explorer():
+    def test_same_state_space(self):
+        ccs = fg.parse((_RES / "dekker.ccs").read_text())
+        explorer = CcsExplorer(ccs)
+        expected = explorer.explore("Dekker-2")
+        for workers in (1, 3):
+            sharded = ShardedExplorer(ccs, workers)
+            exploration = sharded.explore("Dekker-2")
+            assert (exploration.state_count, exploration.transition_count) == (expected.state_count, expected.transition_count)
+            assert [w.states for w in exploration.workers] and sum(w.states for w in exploration.workers) == expected.state_count
+            assert sum(w.transitions for w in exploration.workers) == expected.transition_count
+
+            lts = exploration.lts
+            assert lts is not None
+            assert sorted(map(sharded.explorer.encode, lts.terms)) == sorted(map(explorer.encode, expected.terms))
+            # Both transition systems are isomorphic, hence their initial states are bisimilar
+            bisimulation = Bisimulation(union(expected, lts))
+            assert bisimulation.equivalent(expected.initial, expected.state_count + lts.initial)
+            assert bisimulation.block_count == Bisimulation(expected).block_count
+
+    def test_deterministic(self):
+        ccs = fg.parse(_REGISTER.read_text())
+        first = ShardedExplorer(ccs, 2).explore("Impl")
+        second = ShardedExplorer(ccs, 2).explore("Impl")
+        assert first.lts is not None and second.lts is not None
+        assert first.lts.transitions == second.lts.transitions
+        assert first.rounds == second.rounds
+        uncollected = ShardedExplorer(ccs, 2).explore("Impl", collect=False)
+        assert uncollected.lts is None
+        assert uncollected.state_count == first.state_count == 52
+
+    def test_errors(self):
+        with pytest.raises(ValueError, match="Process A is not guarded"):
+            ShardedExplorer(fg.parse("A = A | a.0;"), 2).explore("A")
+        with pytest.raises(ValueError, match="exceeds 4 states"):
+            ShardedExplorer(fg.parse((_RES / "basic_buffer.ccs").read_text()), 2).explore("Buff3", max_states=4)
+        with pytest.raises(ValueError, match="At least one worker"):
+            ShardedExplorer(fg.parse("A = a.A;"), 0)
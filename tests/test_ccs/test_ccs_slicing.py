@@ -0,0 +1,49 @@
+"""CCS Slicing Tests"""
+
+import pathlib
+
+import pytest
+
+import ccs2bigraph.ccs.fast_grammar as fg
+from ccs2bigraph.ccs.representation import *
+from ccs2bigraph.ccs.slicing import CcsSlicer
+
+_BUFFER = pathlib.Path(__file__).parent.parent / "res" / "basic_buffer.ccs"
+
+class Test_Call_Graph():
+    def test_call_graph(self):
+        inp = fg.parse(_BUFFER.read_text())
+        act = CcsSlicer.call_graph(inp)
+        assert act["Buff3"] == ["C0", "C1", "C2"]
+        assert act["Cell"] == ["Cell"]
+        assert act["Spec'"] == ["Spec", "Spec''"]
+
+    def test_duplicate_definitions_combined(self):
+        inp = CcsRepresentation(
+            [ProcessAssignment("A", ProcessByName("B")), ProcessAssignment("A", ProcessByName("C"))],
+            []
+        )
+        assert CcsSlicer.call_graph(inp) == {"A": ["B", "C"]}
+
+class Test_Slicing():
+    def test_reachable(self):
+        inp = fg.parse(_BUFFER.read_text())
+        assert CcsSlicer.reachable(inp, "Buff3") == {"Buff3", "C0", "C1", "C2", "Cell"}
+        assert CcsSlicer.reachable(inp, "Spec''") == {"Spec", "Spec'", "Spec''"}
+        assert CcsSlicer.reachable(inp, "Cell") == {"Cell"}
+
+    def test_slice_keeps_order_and_action_sets(self):
+        inp = fg.parse("set H = {a}; A = a.0; B = 'a.A \\ H; C = B;")
+        act = CcsSlicer.slice(inp, "B")
+        assert [pa.name for pa in act.process_assignments] == ["A", "B"]
+        assert act.action_set_assignments == inp.action_set_assignments
+        assert act.process_assignments[0] is inp.process_assignments[0]
+
+    def test_undefined_references_ignored(self):
+        inp = CcsRepresentation([ProcessAssignment("A", ProcessByName("X"))], [])
+        assert CcsSlicer.reachable(inp, "A") == {"A"}
+
+    def test_undefined_init_process(self):
+        inp = fg.parse(_BUFFER.read_text())
+        with pytest.raises(ValueError, match="Process X is undefined"):
+            CcsSlicer.slice(inp, "X")
@@ -249,3 +249,35 @@ class Test_Complex_Bigraph_Validation():
         inp = CcsAugmentor.augment(inp)
 
         assert FinitePureCcsValidatior.validate(helper_wrap_process(inp)) == True
+
+class Test_Name_Validation():
+    def test_defined_names(self):
+        inp = CcsRepresentation(
+            [
+                ProcessAssignment("A", HidingProcess(ProcessByName("B"), ActionSetByName("H"))),
+                ProcessAssignment("B", ProcessByName("A")),
+            ],
+            [ActionSetAssignment("H", ActionSet([Action("a")]))]
+        )
+        assert FinitePureCcsValidatior.validate_names(inp) == True
+
+    def test_undefined_names_reported_once(self):
+        inp = CcsRepresentation(
+            [
+                ProcessAssignment("A", ParallelProcesses([ProcessByName("X"), ProcessByName("X"), HidingProcess(NilProcess(), ActionSetByName("H"))])),
+                ProcessAssignment("B", ProcessByName("X")),
+            ],
+            []
+        )
+        with pytest.raises(ValueError) as e:
+            FinitePureCcsValidatior.validate_names(inp)
+        assert str(e.value) == "Process X is undefined; ActionSet H is undefined"
+
+    def test_duplicate_names(self):
+        inp = CcsRepresentation(
+            [ProcessAssignment("A", NilProcess()), ProcessAssignment("A", NilProcess()), ProcessAssignment("A", NilProcess())],
+            [ActionSetAssignment("H", ActionSet([])), ActionSetAssignment("H", ActionSet([]))]
+        )
+        with pytest.raises(ValueError) as e:
+            FinitePureCcsValidatior.validate_names(inp)
+        assert str(e.value) == "A is defined multiple times; H is defined multiple times"
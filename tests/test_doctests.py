@@ -8,12 +8,32 @@ This file's purpose is to include all doctests in unittest
 import doctest
 
 import ccs2bigraph.ccs.representation
+import ccs2bigraph.ccs.fast_grammar
+import ccs2bigraph.ccs.slicing
+import ccs2bigraph.ccs.disk
+import ccs2bigraph.ccs.lts
+import ccs2bigraph.ccs.bisimulation
+import ccs2bigraph.ccs.sharding
 import ccs2bigraph.bigraph.representation
 import ccs2bigraph.bigraph.validation
+import ccs2bigraph.bigraph.extraction
+import ccs2bigraph.traversal
+import ccs2bigraph.interning
+import ccs2bigraph.tracing
 
 def load_tests(loader, tests, ignore):
     # Fügt alle Doctests aus mod.foo als Unittest-Testsuite hinzu
     tests.addTests(doctest.DocTestSuite(ccs2bigraph.bigraph.representation))
     tests.addTests(doctest.DocTestSuite(ccs2bigraph.bigraph.validation))
+    tests.addTests(doctest.DocTestSuite(ccs2bigraph.bigraph.extraction))
     tests.addTests(doctest.DocTestSuite(ccs2bigraph.ccs.representation))
+    tests.addTests(doctest.DocTestSuite(ccs2bigraph.ccs.fast_grammar))
+    tests.addTests(doctest.DocTestSuite(ccs2bigraph.ccs.slicing))
+    tests.addTests(doctest.DocTestSuite(ccs2bigraph.ccs.disk))
+    tests.addTests(doctest.DocTestSuite(ccs2bigraph.ccs.lts))
+    tests.addTests(doctest.DocTestSuite(ccs2bigraph.ccs.bisimulation))
+    tests.addTests(doctest.DocTestSuite(ccs2bigraph.ccs.sharding))
+    tests.addTests(doctest.DocTestSuite(ccs2bigraph.traversal))
+    tests.addTests(doctest.DocTestSuite(ccs2bigraph.interning))
+    tests.addTests(doctest.DocTestSuite(ccs2bigraph.tracing))
     return tests
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""
+Command Line Interface Tests
+"""
+
+import io
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+from ccs2bigraph.ccs.lts import CompactLts
+
+_RES = pathlib.Path(__file__).parent / "res"
+# Make the package importable from the temporary working directories, even if it is not installed
+_ENV = os.environ | {"PYTHONPATH": str(pathlib.Path(__file__).parent.parent)}
+
+def _imported_modules(args: list[str], cwd: pathlib.Path) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True, text=True, cwd=cwd, env=_ENV
+    )
+    return {
+        line.split("|")[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+class Test_Startup():
+    def test_grammar_import_is_lazy(self, tmp_path: pathlib.Path):
+        modules = _imported_modules(["-c", "import ccs2bigraph.ccs.grammar, ccs2bigraph.ccs.finite_pure_grammar"], tmp_path)
+        assert "ccs2bigraph.ccs.grammar" in modules
+        assert "pyparsing" not in modules
+
+    def test_help_defers_imports(self, tmp_path: pathlib.Path):
+        modules = _imported_modules(["-m", "ccs2bigraph", "--help"], tmp_path)
+        assert "ccs2bigraph.config" in modules
+        assert "pyparsing" not in modules
+        assert "ccs2bigraph.translation" not in modules
+        assert "importlib.resources" not in modules
+
+    def test_fast_engine_skips_pyparsing(self, tmp_path: pathlib.Path):
+        modules = _imported_modules(["-m", "ccs2bigraph", str(_RES / "basic_buffer.ccs"), "Buff3", "a", "b", "c", "d", "--engine", "fast"], tmp_path)
+        assert "ccs2bigraph.translation" in modules
+        assert "pyparsing" not in modules
+
+class Test_Cli():
+    def test_engines_and_cache(self, tmp_path: pathlib.Path):
+        def _run(*options: str) -> str:
+            result = subprocess.run(
+                [sys.executable, "-m", "ccs2bigraph", str(_RES / "basic_buffer.ccs"), "Buff3", "a", "b", "c", "d", *options],
+                capture_output=True, text=True, cwd=tmp_path, env=_ENV, check=True
+            )
+            return result.stdout
+
+        exp = _run()
+        assert "big buff3_proc_def" in exp
+        assert exp == _run("--engine", "fast")
+        assert exp == _run("--cache-dir", str(tmp_path / "cache"))
+        assert exp == _run("--cache-dir", str(tmp_path / "cache"))
+
+    def test_slice(self, tmp_path: pathlib.Path):
+        def _run(*options: str) -> str:
+            result = subprocess.run(
+                [sys.executable, "-m", "ccs2bigraph", str(_RES / "basic_buffer.ccs"), "Spec", "a", "b", "c", "d", *options],
+                capture_output=True, text=True, cwd=tmp_path, env=_ENV, check=True
+            )
+            return result.stdout
+
+        full = _run()
+        sliced = _run("--slice")
+        assert "big cell_proc_def" in full
+        assert "big cell_proc_def" not in sliced
+        assert "big spec_proc_def" in sliced
+        assert len(sliced) < len(full)
+
+    def test_output(self, tmp_path: pathlib.Path):
+        args = [sys.executable, "-m", "ccs2bigraph", str(_RES / "basic_buffer.ccs"), "Buff3", "a", "b", "c", "d"]
+        exp = subprocess.run(args, capture_output=True, text=True, cwd=tmp_path, env=_ENV, check=True).stdout
+        result = subprocess.run([*args, "--output", "out.big"], capture_output=True, text=True, cwd=tmp_path, env=_ENV, check=True)
+        assert result.stdout == ""
+        assert exp == (tmp_path / "out.big").read_text()
+
+    def test_trace(self, tmp_path: pathlib.Path):
+        subprocess.run(
+            [sys.executable, "-m", "ccs2bigraph", str(_RES / "basic_buffer.ccs"), "Buff3", "a", "b", "c", "d", "--trace", "trace.jsonl"],
+            capture_output=True, text=True, cwd=tmp_path, env=_ENV, check=True
+        )
+        spans = [json.loads(line) for line in (tmp_path / "trace.jsonl").read_text().splitlines()]
+        assert [s["span"] for s in spans] == ["parse", "augment", "validate", "generate", "translate", "serialize"]
+        assert all(s["duration_ms"] >= 0 for s in spans)
+        assert {s["parent"] for s in spans if s["span"] in ["augment", "validate", "generate"]} == {"translate"}
+        # Nothing is logged below the default level
+        assert not (tmp_path / "ccs2bigraph.log").exists()
+
+    def test_invalid_engine(self, tmp_path: pathlib.Path):
+        result = subprocess.run(
+            [sys.executable, "-m", "ccs2bigraph", "in.ccs", "A", "a", "b", "c", "d", "--engine", "invalid"],
+            capture_output=True, text=True, cwd=tmp_path, env=_ENV
+        )
+        assert result.returncode == 2
+
+    def test_invalid_workers(self, tmp_path: pathlib.Path):
+        for workers in ["0", "-1"]:
+            result = subprocess.run(
+                [sys.executable, "-m", "ccs2bigraph", str(_RES / "basic_buffer.ccs"), "Buff3", "a", "b", "c", "d", "--workers", workers],
+                capture_output=True, text=True, cwd=tmp_path, env=_ENV
+            )
+            assert result.returncode == 2
+            assert "--workers: must be at least 1" in result.stderr
+
+    def test_lts(self, tmp_path: pathlib.Path):
+        args = [sys.executable, "-m", "ccs2bigraph", "lts", str(_RES / "basic_buffer.ccs"), "Buff3", "--engine", "fast"]
+        result = subprocess.run([*args, "--output", "buff3.aut"], capture_output=True, text=True, cwd=tmp_path, env=_ENV, check=True)
+        assert result.stdout == "8 states, 12 transitions\n"
+        aut = (tmp_path / "buff3.aut").read_text().splitlines()
+        assert aut[0] == "des (0, 12, 8)"
+        assert len(aut) == 13
+
+        result = subprocess.run([*args, "--max-states", "4"], capture_output=True, text=True, cwd=tmp_path, env=_ENV)
+        assert result.returncode == 1
+        assert "exceeds 4 states" in result.stderr
+
+        result = subprocess.run([*args, "--workers", "2", "--output", "sharded.aut"], capture_output=True, text=True, cwd=tmp_path, env=_ENV, check=True)
+        lines = result.stdout.splitlines()
+        assert lines[0] == "8 states, 12 transitions"
+        assert len(lines) == 3 and lines[1].startswith("worker 0: ") and lines[2].endswith(" states/s")
+        assert (tmp_path / "sharded.aut").read_text().splitlines()[0].endswith(", 12, 8)")
+
+        subprocess.run([*args, "--output", "buff3.lts", "--format", "csr"], capture_output=True, text=True, cwd=tmp_path, env=_ENV, check=True)
+        out = io.StringIO()
+        CompactLts.load(tmp_path / "buff3.lts").write_aut(out)
+        assert out.getvalue().splitlines() == aut
+
+        result = subprocess.run([*args, "--work-dir", "work", "--output", "disk.aut"], capture_output=True, text=True, cwd=tmp_path, env=_ENV, check=True)
+        assert result.stdout == "8 states, 12 transitions\n"
+        assert (tmp_path / "work" / "checkpoint.json").exists()
+        assert (tmp_path / "disk.aut").read_text().splitlines()[0] == "des (0, 12, 8)"
+
+        result = subprocess.run([*args, "--work-dir", "work", "--workers", "2"], capture_output=True, text=True, cwd=tmp_path, env=_ENV)
+        assert result.returncode == 2
+        assert "not allowed with --workers" in result.stderr
+
+        result = subprocess.run([sys.executable, "-m", "ccs2bigraph", "lts", str(_RES / "dekker.ccs"), "Dekker-2", "--engine", "fast", "--partial-order"], capture_output=True, text=True, cwd=tmp_path, env=_ENV, check=True)
+        assert result.stdout == "94 states, 172 transitions\n"
+
+        (tmp_path / "clients.ccs").write_text("C = a.b.C; S = C[a0/a] | C[a1/a] | C[a2/a];")
+        args = [sys.executable, "-m", "ccs2bigraph", "lts", "clients.ccs", "S", "--engine", "fast"]
+        result = subprocess.run([*args, "--symmetry"], capture_output=True, text=True, cwd=tmp_path, env=_ENV, check=True)
+        assert result.stdout == "4 states, 12 transitions\n"
+        result = subprocess.run([*args, "--symmetry", "--partial-order"], capture_output=True, text=True, cwd=tmp_path, env=_ENV)
+        assert result.returncode == 2
+
+    def test_equiv(self, tmp_path: pathlib.Path):
+        def _run(first: str, second: str, *options: str) -> subprocess.CompletedProcess[str]:
+            return subprocess.run(
+                [sys.executable, "-m", "ccs2bigraph", "equiv", str(_RES / "basic_buffer.ccs"), first, second, "--engine", "fast", *options],
+                capture_output=True, text=True, cwd=tmp_path, env=_ENV
+            )
+
+        result = _run("Spec", "Spec")
+        assert result.returncode == 0
+        assert result.stdout == "Spec and Spec are strongly bisimilar\n"
+
+        result = _run("Buff3", "Spec")
+        assert result.returncode == 1
+        assert result.stdout.splitlines()[0] == "Buff3 and Spec are not strongly bisimilar:"
+        assert result.stdout.splitlines()[-1].endswith("Spec cannot answer")
+
+        result = _run("Buff3", "Spec", "--equivalence", "weak")
+        assert result.returncode == 0
+        assert result.stdout == "Buff3 and Spec are weakly bisimilar\n"
+
+        result = _run("Buff3", "Undefined")
+        assert result.returncode == 2
+        assert "Process Undefined is undefined" in result.stderr
@@ -0,0 +1,57 @@
+"""Tracing Tests"""
+
+import gc
+import io
+import json
+
+import pytest
+
+from ccs2bigraph import tracing
+
+class Test_Span():
+    def _spans(self, trace: io.StringIO) -> list[dict]:
+        return [json.loads(line) for line in trace.getvalue().splitlines()]
+
+    def test_disabled(self):
+        assert not tracing.enabled()
+        with tracing.span("stage", size=1) as attributes:
+            attributes["items"] = 2
+        assert attributes == {"size": 1, "items": 2}
+
+    def test_nested(self):
+        trace = io.StringIO()
+        # Garbage collected during the spans would offset the allocations
+        gc.collect()
+        tracing.enable(trace)
+        try:
+            with tracing.span("outer"):
+                with tracing.span("first"):
+                    pass
+                with tracing.span("second", size=3):
+                    data = [[i] for i in range(1000)]
+        finally:
+            tracing.disable()
+
+        act = self._spans(trace)
+        assert [(s["span"], s["parent"]) for s in act] == [("first", "outer"), ("second", "outer"), ("outer", None)]
+        assert act[1]["size"] == 3
+        assert act[1]["allocated_blocks"] >= len(data)
+        assert act[2]["duration_ms"] >= act[0]["duration_ms"] + act[1]["duration_ms"]
+        assert act[0]["start"] <= act[1]["start"]
+
+    def test_error(self):
+        trace = io.StringIO()
+        tracing.enable(trace)
+        try:
+            with pytest.raises(ValueError):
+                with tracing.span("failing"):
+                    raise ValueError()
+            with tracing.span("next"):
+                pass
+        finally:
+            tracing.disable()
+
+        act = self._spans(trace)
+        assert act[0]["error"] == "ValueError"
+        assert act[1]["parent"] is None
+        assert "error" not in act[1]
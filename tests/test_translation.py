@@ -7,6 +7,10 @@ import pytest
 from ccs2bigraph.ccs.representation import *
 from ccs2bigraph.bigraph.representation import *
 from ccs2bigraph.translation import FiniteCcsTranslator
+from ccs2bigraph.bigraph.validation import BigraphValidator
+from ccs2bigraph.ccs.fast_grammar import parse
+from ccs2bigraph.traversal import walk
+from ccs2bigraph import config, translation
 
 from textwrap import dedent
 
@@ -205,4 +209,117 @@ class Test_Translation():
         )
 
         with pytest.raises(ValueError):
-            FiniteCcsTranslator(inp, "")._generate_bigraph_content() # pyright: ignore[reportPrivateUsage]
\ No newline at end of file
+            FiniteCcsTranslator(inp, "")._generate_bigraph_content() # pyright: ignore[reportPrivateUsage]
+
+    def test_fail_duplicate_action_set(self):
+        inp = CcsRepresentation(
+            [
+                ProcessAssignment("Test1", HidingProcess(NilProcess(), ActionSetByName("H"))),
+            ],
+            [
+                ActionSetAssignment("H", ActionSet([Action("a")])),
+                ActionSetAssignment("H", ActionSet([Action("b")])),
+            ]
+        )
+
+        with pytest.raises(ValueError, match="H is defined multiple times"):
+            FiniteCcsTranslator(inp, "Test1")._generate_bigraph_content() # pyright: ignore[reportPrivateUsage]
+
+    def test_fail_undefined_action_set(self):
+        inp = CcsRepresentation(
+            [
+                ProcessAssignment("Test1", HidingProcess(NilProcess(), ActionSetByName("H"))),
+            ],
+            []
+        )
+
+        with pytest.raises(ValueError, match="ActionSet H is undefined"):
+            FiniteCcsTranslator(inp, "Test1")._generate_bigraph_content() # pyright: ignore[reportPrivateUsage]
+
+    def test_deep_prefix_chain(self):
+        depth = 10_000
+        p: Process = ProcessByName("Test")
+        for i in range(depth):
+            p = PrefixedProcess(Action(f"a{i % 10}"), p)
+        inp = CcsRepresentation([ProcessAssignment("Test", p)], [])
+
+        translator = FiniteCcsTranslator(inp, "Test")
+        act = translator.translate()
+
+        assert len(translator._ccs_actions) == 10 # pyright: ignore[reportPrivateUsage]
+        assert BigraphValidator(act).validate()
+
+class Test_Idle_Nil():
+    def test_shared_definition(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(config, "add_actions", True)
+        inp = parse("A = a.0 + 'b.(0 | B); B = c.0;")
+        act = FiniteCcsTranslator(inp, "A").translate()
+
+        names = [b.name for b in act.bigraphs]
+        assert names == [FiniteCcsTranslator.IDLE_NIL_NAME, "a_proc_def", "b_proc_def", "start"]
+        assert str(act.bigraphs[0]) == "big nil_actions = ({a} | {b} | {c} | Nil);"
+        assert str(act.bigraphs[1]).count("nil_actions") == 2
+        assert "nil_actions" not in str(act.bigraphs[-1])
+        assert BigraphValidator(act).validate()
+
+    def test_extracted_subterms(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(config, "add_actions", True)
+        monkeypatch.setattr(config, "extract_min_size", 2)
+        inp = parse("A = a.0 + b.0; B = a.0 + b.0;")
+        act = FiniteCcsTranslator(inp, "A").translate()
+
+        # Every assignment, in particular every shared one, only refers to previously defined ones
+        defined: set[str] = set()
+        for assignment in act.bigraphs:
+            for subterm in walk(assignment.bigraph):
+                if isinstance(subterm, BigraphByName):
+                    assert subterm.name in defined, f"{subterm.name} is used before its definition in {assignment}"
+            defined.add(assignment.name)
+        assert any(b.name.startswith("shared_") and "nil_actions" in str(b) for b in act.bigraphs)
+        assert BigraphValidator(act).validate()
+
+    def test_without_actions(self):
+        inp = parse("A = a.0;")
+        act = FiniteCcsTranslator(inp, "A").translate()
+        assert all(b.name != FiniteCcsTranslator.IDLE_NIL_NAME for b in act.bigraphs)
+        assert "nil_actions" not in str(act)
+
+class Test_Parallel_Translation():
+    def _ccs(self) -> CcsRepresentation:
+        return parse("".join(f"P{i} = a{i % 3}.'b.P{(i + 1) % 40} + c.(P{(i + 2) % 40} | 'c.0);" for i in range(40)))
+
+    def test_same_output(self):
+        exp = str(FiniteCcsTranslator(self._ccs(), "P0").translate())
+        for workers in [2, 3]:
+            act = str(FiniteCcsTranslator(self._ccs(), "P0").translate(workers=workers))
+            assert exp == act
+
+    def test_same_output_with_actions(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(config, "add_actions", True)
+        inp = "set H = {a}; A = a.0 + 'b.B; B = (c.0 | A) \\ H;"
+        exp = str(FiniteCcsTranslator(parse(inp), "A").translate())
+        act = str(FiniteCcsTranslator(parse(inp), "A").translate(workers=2))
+        assert exp == act
+
+    def test_fail_invalid_process(self):
+        inp = parse("A = a.0; B = (a.0 | b.0) + c.0;")
+        with pytest.raises(ValueError):
+            FiniteCcsTranslator(inp, "A").translate(workers=2)
+
+    def test_fail_undefined_name(self):
+        inp = parse("A = a.X;")
+        with pytest.raises(ValueError, match="Process X is undefined"):
+            FiniteCcsTranslator(inp, "A").translate(workers=2)
+
+    def test_names_validated_before_dispatch(self, monkeypatch: pytest.MonkeyPatch):
+        def _no_pool(*args: object, **kwargs: object):
+            raise AssertionError("Worker processes started")
+        monkeypatch.setattr(translation, "ProcessPoolExecutor", _no_pool)
+        inp = parse("A = a.X;")
+        with pytest.raises(ValueError, match="Process X is undefined"):
+            FiniteCcsTranslator(inp, "A").translate(workers=2)
+
+    def test_fail_no_workers(self):
+        with pytest.raises(ValueError):
+            FiniteCcsTranslator(parse("A = a.0;"), "A").translate(workers=0)
+
@@ -0,0 +1,56 @@
+"""
+Iterative Traversal Tests
+"""
+
+from ccs2bigraph.traversal import walk, transform
+from ccs2bigraph.ccs.representation import *
+from ccs2bigraph.bigraph import representation as big
+
+_DEPTH = 100_000
+
+def _deep_prefix_chain(depth: int) -> Process:
+    p: Process = NilProcess()
+    for i in range(depth):
+        p = PrefixedProcess(Action(f"a{i % 10}"), p)
+    return p
+
+class Test_Walk():
+    def test_preorder(self):
+        inp = ParallelProcesses([
+            SumProcesses([PrefixedProcess(Action("a"), NilProcess())]),
+            HidingProcess(ProcessByName("B"), ActionSetByName("H")),
+        ])
+        exp = ["ParallelProcesses", "SumProcesses", "PrefixedProcess", "NilProcess", "HidingProcess", "ProcessByName"]
+        act = [type(p).__name__ for p in walk(inp)]
+        assert exp == act
+
+    def test_bigraph_preorder(self):
+        inp = big.NestingBigraph(
+            big.ControlBigraph(big.ControlByName("A"), []),
+            big.MergedBigraphs([big.IdBigraph(), big.ClosedBigraph(big.Link("x"), big.OneBigraph())])
+        )
+        exp = ["NestingBigraph", "ControlBigraph", "MergedBigraphs", "IdBigraph", "ClosedBigraph", "OneBigraph"]
+        act = [type(b).__name__ for b in walk(inp)]
+        assert exp == act
+
+    def test_deep(self):
+        assert sum(1 for _ in walk(_deep_prefix_chain(_DEPTH))) == _DEPTH + 1
+
+class Test_Transform():
+    def test_postorder(self):
+        inp = SumProcesses([
+            PrefixedProcess(Action("a"), NilProcess()),
+            ParallelProcesses([ProcessByName("B"), NilProcess()]),
+        ])
+        visited: list[str] = []
+
+        def _rebuild(p: Process, children: list[int]) -> int:
+            visited.append(type(p).__name__)
+            return 1 + sum(children)
+
+        assert transform(inp, _rebuild) == 6
+        assert visited == ["NilProcess", "PrefixedProcess", "ProcessByName", "NilProcess", "ParallelProcesses", "SumProcesses"]
+
+    def test_deep(self):
+        act = transform(_deep_prefix_chain(_DEPTH), lambda p, depths: 1 + max(depths, default=0))
+        assert act == _DEPTH + 1